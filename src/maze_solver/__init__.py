@@ -2,51 +2,115 @@
 
 from maze_solver.algorithms import (
     ALGORITHM_REGISTRY,
+    KERNEL_REGISTRY,
     SOLVER_REGISTRY,
+    BatchResult,
+    SolveResult,
     a_star_generator,
+    alt_generator,
+    ara_star_generator,
     bellman_ford_generator,
     bfs_generator,
     bidirectional_bfs_generator,
+    bidirectional_dijkstra_generator,
+    contraction_hierarchy_generator,
+    d_star_lite_generator,
     dead_end_filling_generator,
     dfs_generator,
+    dials_generator,
     dijkstra_generator,
+    fast_sweeping_generator,
     flood_fill_generator,
     greedy_best_first_generator,
     hadlock_generator,
+    hpa_star_generator,
     iddfs_generator,
+    jps_plus_generator,
+    jump_point_search_generator,
     lee_generator,
     left_hand_rule_generator,
+    mm_generator,
     pledge_generator,
+    policy_iteration_generator,
+    q_learning_generator,
     random_mouse_generator,
     right_hand_rule_generator,
+    solve,
+    solve_many,
     spfa_generator,
     tremaux_generator,
     uniform_cost_generator,
+    value_iteration_generator,
+    weighted_a_star_generator,
+    zero_one_bfs_generator,
 )
-from maze_solver.generation import GENERATION_REGISTRY, generate_maze
+from maze_solver.anytime import AnytimeSolution, ARAStarPlanner
+from maze_solver.contraction import ContractionHierarchy, build_contraction_hierarchy
+from maze_solver.generation import GENERATION_REGISTRY, TERRAIN_TYPES, generate_cost_map, generate_maze
+from maze_solver.grid import CostMap
+from maze_solver.hpa import HPAStarPlanner
+from maze_solver.incremental import DStarLitePlanner
+from maze_solver.landmarks import LandmarkTable, build_landmark_table
+from maze_solver.mdp import ValueField, policy_iteration, q_learning, value_iteration
 
 __all__ = [
     "ALGORITHM_REGISTRY",
+    "ARAStarPlanner",
+    "AnytimeSolution",
+    "BatchResult",
+    "ContractionHierarchy",
+    "CostMap",
+    "DStarLitePlanner",
     "GENERATION_REGISTRY",
+    "HPAStarPlanner",
+    "KERNEL_REGISTRY",
+    "LandmarkTable",
     "SOLVER_REGISTRY",
+    "SolveResult",
+    "TERRAIN_TYPES",
+    "ValueField",
     "a_star_generator",
+    "alt_generator",
+    "ara_star_generator",
     "bellman_ford_generator",
     "bidirectional_bfs_generator",
+    "bidirectional_dijkstra_generator",
     "bfs_generator",
+    "build_contraction_hierarchy",
+    "build_landmark_table",
+    "contraction_hierarchy_generator",
+    "d_star_lite_generator",
     "dead_end_filling_generator",
     "dfs_generator",
+    "dials_generator",
     "dijkstra_generator",
+    "fast_sweeping_generator",
     "flood_fill_generator",
+    "generate_cost_map",
     "generate_maze",
     "greedy_best_first_generator",
     "hadlock_generator",
+    "hpa_star_generator",
     "iddfs_generator",
+    "jps_plus_generator",
+    "jump_point_search_generator",
     "lee_generator",
     "left_hand_rule_generator",
+    "mm_generator",
     "pledge_generator",
+    "policy_iteration",
+    "policy_iteration_generator",
+    "q_learning",
+    "q_learning_generator",
     "random_mouse_generator",
     "right_hand_rule_generator",
+    "solve",
+    "solve_many",
     "spfa_generator",
     "tremaux_generator",
     "uniform_cost_generator",
+    "value_iteration",
+    "value_iteration_generator",
+    "weighted_a_star_generator",
+    "zero_one_bfs_generator",
 ]
@@ -1,22 +1,59 @@
 from __future__ import annotations
 
-import heapq
 import random
+import time
 import zlib
 from collections import deque
 from collections.abc import Callable, Generator
-from dataclasses import dataclass
-from itertools import count
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
 from typing import Literal
 
 import numpy as np
 
+from maze_solver.anytime import ara_star_search
+from maze_solver.bidirectional import bidirectional_dijkstra_search, mm_search
 from maze_solver.catalog import algorithm_catalog
-from maze_solver.grid import Cell, adjacent_cells
+from maze_solver.contraction import contraction_hierarchy_search, corridor_graph_search
+from maze_solver.deepening import ida_star_search, iddfs_search
+from maze_solver.frontier import DEFAULT_FRONTIER
+from maze_solver.graph import MazeGraph, maze_graph
+from maze_solver.grid import Cell
+from maze_solver.hpa import hpa_star_search
+from maze_solver.incremental import d_star_lite_search
+from maze_solver.jps import jps_plus_search, jump_point_search
+from maze_solver.landmarks import alt_search
+from maze_solver.mdp import fast_sweeping_search, policy_iteration_search, q_learning_search, value_iteration_search
+from maze_solver.search import (
+    DONE,
+    NO_PARENT,
+    EventLog,
+    SearchResult,
+    SearchWorkspace,
+    a_star_search,
+    bellman_ford_search,
+    bfs_search,
+    bidirectional_bfs_search,
+    cached_shortest_path_tree,
+    cell_costs,
+    dead_end_filling_search,
+    dials_search,
+    dijkstra_search,
+    flood_fill_search,
+    greedy_best_first_search,
+    hadlock_search,
+    lee_search,
+    spfa_search,
+    weighted_a_star_search,
+    zero_one_bfs_search,
+    zero_one_costs,
+)
 
 Action = Literal["visit", "enqueue", "path", "done"]
 SolverEvent = tuple[Action, Cell | None, int]
 WeightFunction = Callable[[Cell, Cell], float]
+SearchKernel = Callable[..., SearchResult]
 
 
 @dataclass(frozen=True)
@@ -292,55 +329,57 @@ def reconstruct_path(parent: dict[Cell, Cell], start: Cell, end: Cell) -> list[C
 
 
 def bfs_path(maze: np.ndarray, start: Cell, end: Cell) -> list[Cell]:
-    queue: deque[Cell] = deque([start])
-    visited = {start}
-    parent: dict[Cell, Cell] = {}
-
-    while queue:
-        current = queue.popleft()
-        if current == end:
-            return reconstruct_path(parent, start, end)
-        for neighbor in adjacent_cells(current, maze):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                parent[neighbor] = current
-                queue.append(neighbor)
-    return []
+    graph = maze_graph(maze)
+    return graph.cells_of(bfs_search(graph, graph.cell_id(start), graph.cell_id(end)).path)
 
 
 def is_solvable(maze: np.ndarray, start: Cell, end: Cell) -> bool:
     return bool(bfs_path(maze, start, end))
 
 
-def bfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    queue: deque[Cell] = deque([start])
-    visited = {start}
-    parent: dict[Cell, Cell] = {}
-    steps = 0
+def _run_kernel(
+    kernel: SearchKernel,
+    graph: MazeGraph,
+    start: Cell,
+    end: Cell,
+    trace: EventLog | None,
+    weight: WeightFunction | None = None,
+    **options,
+) -> SearchResult:
+    if weight is not None:
 
-    while queue:
-        current = queue.popleft()
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
-        for neighbor in adjacent_cells(current, maze):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                parent[neighbor] = current
-                queue.append(neighbor)
-                yield ("enqueue", neighbor, steps)
+        def id_weight(current: int, neighbor: int) -> float:
+            return weight(graph.cell_of(current), graph.cell_of(neighbor))
 
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+        options["weight"] = id_weight
+    return kernel(graph, graph.cell_id(start), graph.cell_id(end), trace=trace, **options)
+
+
+def _kernel_events(
+    kernel: SearchKernel, maze: np.ndarray, start: Cell, end: Cell, **options
+) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
+    log = EventLog(graph.cols)
+    result = _run_kernel(kernel, graph, start, end, log, **options)
+    yield from _finish_log(log, result)
+
+
+def _finish_log(log: EventLog, result: SearchResult) -> EventLog:
+    log.record_path(result.path, result.steps)
+    log.record(DONE, NO_PARENT, result.steps)
+    return log
+
+
+def bfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(bfs_search, maze, start, end)
 
 
 def lee_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    yield from bfs_generator(maze, start, end)
+    yield from _kernel_events(lee_search, maze, start, end)
 
 
 def dfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
     stack = [start]
     visited = {start}
     parent: dict[Cell, Cell] = {}
@@ -352,7 +391,7 @@ def dfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverE
         yield ("visit", current, steps)
         if current == end:
             break
-        for neighbor in reversed(adjacent_cells(current, maze)):
+        for neighbor in reversed(graph.adjacent(current)):
             if neighbor not in visited:
                 visited.add(neighbor)
                 parent[neighbor] = current
@@ -365,31 +404,7 @@ def dfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverE
 
 
 def flood_fill_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    queue: deque[Cell] = deque([end])
-    distance: dict[Cell, int] = {end: 0}
-    steps = 0
-
-    while queue:
-        current = queue.popleft()
-        steps += 1
-        yield ("visit", current, steps)
-        for neighbor in adjacent_cells(current, maze):
-            if neighbor in distance:
-                continue
-            distance[neighbor] = distance[current] + 1
-            queue.append(neighbor)
-            yield ("enqueue", neighbor, steps)
-
-    if start in distance:
-        current = start
-        yield ("path", current, steps)
-        while current != end:
-            current = min(
-                (neighbor for neighbor in adjacent_cells(current, maze) if neighbor in distance),
-                key=lambda neighbor: distance[neighbor],
-            )
-            yield ("path", current, steps)
-    yield ("done", None, steps)
+    yield from _kernel_events(flood_fill_search, maze, start, end)
 
 
 def dijkstra_generator(
@@ -397,39 +412,19 @@ def dijkstra_generator(
     start: Cell,
     end: Cell,
     weight: WeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
+    frontier: str = DEFAULT_FRONTIER,
 ) -> Generator[SolverEvent, None, None]:
-    weight = weight or (lambda _current, _neighbor: 1.0)
-    tie_breaker = count()
-    heap: list[tuple[float, int, Cell]] = [(0.0, next(tie_breaker), start)]
-    distance: dict[Cell, float] = {start: 0.0}
-    parent: dict[Cell, Cell] = {}
-    settled: set[Cell] = set()
-    steps = 0
+    yield from _kernel_events(dijkstra_search, maze, start, end, weight=weight, cost_map=cost_map, frontier=frontier)
 
-    while heap:
-        current_distance, _, current = heapq.heappop(heap)
-        if current in settled:
-            continue
-        settled.add(current)
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
 
-        for neighbor in adjacent_cells(current, maze):
-            edge_weight = weight(current, neighbor)
-            if edge_weight < 0:
-                raise ValueError("Dijkstra requires non-negative edge weights.")
-            candidate = current_distance + edge_weight
-            if candidate < distance.get(neighbor, float("inf")):
-                distance[neighbor] = candidate
-                parent[neighbor] = current
-                heapq.heappush(heap, (candidate, next(tie_breaker), neighbor))
-                yield ("enqueue", neighbor, steps)
-
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+def dials_generator(
+    maze: np.ndarray,
+    start: Cell,
+    end: Cell,
+    cost_map: np.ndarray | None = None,
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(dials_search, maze, start, end, cost_map=cost_map)
 
 
 def spfa_generator(
@@ -437,36 +432,9 @@ def spfa_generator(
     start: Cell,
     end: Cell,
     weight: WeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
 ) -> Generator[SolverEvent, None, None]:
-    weight = weight or (lambda _current, _neighbor: 1.0)
-    queue: deque[Cell] = deque([start])
-    in_queue = {start}
-    distance: dict[Cell, float] = {start: 0.0}
-    parent: dict[Cell, Cell] = {}
-    steps = 0
-
-    while queue:
-        current = queue.popleft()
-        in_queue.discard(current)
-        steps += 1
-        yield ("visit", current, steps)
-        for neighbor in adjacent_cells(current, maze):
-            edge_weight = weight(current, neighbor)
-            if edge_weight < 0:
-                raise ValueError("SPFA requires no reachable negative-weight cycle.")
-            candidate = distance[current] + edge_weight
-            if candidate >= distance.get(neighbor, float("inf")):
-                continue
-            distance[neighbor] = candidate
-            parent[neighbor] = current
-            if neighbor not in in_queue:
-                queue.append(neighbor)
-                in_queue.add(neighbor)
-                yield ("enqueue", neighbor, steps)
-
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+    yield from _kernel_events(spfa_search, maze, start, end, weight=weight, cost_map=cost_map)
 
 
 def uniform_cost_generator(
@@ -474,220 +442,93 @@ def uniform_cost_generator(
     start: Cell,
     end: Cell,
     weight: WeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
+    frontier: str = DEFAULT_FRONTIER,
 ) -> Generator[SolverEvent, None, None]:
-    yield from dijkstra_generator(maze, start, end, weight)
+    yield from dijkstra_generator(maze, start, end, weight, cost_map, frontier)
 
 
-def a_star_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    tie_breaker = count()
-    heap: list[tuple[float, int, Cell]] = [(heuristic(start, end), next(tie_breaker), start)]
-    came_from: dict[Cell, Cell] = {}
-    g_score: dict[Cell, float] = {start: 0.0}
-    closed: set[Cell] = set()
-    steps = 0
+def a_star_generator(
+    maze: np.ndarray, start: Cell, end: Cell, frontier: str = DEFAULT_FRONTIER
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(a_star_search, maze, start, end, frontier=frontier)
 
-    while heap:
-        _, _, current = heapq.heappop(heap)
-        if current in closed:
-            continue
-        closed.add(current)
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
 
-        for neighbor in adjacent_cells(current, maze):
-            tentative_g = g_score[current] + 1
-            if tentative_g < g_score.get(neighbor, float("inf")):
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                heapq.heappush(heap, (tentative_g + heuristic(neighbor, end), next(tie_breaker), neighbor))
-                yield ("enqueue", neighbor, steps)
+def ida_star_generator(
+    maze: np.ndarray, start: Cell, end: Cell, transposition_size: int = 0
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(ida_star_search, maze, start, end, transposition_size=transposition_size)
 
-    for cell in reconstruct_path(came_from, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
 
+def hadlock_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(hadlock_search, maze, start, end)
 
-def ida_star_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    if start == end:
-        yield ("visit", start, 1)
-        yield ("path", start, 1)
-        yield ("done", None, 1)
-        return
 
-    max_depth = int(np.count_nonzero(maze == 0))
-    threshold = heuristic(start, end)
-    steps = 0
+def zero_one_bfs_generator(
+    maze: np.ndarray,
+    start: Cell,
+    end: Cell,
+    cost_map: np.ndarray | None = None,
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(zero_one_bfs_search, maze, start, end, cost_map=cost_map)
 
-    while threshold <= max_depth:
-        next_threshold = float("inf")
-        stack: list[tuple[Cell, list[Cell], int]] = [(start, [start], 0)]
 
-        while stack:
-            current, path, g_score = stack.pop()
-            f_score = g_score + heuristic(current, end)
-            if f_score > threshold:
-                next_threshold = min(next_threshold, f_score)
-                continue
+def jump_point_search_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(jump_point_search, maze, start, end)
 
-            steps += 1
-            yield ("visit", current, steps)
-            if current == end:
-                for cell in path:
-                    yield ("path", cell, steps)
-                yield ("done", None, steps)
-                return
 
-            path_cells = set(path)
-            candidates = [neighbor for neighbor in adjacent_cells(current, maze) if neighbor not in path_cells]
-            candidates.sort(key=lambda neighbor: heuristic(neighbor, end), reverse=True)
-            for neighbor in candidates:
-                yield ("enqueue", neighbor, steps)
-                stack.append((neighbor, [*path, neighbor], g_score + 1))
+def jps_plus_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(jps_plus_search, maze, start, end)
 
-        if next_threshold == float("inf"):
-            break
-        threshold = int(next_threshold)
 
-    yield ("done", None, steps)
+def d_star_lite_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(d_star_lite_search, maze, start, end)
 
 
-def hadlock_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    deque_frontier: deque[Cell] = deque([start])
-    detours: dict[Cell, int] = {start: 0}
-    parent: dict[Cell, Cell] = {}
-    settled: set[Cell] = set()
-    steps = 0
+def contraction_hierarchy_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(contraction_hierarchy_search, maze, start, end)
 
-    while deque_frontier:
-        current = deque_frontier.popleft()
-        if current in settled:
-            continue
-        settled.add(current)
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
 
-        current_h = heuristic(current, end)
-        for neighbor in adjacent_cells(current, maze):
-            penalty = 0 if heuristic(neighbor, end) < current_h else 1
-            candidate = detours[current] + penalty
-            if candidate >= detours.get(neighbor, float("inf")):
-                continue
-            detours[neighbor] = candidate
-            parent[neighbor] = current
-            if penalty == 0:
-                deque_frontier.appendleft(neighbor)
-            else:
-                deque_frontier.append(neighbor)
-            yield ("enqueue", neighbor, steps)
+def alt_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(alt_search, maze, start, end)
 
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+
+def hpa_star_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(hpa_star_search, maze, start, end)
 
 
 def bidirectional_bfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    if start == end:
-        yield ("visit", start, 1)
-        yield ("path", start, 1)
-        yield ("done", None, 1)
-        return
+    yield from _kernel_events(bidirectional_bfs_search, maze, start, end)
 
-    forward: deque[Cell] = deque([start])
-    backward: deque[Cell] = deque([end])
-    forward_seen = {start}
-    backward_seen = {end}
-    forward_parent: dict[Cell, Cell] = {}
-    backward_parent: dict[Cell, Cell] = {}
-    steps = 0
-    meeting: Cell | None = None
 
-    while forward and backward and meeting is None:
-        for _ in range(len(forward)):
-            current = forward.popleft()
-            steps += 1
-            yield ("visit", current, steps)
-            for neighbor in adjacent_cells(current, maze):
-                if neighbor in forward_seen:
-                    continue
-                forward_seen.add(neighbor)
-                forward_parent[neighbor] = current
-                forward.append(neighbor)
-                yield ("enqueue", neighbor, steps)
-                if neighbor in backward_seen:
-                    meeting = neighbor
-                    break
-            if meeting is not None:
-                break
-        if meeting is not None:
-            break
-
-        for _ in range(len(backward)):
-            current = backward.popleft()
-            steps += 1
-            yield ("visit", current, steps)
-            for neighbor in adjacent_cells(current, maze):
-                if neighbor in backward_seen:
-                    continue
-                backward_seen.add(neighbor)
-                backward_parent[neighbor] = current
-                backward.append(neighbor)
-                yield ("enqueue", neighbor, steps)
-                if neighbor in forward_seen:
-                    meeting = neighbor
-                    break
-            if meeting is not None:
-                break
+def bidirectional_dijkstra_generator(
+    maze: np.ndarray, start: Cell, end: Cell, cost_map: np.ndarray | None = None
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(bidirectional_dijkstra_search, maze, start, end, cost_map=cost_map)
 
-    if meeting is not None:
-        path = reconstruct_path(forward_parent, start, meeting)
-        current = meeting
-        while current != end:
-            current = backward_parent[current]
-            path.append(current)
-        for cell in path:
-            yield ("path", cell, steps)
-    yield ("done", None, steps)
 
+def mm_generator(
+    maze: np.ndarray, start: Cell, end: Cell, cost_map: np.ndarray | None = None
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(mm_search, maze, start, end, cost_map=cost_map)
 
-def greedy_best_first_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    tie_breaker = count()
-    heap: list[tuple[int, int, Cell]] = [(heuristic(start, end), next(tie_breaker), start)]
-    visited = {start}
-    parent: dict[Cell, Cell] = {}
-    steps = 0
 
-    while heap:
-        _, _, current = heapq.heappop(heap)
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
-        for neighbor in adjacent_cells(current, maze):
-            if neighbor in visited:
-                continue
-            visited.add(neighbor)
-            parent[neighbor] = current
-            heapq.heappush(heap, (heuristic(neighbor, end), next(tie_breaker), neighbor))
-            yield ("enqueue", neighbor, steps)
-
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+def greedy_best_first_generator(
+    maze: np.ndarray, start: Cell, end: Cell, frontier: str = DEFAULT_FRONTIER
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(greedy_best_first_search, maze, start, end, frontier=frontier)
 
 
 def wall_follower_generator(
     maze: np.ndarray, start: Cell, end: Cell, hand: Literal["left", "right"] = "right"
 ) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
     directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
     heading = 1
     current = start
     path = [start]
     steps = 0
-    max_steps = max(1, int(np.count_nonzero(maze == 0)) * 8)
+    max_steps = max(1, graph.vertex_count * 8)
 
     while steps < max_steps:
         steps += 1
@@ -700,7 +541,7 @@ def wall_follower_generator(
             next_heading = (heading + turn) % 4
             delta = directions[next_heading]
             candidate = (current[0] + delta[0], current[1] + delta[1])
-            if maze[candidate] != 0:
+            if not graph.is_open(candidate):
                 continue
             heading = next_heading
             current = candidate
@@ -726,6 +567,7 @@ def right_hand_rule_generator(maze: np.ndarray, start: Cell, end: Cell) -> Gener
 
 
 def tremaux_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
     edge_marks: dict[frozenset[Cell], int] = {}
     stack = [start]
     steps = 0
@@ -741,7 +583,7 @@ def tremaux_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[Sol
             return
 
         candidates = []
-        for neighbor in adjacent_cells(current, maze):
+        for neighbor in graph.adjacent(current):
             edge = frozenset((current, neighbor))
             if edge_marks.get(edge, 0) < 2:
                 candidates.append((edge_marks.get(edge, 0), neighbor, edge))
@@ -763,6 +605,7 @@ def tremaux_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[Sol
 
 
 def pledge_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
     directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
     preferred = 1 if abs(end[1] - start[1]) >= abs(end[0] - start[0]) else 2
     heading = preferred
@@ -770,7 +613,7 @@ def pledge_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[Solv
     current = start
     path = [start]
     steps = 0
-    max_steps = max(1, int(np.count_nonzero(maze == 0)) * 12)
+    max_steps = max(1, graph.vertex_count * 12)
 
     while steps < max_steps:
         steps += 1
@@ -779,7 +622,7 @@ def pledge_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[Solv
             break
 
         forward = (current[0] + directions[preferred][0], current[1] + directions[preferred][1])
-        if turn_sum == 0 and maze[forward] == 0:
+        if turn_sum == 0 and graph.is_open(forward):
             heading = preferred
             current = forward
             path.append(current)
@@ -790,7 +633,7 @@ def pledge_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[Solv
             next_heading = (heading + turn) % 4
             delta = directions[next_heading]
             candidate = (current[0] + delta[0], current[1] + delta[1])
-            if maze[candidate] != 0:
+            if not graph.is_open(candidate):
                 continue
             heading = next_heading
             turn_sum += turn if turn != 2 else 2
@@ -806,16 +649,17 @@ def pledge_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[Solv
 
 
 def random_mouse_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    rng = random.Random(zlib.crc32(maze.tobytes()) ^ (start[0] << 16) ^ start[1] ^ (end[0] << 8) ^ end[1])
+    graph = maze_graph(maze)
+    rng = random.Random(zlib.crc32(graph.fingerprint.encode()) ^ (start[0] << 16) ^ start[1] ^ (end[0] << 8) ^ end[1])
     current = start
     path = [start]
     steps = 0
-    max_steps = max(1, int(np.count_nonzero(maze == 0)) * 16)
+    max_steps = max(1, graph.vertex_count * 16)
 
     while steps < max_steps and current != end:
         steps += 1
         yield ("visit", current, steps)
-        options = adjacent_cells(current, maze)
+        options = graph.adjacent(current)
         if not options:
             break
         current = rng.choice(options)
@@ -828,31 +672,10 @@ def random_mouse_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generato
     yield ("done", None, steps)
 
 
-def iddfs_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    max_depth = int(np.count_nonzero(maze == 0))
-    steps = 0
-
-    for depth_limit in range(max_depth + 1):
-        stack: list[tuple[Cell, list[Cell]]] = [(start, [start])]
-        while stack:
-            current, path = stack.pop()
-            steps += 1
-            yield ("visit", current, steps)
-            if current == end:
-                for cell in path:
-                    yield ("path", cell, steps)
-                yield ("done", None, steps)
-                return
-            if len(path) - 1 >= depth_limit:
-                continue
-            path_set = set(path)
-            for neighbor in reversed(adjacent_cells(current, maze)):
-                if neighbor in path_set:
-                    continue
-                stack.append((neighbor, [*path, neighbor]))
-                yield ("enqueue", neighbor, steps)
-
-    yield ("done", None, steps)
+def iddfs_generator(
+    maze: np.ndarray, start: Cell, end: Cell, transposition_size: int = 0
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(iddfs_search, maze, start, end, transposition_size=transposition_size)
 
 
 def bellman_ford_generator(
@@ -860,74 +683,18 @@ def bellman_ford_generator(
     start: Cell,
     end: Cell,
     weight: WeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
+    event_stride: int = 1,
 ) -> Generator[SolverEvent, None, None]:
-    weight = weight or (lambda _current, _neighbor: 1.0)
-    vertices = [cell for cell in np.ndindex(maze.shape) if maze[cell] == 0]
-    edges = [(cell, neighbor) for cell in vertices for neighbor in adjacent_cells(cell, maze)]
-    distance = {cell: float("inf") for cell in vertices}
-    distance[start] = 0.0
-    parent: dict[Cell, Cell] = {}
-    steps = 0
-
-    for _ in range(max(0, len(vertices) - 1)):
-        changed = False
-        for current, neighbor in edges:
-            edge_weight = weight(current, neighbor)
-            candidate = distance[current] + edge_weight
-            if candidate < distance[neighbor]:
-                distance[neighbor] = candidate
-                parent[neighbor] = current
-                changed = True
-                steps += 1
-                yield ("visit", current, steps)
-                yield ("enqueue", neighbor, steps)
-        if not changed:
-            break
-
-    for current, neighbor in edges:
-        if distance[current] + weight(current, neighbor) < distance[neighbor]:
-            raise ValueError("Bellman-Ford detected a negative-weight cycle.")
+    yield from _kernel_events(
+        bellman_ford_search, maze, start, end, weight=weight, cost_map=cost_map, event_stride=event_stride
+    )
 
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
 
-
-def dead_end_filling_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    remaining = {cell for cell in np.ndindex(maze.shape) if maze[cell] == 0}
-    protected = {start, end}
-    queue: deque[Cell] = deque(cell for cell in remaining - protected if _degree(cell, maze, remaining) <= 1)
-    removed: set[Cell] = set()
-    steps = 0
-
-    while queue:
-        current = queue.popleft()
-        if current in removed or current in protected:
-            continue
-        if _degree(current, maze, remaining - removed) > 1:
-            continue
-        removed.add(current)
-        steps += 1
-        yield ("visit", current, steps)
-        for neighbor in adjacent_cells(current, maze):
-            if (
-                neighbor not in removed
-                and neighbor not in protected
-                and _degree(neighbor, maze, remaining - removed) <= 1
-            ):
-                queue.append(neighbor)
-                yield ("enqueue", neighbor, steps)
-
-    reduced = maze.copy()
-    for cell in removed:
-        reduced[cell] = 1
-    for cell in bfs_path(reduced, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
-
-
-def _degree(cell: Cell, maze: np.ndarray, allowed: set[Cell]) -> int:
-    return sum(neighbor in allowed for neighbor in adjacent_cells(cell, maze))
+def dead_end_filling_generator(
+    maze: np.ndarray, start: Cell, end: Cell, vectorized: bool = False
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(dead_end_filling_search, maze, start, end, vectorized=vectorized)
 
 
 def heuristic(a: Cell, b: Cell) -> int:
@@ -935,42 +702,51 @@ def heuristic(a: Cell, b: Cell) -> int:
 
 
 def weighted_a_star_generator(
-    maze: np.ndarray, start: Cell, end: Cell, weight_multiplier: float = 1.6
+    maze: np.ndarray,
+    start: Cell,
+    end: Cell,
+    weight_multiplier: float = 1.6,
+    cost_map: np.ndarray | None = None,
+    frontier: str = DEFAULT_FRONTIER,
 ) -> Generator[SolverEvent, None, None]:
-    tie_breaker = count()
-    heap: list[tuple[float, int, Cell]] = [(weight_multiplier * heuristic(start, end), next(tie_breaker), start)]
-    parent: dict[Cell, Cell] = {}
-    g_score: dict[Cell, float] = {start: 0.0}
-    closed: set[Cell] = set()
-    steps = 0
-
-    while heap:
-        _, _, current = heapq.heappop(heap)
-        if current in closed:
-            continue
-        closed.add(current)
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
-        for neighbor in adjacent_cells(current, maze):
-            tentative = g_score[current] + 1
-            if tentative >= g_score.get(neighbor, float("inf")):
-                continue
-            parent[neighbor] = current
-            g_score[neighbor] = tentative
-            priority = tentative + weight_multiplier * heuristic(neighbor, end)
-            heapq.heappush(heap, (priority, next(tie_breaker), neighbor))
-            yield ("enqueue", neighbor, steps)
-
-    for cell in reconstruct_path(parent, start, end):
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+    yield from _kernel_events(
+        weighted_a_star_search,
+        maze,
+        start,
+        end,
+        cost_map=cost_map,
+        weight_multiplier=weight_multiplier,
+        frontier=frontier,
+    )
+
+
+def ara_star_generator(
+    maze: np.ndarray,
+    start: Cell,
+    end: Cell,
+    epsilon: float = 3.0,
+    epsilon_step: float = 0.5,
+    deadline: float | None = None,
+    max_expansions: int | None = None,
+    cost_map: np.ndarray | None = None,
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(
+        ara_star_search,
+        maze,
+        start,
+        end,
+        cost_map=cost_map,
+        epsilon=epsilon,
+        epsilon_step=epsilon_step,
+        deadline=deadline,
+        max_expansions=max_expansions,
+    )
 
 
 def beam_search_generator(
     maze: np.ndarray, start: Cell, end: Cell, width: int = 8
 ) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
     frontier: list[tuple[Cell, list[Cell]]] = [(start, [start])]
     seen = {start}
     steps = 0
@@ -985,7 +761,7 @@ def beam_search_generator(
                     yield ("path", cell, steps)
                 yield ("done", None, steps)
                 return
-            for neighbor in adjacent_cells(current, maze):
+            for neighbor in graph.adjacent(current):
                 if neighbor in seen:
                     continue
                 seen.add(neighbor)
@@ -998,6 +774,7 @@ def beam_search_generator(
 
 
 def hill_climbing_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
+    graph = maze_graph(maze)
     current = start
     path = [start]
     seen = {start}
@@ -1005,7 +782,7 @@ def hill_climbing_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generat
     while current != end:
         steps += 1
         yield ("visit", current, steps)
-        candidates = [cell for cell in adjacent_cells(current, maze) if cell not in seen]
+        candidates = [cell for cell in graph.adjacent(current) if cell not in seen]
         if not candidates:
             break
         current = min(candidates, key=lambda cell: (heuristic(cell, end), cell))
@@ -1021,76 +798,44 @@ def hill_climbing_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generat
     yield from _fallback_path_events(maze, start, end, steps)
 
 
-def value_iteration_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    yield from flood_fill_generator(maze, start, end)
-
-
-def corridor_graph_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    vertices = {cell for cell in np.ndindex(maze.shape) if maze[cell] == 0}
-    key_cells = {start, end} | {cell for cell in vertices if len(adjacent_cells(cell, maze)) != 2}
-    reduced_edges: dict[Cell, list[tuple[Cell, int, list[Cell]]]] = {cell: [] for cell in key_cells}
-
-    for cell in key_cells:
-        for neighbor in adjacent_cells(cell, maze):
-            path = [cell, neighbor]
-            previous, current = cell, neighbor
-            while current not in key_cells:
-                options = [candidate for candidate in adjacent_cells(current, maze) if candidate != previous]
-                if not options:
-                    break
-                previous, current = current, options[0]
-                path.append(current)
-            if current in key_cells and current != cell:
-                reduced_edges[cell].append((current, len(path) - 1, path))
-
-    tie_breaker = count()
-    heap: list[tuple[int, int, Cell]] = [(0, next(tie_breaker), start)]
-    distance = {start: 0}
-    parent: dict[Cell, tuple[Cell, list[Cell]]] = {}
-    settled: set[Cell] = set()
-    steps = 0
-    while heap:
-        current_distance, _, current = heapq.heappop(heap)
-        if current in settled:
-            continue
-        settled.add(current)
-        steps += 1
-        yield ("visit", current, steps)
-        if current == end:
-            break
-        for neighbor, edge_cost, edge_path in reduced_edges.get(current, []):
-            candidate = current_distance + edge_cost
-            if candidate >= distance.get(neighbor, float("inf")):
-                continue
-            distance[neighbor] = candidate
-            parent[neighbor] = (current, edge_path)
-            heapq.heappush(heap, (candidate, next(tie_breaker), neighbor))
-            for cell in edge_path[1:]:
-                yield ("enqueue", cell, steps)
-
-    if end not in parent and start != end:
-        yield from _fallback_path_events(maze, start, end, steps)
-        return
+def value_iteration_generator(
+    maze: np.ndarray,
+    start: Cell,
+    end: Cell,
+    cost_map: np.ndarray | None = None,
+    gauss_seidel: bool = False,
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(value_iteration_search, maze, start, end, cost_map=cost_map, gauss_seidel=gauss_seidel)
 
-    segments: list[list[Cell]] = []
-    cursor = end
-    while cursor != start:
-        previous, segment = parent[cursor]
-        segments.append(segment)
-        cursor = previous
-    path: list[Cell] = []
-    for segment in reversed(segments):
-        path.extend(segment if not path else segment[1:])
-    if start == end:
-        path = [start]
-    for cell in path:
-        yield ("path", cell, steps)
-    yield ("done", None, steps)
+
+def fast_sweeping_generator(
+    maze: np.ndarray, start: Cell, end: Cell, cost_map: np.ndarray | None = None
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(fast_sweeping_search, maze, start, end, cost_map=cost_map)
+
+
+def policy_iteration_generator(
+    maze: np.ndarray, start: Cell, end: Cell, cost_map: np.ndarray | None = None
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(policy_iteration_search, maze, start, end, cost_map=cost_map)
+
+
+def q_learning_generator(
+    maze: np.ndarray, start: Cell, end: Cell, cost_map: np.ndarray | None = None
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(q_learning_search, maze, start, end, cost_map=cost_map)
+
+
+def corridor_graph_generator(
+    maze: np.ndarray, start: Cell, end: Cell, frontier: str = DEFAULT_FRONTIER
+) -> Generator[SolverEvent, None, None]:
+    yield from _kernel_events(corridor_graph_search, maze, start, end, frontier=frontier)
 
 
 def sampling_planner_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    rng = random.Random(zlib.crc32(maze.tobytes()) ^ 0xA57A)
-    vertices = [cell for cell in np.ndindex(maze.shape) if maze[cell] == 0]
+    graph = maze_graph(maze)
+    rng = random.Random(zlib.crc32(graph.fingerprint.encode()) ^ 0xA57A)
+    vertices = graph.open_cells()
     sample_count = min(len(vertices), max(24, int(len(vertices) ** 0.5) * 8))
     samples = {start, end, *rng.sample(vertices, sample_count)}
     parent: dict[Cell, Cell] = {}
@@ -1104,9 +849,7 @@ def sampling_planner_generator(maze: np.ndarray, start: Cell, end: Cell) -> Gene
         yield ("visit", current, steps)
         if current == end:
             break
-        options = sorted(
-            adjacent_cells(current, maze), key=lambda cell: (cell not in samples, heuristic(cell, end), cell)
-        )
+        options = sorted(graph.adjacent(current), key=lambda cell: (cell not in samples, heuristic(cell, end), cell))
         for neighbor in options:
             if neighbor in seen:
                 continue
@@ -1121,10 +864,11 @@ def sampling_planner_generator(maze: np.ndarray, start: Cell, end: Cell) -> Gene
 
 
 def optimization_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generator[SolverEvent, None, None]:
-    rng = random.Random(zlib.crc32(maze.tobytes()) ^ 0xC011A7E)
+    graph = maze_graph(maze)
+    rng = random.Random(zlib.crc32(graph.fingerprint.encode()) ^ 0xC011A7E)
     best_path = bfs_path(maze, start, end)
     steps = 0
-    for _ in range(min(64, max(8, int(np.count_nonzero(maze == 0) // 4)))):
+    for _ in range(min(64, max(8, graph.vertex_count // 4))):
         current = start
         walk = [start]
         seen = {start}
@@ -1135,7 +879,7 @@ def optimization_generator(maze: np.ndarray, start: Cell, end: Cell) -> Generato
                 if len(walk) < len(best_path):
                     best_path = walk
                 break
-            options = [cell for cell in adjacent_cells(current, maze) if cell not in seen]
+            options = [cell for cell in graph.adjacent(current) if cell not in seen]
             if not options:
                 break
             options.sort(key=lambda cell: heuristic(cell, end))
@@ -1168,10 +912,10 @@ def _projected_generator(kind: str) -> Callable[[np.ndarray, Cell, Cell], Genera
             yield from flood_fill_generator(maze, start, end)
         elif kind == "dijkstra":
             yield from dijkstra_generator(maze, start, end)
-        elif kind == "zero_one":
-            yield from hadlock_generator(maze, start, end)
         elif kind == "astar":
             yield from a_star_generator(maze, start, end)
+        elif kind == "incremental":
+            yield from d_star_lite_generator(maze, start, end)
         elif kind == "weighted_astar":
             yield from weighted_a_star_generator(maze, start, end)
         elif kind == "beam":
@@ -1180,12 +924,14 @@ def _projected_generator(kind: str) -> Callable[[np.ndarray, Cell, Cell], Genera
             yield from hill_climbing_generator(maze, start, end)
         elif kind == "bidirectional":
             yield from bidirectional_bfs_generator(maze, start, end)
+        elif kind == "meet_in_the_middle":
+            yield from mm_generator(maze, start, end)
         elif kind == "corridor":
             yield from corridor_graph_generator(maze, start, end)
         elif kind == "wall":
             yield from pledge_generator(maze, start, end)
         elif kind == "field":
-            yield from value_iteration_generator(maze, start, end)
+            yield from flood_fill_generator(maze, start, end)
         elif kind == "sample":
             yield from sampling_planner_generator(maze, start, end)
         elif kind == "optimization":
@@ -1198,22 +944,35 @@ def _projected_generator(kind: str) -> Callable[[np.ndarray, Cell, Cell], Genera
     return run
 
 
+# Catalog entries with a native finite-grid solver rather than a projection.
+_NATIVE_CATALOG_SOLVERS = {
+    "Jump Point Search",
+    "JPS+",
+    "D* Lite",
+    "Contraction Hierarchies",
+    "ALT / A* Landmarks",
+    "HPA*",
+    "Dial's Algorithm",
+    "0-1 BFS",
+    "Brushfire Distance Transform",
+    "Value Iteration",
+    "Fast Sweeping Method",
+    "Policy Iteration",
+    "Q-Learning Grid Solver",
+    "Weighted A*",
+    "Anytime Repairing A*",
+    "Bidirectional Dijkstra",
+    "MM Bidirectional Search",
+}
+
 _PROJECTED_SOLVER_KIND = {
-    "Dial's Algorithm": "dijkstra",
-    "0-1 BFS": "zero_one",
     "Theta*": "astar",
     "Lazy Theta*": "astar",
     "Field D*": "field",
-    "Jump Point Search": "astar",
-    "JPS+": "astar",
     "Rectangular Symmetry Reduction": "astar",
     "Fringe Search": "weighted_astar",
-    "HPA*": "corridor",
-    "D*": "astar",
-    "D* Lite": "astar",
-    "LPA*": "astar",
-    "Anytime Repairing A*": "weighted_astar",
-    "Weighted A*": "weighted_astar",
+    "D*": "incremental",
+    "LPA*": "incremental",
     "Beam Search": "beam",
     "Hill Climbing": "hill",
     "Bug 1": "wall",
@@ -1221,29 +980,22 @@ _PROJECTED_SOLVER_KIND = {
     "TangentBug": "wall",
     "Potential Field": "field",
     "Fast Marching Method": "dijkstra",
-    "Fast Sweeping Method": "field",
-    "Value Iteration": "field",
-    "Policy Iteration": "field",
     "RRT": "sample",
     "RRT*": "sample",
     "PRM": "sample",
     "Voronoi Roadmap": "corridor",
     "Navigation Mesh A*": "corridor",
-    "Contraction Hierarchies": "corridor",
-    "ALT / A* Landmarks": "astar",
     "Hierarchical Dijkstra": "corridor",
     "Floyd-Warshall": "dijkstra",
     "Johnson's Algorithm": "dijkstra",
     "DAG Shortest Path": "bfs",
     "Multi-Source BFS": "bfs",
     "Reverse BFS": "reverse_bfs",
-    "Brushfire Distance Transform": "reverse_bfs",
     "Perimeter Search": "bidirectional",
     "Recursive Best-First Search": "weighted_astar",
     "SMA*": "beam",
-    "MM Bidirectional Search": "bidirectional",
-    "Near-Optimal Bidirectional Search": "bidirectional",
-    "Front-to-Front Bidirectional A*": "bidirectional",
+    "Near-Optimal Bidirectional Search": "meet_in_the_middle",
+    "Front-to-Front Bidirectional A*": "meet_in_the_middle",
     "ANYA": "astar",
     "Block A*": "astar",
     "Subgoal Graphs": "corridor",
@@ -1261,7 +1013,6 @@ _PROJECTED_SOLVER_KIND = {
     "Genetic Algorithm": "optimization",
     "Simulated Annealing": "optimization",
     "Tabu Search": "optimization",
-    "Q-Learning Grid Solver": "field",
     "SAT Path Encoding": "constraint",
     "Integer Linear Programming": "constraint",
 }
@@ -1291,6 +1042,7 @@ def _extend_algorithm_registry_from_catalog() -> None:
         "Reverse BFS",
         "Brushfire Distance Transform",
         "Perimeter Search",
+        "Bidirectional Dijkstra",
         "MM Bidirectional Search",
         "Near-Optimal Bidirectional Search",
         "Front-to-Front Bidirectional A*",
@@ -1326,11 +1078,17 @@ def _extend_algorithm_registry_from_catalog() -> None:
             complete=name not in incomplete,
             time_complexity=entry["time"],
             space_complexity=entry["space"],
-            notes=f"{entry['notes']} Projected onto this finite 4-neighbor maze graph for visualization.",
+            notes=_catalog_notes(name, entry["notes"]),
             references=(entry["reference"],),
         )
 
 
+def _catalog_notes(name: str, notes: str) -> str:
+    if name in _NATIVE_CATALOG_SOLVERS:
+        return f"{notes.rstrip('.')}. Implemented natively on the 4-neighbor maze graph."
+    return f"{notes} Projected onto this finite 4-neighbor maze graph for visualization."
+
+
 _extend_algorithm_registry_from_catalog()
 
 
@@ -1355,7 +1113,318 @@ SOLVER_REGISTRY: dict[str, Callable[..., Generator[SolverEvent, None, None]]] =
     "Bellman-Ford": bellman_ford_generator,
     "Dead-End Filling": dead_end_filling_generator,
     "Random Mouse": random_mouse_generator,
+    "Jump Point Search": jump_point_search_generator,
+    "JPS+": jps_plus_generator,
+    "D* Lite": d_star_lite_generator,
+    "Contraction Hierarchies": contraction_hierarchy_generator,
+    "ALT / A* Landmarks": alt_generator,
+    "HPA*": hpa_star_generator,
+    "Dial's Algorithm": dials_generator,
+    "0-1 BFS": zero_one_bfs_generator,
+    "Brushfire Distance Transform": flood_fill_generator,
+    "Value Iteration": value_iteration_generator,
+    "Fast Sweeping Method": fast_sweeping_generator,
+    "Policy Iteration": policy_iteration_generator,
+    "Q-Learning Grid Solver": q_learning_generator,
+    "Weighted A*": weighted_a_star_generator,
+    "Anytime Repairing A*": ara_star_generator,
+    "Bidirectional Dijkstra": bidirectional_dijkstra_generator,
+    "MM Bidirectional Search": mm_generator,
 }
 
 for _name, _kind in _PROJECTED_SOLVER_KIND.items():
     SOLVER_REGISTRY.setdefault(_name, _projected_generator(_kind))
+
+_KIND_KERNELS: dict[str, SearchKernel] = {
+    "bfs": bfs_search,
+    "reverse_bfs": flood_fill_search,
+    "dijkstra": dijkstra_search,
+    "astar": a_star_search,
+    "bidirectional": bidirectional_bfs_search,
+    "meet_in_the_middle": mm_search,
+    "incremental": d_star_lite_search,
+    "weighted_astar": weighted_a_star_search,
+    "constraint": bfs_search,
+    "corridor": corridor_graph_search,
+}
+
+KERNEL_REGISTRY: dict[str, SearchKernel] = {
+    "BFS": bfs_search,
+    "Lee": lee_search,
+    "Flood Fill": flood_fill_search,
+    "A*": a_star_search,
+    "Hadlock": hadlock_search,
+    "Dijkstra": dijkstra_search,
+    "UCS": dijkstra_search,
+    "SPFA": spfa_search,
+    "Bellman-Ford": bellman_ford_search,
+    "Dead-End Filling": dead_end_filling_search,
+    "IDA*": ida_star_search,
+    "IDDFS": iddfs_search,
+    "Bidirectional BFS": bidirectional_bfs_search,
+    "Jump Point Search": jump_point_search,
+    "JPS+": jps_plus_search,
+    "D* Lite": d_star_lite_search,
+    "Contraction Hierarchies": contraction_hierarchy_search,
+    "ALT / A* Landmarks": alt_search,
+    "HPA*": hpa_star_search,
+    "Dial's Algorithm": dials_search,
+    "0-1 BFS": zero_one_bfs_search,
+    "Brushfire Distance Transform": flood_fill_search,
+    "Value Iteration": value_iteration_search,
+    "Fast Sweeping Method": fast_sweeping_search,
+    "Policy Iteration": policy_iteration_search,
+    "Q-Learning Grid Solver": q_learning_search,
+    "Weighted A*": weighted_a_star_search,
+    "Anytime Repairing A*": ara_star_search,
+    "Bidirectional Dijkstra": bidirectional_dijkstra_search,
+    "Greedy Best-First": greedy_best_first_search,
+    "MM Bidirectional Search": mm_search,
+}
+
+for _name, _kind in _PROJECTED_SOLVER_KIND.items():
+    if _kind in _KIND_KERNELS:
+        KERNEL_REGISTRY.setdefault(_name, _KIND_KERNELS[_kind])
+
+
+# Solvers whose answer is any shortest path, so one tree per start serves every goal. The unit-cost ones take
+# no cost map; the weighted ones map to the cost check their kernel runs before searching.
+_UNIT_TREE_SOLVERS = {"BFS", "Lee", "Flood Fill", "Brushfire Distance Transform"}
+_WEIGHTED_TREE_SOLVERS: dict[str, Callable[[MazeGraph, np.ndarray], object]] = {
+    "Dijkstra": cell_costs,
+    "UCS": cell_costs,
+    "SPFA": cell_costs,
+    "Bellman-Ford": cell_costs,
+    "Dial's Algorithm": partial(cell_costs, integer=True),
+    "0-1 BFS": zero_one_costs,
+}
+
+
+def _answers_from_trees(algorithm: str, graph: MazeGraph, options: dict) -> bool:
+    """Whether a ``ShortestPathTree`` can answer ``algorithm`` with ``options`` exactly as its kernel would.
+
+    A weighted solver's cost map goes through the same check as in its kernel,
+    so a map the kernel rejects raises here instead of reaching a tree.
+    """
+    if algorithm in _UNIT_TREE_SOLVERS:
+        return not options
+    if algorithm not in _WEIGHTED_TREE_SOLVERS or set(options) - {"cost_map"}:
+        return False
+    if options.get("cost_map") is not None:
+        _WEIGHTED_TREE_SOLVERS[algorithm](graph, options["cost_map"])
+    return True
+
+
+# Kernels that take a ``SearchWorkspace``, so query loops can reuse one set of per-cell buffers.
+_WORKSPACE_KERNELS = {bfs_search, a_star_search, dijkstra_search, weighted_a_star_search, alt_search}
+
+
+@dataclass(frozen=True)
+class SolveResult:
+    algorithm: str
+    path: list[Cell]
+    visited: int
+    enqueued: int
+    peak_frontier: int
+    steps: int
+    events: EventLog | None = None
+    metrics: dict[str, float] = field(default_factory=dict)
+
+
+def solve(
+    maze: np.ndarray,
+    start: Cell,
+    goal: Cell,
+    algorithm: str = "A*",
+    record_events: bool = False,
+    reuse_trees: bool = False,
+    **options,
+) -> SolveResult:
+    """Run a solver headlessly and return its path and work counters.
+
+    Solvers with an integer-id kernel skip event construction entirely unless
+    ``record_events`` is set; the rest are drained from their event generator.
+    With ``reuse_trees`` a shortest-path solver answers from the cached
+    ``ShortestPathTree`` for ``start`` (building it on a miss), so repeated
+    queries from one start on an unchanged maze skip the search; only the path
+    is recorded as events. Inputs the solver's kernel would reject still raise.
+    """
+    if algorithm not in SOLVER_REGISTRY:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if reuse_trees and _answers_from_trees(algorithm, maze_graph(maze), options):
+        return _solve_from_tree(maze, start, goal, algorithm, record_events, options.get("cost_map"))
+    kernel = KERNEL_REGISTRY.get(algorithm)
+    if kernel is None:
+        log = EventLog(maze.shape[1]) if record_events else None
+        return _drain_generator(algorithm, SOLVER_REGISTRY[algorithm](maze, start, goal, **options), log)
+
+    graph = maze_graph(maze)
+    log = EventLog(graph.cols) if record_events else None
+    result = _run_kernel(kernel, graph, start, goal, log, **options)
+    return SolveResult(
+        algorithm=algorithm,
+        path=graph.cells_of(result.path),
+        visited=result.visited,
+        enqueued=result.enqueued,
+        peak_frontier=result.peak_frontier,
+        steps=result.steps,
+        events=_finish_log(log, result) if log is not None else None,
+        metrics=result.metrics,
+    )
+
+
+def _solve_from_tree(
+    maze: np.ndarray, start: Cell, goal: Cell, algorithm: str, record_events: bool, cost_map: np.ndarray | None
+) -> SolveResult:
+    graph = maze_graph(maze)
+    tree, hit = cached_shortest_path_tree(graph, graph.cell_id(start), cost_map)
+    path = tree.path_to(graph.cell_id(goal))
+    visited = 0 if hit else tree.settled
+    log = EventLog(graph.cols) if record_events else None
+    return SolveResult(
+        algorithm=algorithm,
+        path=graph.cells_of(path),
+        visited=visited,
+        enqueued=0,
+        peak_frontier=0,
+        steps=visited,
+        events=_finish_log(log, SearchResult(path=path, steps=visited)) if log is not None else None,
+        metrics={"tree_cache_hits": int(hit), "tree_cache_misses": int(not hit)},
+    )
+
+
+def _drain_generator(
+    algorithm: str, stream: Generator[SolverEvent, None, None], events: EventLog | None
+) -> SolveResult:
+    path: list[Cell] = []
+    visited = enqueued = peak_frontier = steps = 0
+    for event in stream:
+        action, cell, steps = event
+        if events is not None:
+            events.append(event)
+        if action == "visit":
+            visited += 1
+        elif action == "enqueue":
+            enqueued += 1
+            peak_frontier = max(peak_frontier, enqueued - visited)
+        elif action == "path" and cell is not None:
+            path.append(cell)
+    return SolveResult(
+        algorithm=algorithm,
+        path=path,
+        visited=visited,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        steps=steps,
+        events=events,
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class BatchResult:
+    """Answers to many queries on one maze, as arrays indexed by query.
+
+    Paths are stored CSR-style as cell ids: query ``i`` is
+    ``path_ids[path_offsets[i]:path_offsets[i + 1]]``, empty when unreachable.
+    ``costs`` is ``inf`` for unreachable goals. A newly built tree's work is
+    counted in ``visited`` at the first query that used it.
+    """
+
+    algorithm: str
+    cols: int
+    starts: np.ndarray
+    goals: np.ndarray
+    path_offsets: np.ndarray
+    path_ids: np.ndarray
+    costs: np.ndarray
+    visited: np.ndarray
+    trees: int
+    tree_cache_hits: int
+    seconds: float
+
+    @property
+    def queries(self) -> int:
+        return int(self.starts.size)
+
+    @property
+    def path_lengths(self) -> np.ndarray:
+        return np.diff(self.path_offsets)
+
+    @property
+    def queries_per_second(self) -> float:
+        return self.queries / self.seconds if self.seconds else 0.0
+
+    def path(self, index: int) -> list[Cell]:
+        ids = self.path_ids[self.path_offsets[index] : self.path_offsets[index + 1]]
+        rows, cols = np.divmod(ids.astype(np.int64), self.cols)
+        return list(zip(rows.tolist(), cols.tolist(), strict=True))
+
+
+def solve_many(maze: np.ndarray, pairs, algorithm: str = "A*", **options) -> BatchResult:
+    """Answer many ``(start, goal)`` queries on one maze, building per-maze structures once.
+
+    Shortest-path solvers take one ``ShortestPathTree`` per distinct start from
+    the tree cache and answer each of its goals with a parent walk. Other solvers run once per
+    query against the shared graph and the fingerprint-cached jump, landmark,
+    hierarchy and cluster tables; kernels that accept a ``SearchWorkspace``
+    share one across every query instead of allocating per-cell arrays each time.
+    """
+    if algorithm not in SOLVER_REGISTRY:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    began = time.perf_counter()
+    graph = maze_graph(maze)
+    cells = np.asarray(pairs, dtype=np.int64).reshape(-1, 2, 2)
+    if np.any(cells < 0) or np.any(cells[..., 0] >= graph.rows) or np.any(cells[..., 1] >= graph.cols):
+        raise ValueError("Query cells must lie inside the maze.")
+    ids = (cells[..., 0] * graph.cols + cells[..., 1]).astype(np.int32)
+    starts, goals = ids[:, 0], ids[:, 1]
+    cost_map = options.get("cost_map")
+    step_costs = None if cost_map is None else np.asarray(cost_map, dtype=np.float64).reshape(-1)
+    paths: list[list[int]] = [[] for _ in range(starts.size)]
+    costs = np.full(starts.size, np.inf)
+    visited = np.zeros(starts.size, dtype=np.int64)
+    trees = tree_cache_hits = 0
+
+    if _answers_from_trees(algorithm, graph, options):
+        by_source: dict[int, list[int]] = {}
+        for index, source in enumerate(starts.tolist()):
+            by_source.setdefault(source, []).append(index)
+        for source, indices in by_source.items():
+            tree, hit = cached_shortest_path_tree(graph, source, cost_map)
+            trees += 1
+            tree_cache_hits += hit
+            visited[indices[0]] = 0 if hit else tree.settled
+            for index in indices:
+                goal = int(goals[index])
+                paths[index] = tree.path_to(goal)
+                costs[index] = tree.cost_to(goal)
+    else:
+        kernel = KERNEL_REGISTRY.get(algorithm)
+        if kernel in _WORKSPACE_KERNELS:
+            options = {"workspace": SearchWorkspace(graph.shape), **options}
+        for index, (start, goal) in enumerate(zip(starts.tolist(), goals.tolist(), strict=True)):
+            start_cell, goal_cell = graph.cell_of(start), graph.cell_of(goal)
+            if kernel is not None:
+                result = _run_kernel(kernel, graph, start_cell, goal_cell, None, **options)
+                path, visited[index] = result.path, result.visited
+            else:
+                solved = solve(maze, start_cell, goal_cell, algorithm, **options)
+                path, visited[index] = [graph.cell_id(cell) for cell in solved.path], solved.visited
+            paths[index] = path
+            if path:
+                costs[index] = step_costs[path[1:]].sum() if step_costs is not None else len(path) - 1
+
+    lengths = np.fromiter(map(len, paths), dtype=np.int64, count=len(paths))
+    return BatchResult(
+        algorithm=algorithm,
+        cols=graph.cols,
+        starts=starts,
+        goals=goals,
+        path_offsets=np.concatenate(([0], np.cumsum(lengths))),
+        path_ids=np.fromiter(chain.from_iterable(paths), dtype=np.int32, count=int(lengths.sum())),
+        costs=costs,
+        visited=visited,
+        trees=trees,
+        tree_cache_hits=tree_cache_hits,
+        seconds=time.perf_counter() - began,
+    )
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import heapq
+import time
+from array import array
+from dataclasses import dataclass
+from itertools import count
+
+import numpy as np
+
+from maze_solver.graph import MazeGraph, maze_graph
+from maze_solver.grid import Cell, PackedMaze
+from maze_solver.search import ENQUEUE, NO_PARENT, VISIT, EventLog, SearchResult, entry_costs, walk_parents
+
+INFINITY = float("inf")
+NEW, OPEN, CLOSED, INCONSISTENT = 0, 1, 2, 3
+
+
+@dataclass(frozen=True)
+class AnytimeSolution:
+    """A published ARA* path (cell ids) whose ``cost`` is at most ``bound`` times the optimum."""
+
+    path: list[int]
+    cost: float
+    bound: float
+    epsilon: float
+    expansions: int
+
+
+class ARAStarPlanner:
+    """Anytime Repairing A* (Likhachev, Gordon and Thrun).
+
+    The first search runs with the heuristic inflated by ``epsilon`` and
+    publishes a path quickly. Each later search lowers epsilon by
+    ``epsilon_step`` and resumes from the previous OPEN list plus the
+    INCONS list of closed cells whose ``g`` improved, so only those vertices
+    are re-expanded instead of restarting. ``improve`` stops at a wall-clock
+    deadline or an expansion budget and can be called again to keep refining.
+    """
+
+    def __init__(
+        self,
+        maze: np.ndarray | PackedMaze | MazeGraph,
+        start: Cell,
+        goal: Cell,
+        cost_map: np.ndarray | None = None,
+        epsilon: float = 3.0,
+        epsilon_step: float = 0.5,
+        trace: EventLog | None = None,
+    ) -> None:
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1.")
+        if epsilon_step <= 0:
+            raise ValueError("epsilon_step must be positive.")
+        graph = maze_graph(maze)
+        self.rows, self.cols = graph.shape
+        self._moves, self._mask = graph.steps, graph.mask_bytes
+        self._costs, cheapest = entry_costs(graph, cost_map)
+        self._start = self._id(start)
+        self._goal = self._id(goal)
+        row, col = np.divmod(np.arange(graph.size), self.cols)
+        goal_row, goal_col = divmod(self._goal, self.cols)
+        self._h = array(
+            "d", (cheapest * (np.abs(row - goal_row) + np.abs(col - goal_col))).astype(np.float64).tobytes()
+        )
+        self.epsilon = float(epsilon)
+        self.epsilon_step = float(epsilon_step)
+        self.trace = trace
+        self.expansions = 0
+        self.insertions = 0
+        self.peak_queue = 1
+        self.solutions: list[AnytimeSolution] = []
+        self.done = not graph.passable[self._start]
+        self._g = array("d", [INFINITY]) * graph.size
+        self._parent = array("i", [NO_PARENT]) * graph.size
+        self._state = bytearray(graph.size)
+        self._inconsistent: list[int] = []
+        self._tie_breaker = count()
+        self._heap: list[tuple[float, int, float, int]] = []
+        if not self.done:
+            self._g[self._start] = 0.0
+            self._push(self._start)
+
+    @property
+    def solution(self) -> AnytimeSolution | None:
+        """The best path published so far."""
+        return self.solutions[-1] if self.solutions else None
+
+    @property
+    def bound(self) -> float:
+        solution = self.solution
+        return solution.bound if solution is not None else INFINITY
+
+    def path(self) -> list[Cell]:
+        solution = self.solution
+        return [divmod(cell_id, self.cols) for cell_id in solution.path] if solution is not None else []
+
+    def improve(self, deadline: float | None = None, max_expansions: int | None = None) -> AnytimeSolution | None:
+        """Search until the path is proven optimal, ``deadline`` seconds pass, or ``max_expansions`` more expansions.
+
+        Returns the best solution published so far, which is ``None`` only if
+        the budget ran out before any path was found or the goal is unreachable.
+        """
+        stop_time = time.perf_counter() + deadline if deadline is not None else INFINITY
+        expansion_limit = self.expansions + max_expansions if max_expansions is not None else INFINITY
+        while not self.done and self._improve_path(stop_time, expansion_limit):
+            self._publish()
+            if self.done:
+                break
+            self.epsilon = max(1.0, self.epsilon - self.epsilon_step)
+            self._reopen()
+        return self.solution
+
+    def _id(self, cell: Cell) -> int:
+        row, col = cell
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Cell {cell} is outside the maze.")
+        return row * self.cols + col
+
+    def _push(self, cell_id: int) -> None:
+        g = self._g[cell_id]
+        self._state[cell_id] = OPEN
+        heapq.heappush(self._heap, (g + self.epsilon * self._h[cell_id], next(self._tie_breaker), g, cell_id))
+        if len(self._heap) > self.peak_queue:
+            self.peak_queue = len(self._heap)
+
+    def _improve_path(self, stop_time: float, expansion_limit: float) -> bool:
+        """Expand until the goal's g is no larger than the least OPEN key; False if the budget ran out first."""
+        heap, state, g, parent, costs = self._heap, self._state, self._g, self._parent, self._costs
+        mask, moves, goal = self._mask, self._moves, self._goal
+        record = self.trace.record if self.trace is not None else None
+        while heap:
+            key, _, pushed_g, current = heap[0]
+            if state[current] != OPEN or pushed_g != g[current]:
+                heapq.heappop(heap)
+                continue
+            if g[goal] <= key:
+                return True
+            if self.expansions >= expansion_limit or time.perf_counter() >= stop_time:
+                return False
+            heapq.heappop(heap)
+            state[current] = CLOSED
+            self.expansions += 1
+            if record is not None:
+                record(VISIT, current, self.expansions)
+            current_g = g[current]
+            for delta in moves[mask[current]]:
+                neighbor = current + delta
+                candidate = current_g + costs[neighbor]
+                if candidate >= g[neighbor]:
+                    continue
+                g[neighbor] = candidate
+                parent[neighbor] = current
+                if state[neighbor] == CLOSED:
+                    state[neighbor] = INCONSISTENT
+                    self._inconsistent.append(neighbor)
+                elif state[neighbor] != INCONSISTENT:
+                    self._push(neighbor)
+                    self.insertions += 1
+                    if record is not None:
+                        record(ENQUEUE, neighbor, self.expansions)
+        return True
+
+    def _pending(self) -> list[int]:
+        """Cells in OPEN or INCONS, each listed once."""
+        state, g = self._state, self._g
+        cells = [cell for _, _, pushed_g, cell in self._heap if state[cell] == OPEN and pushed_g == g[cell]]
+        return cells + self._inconsistent
+
+    def _publish(self) -> None:
+        if self._g[self._goal] == INFINITY:
+            self.done = True
+            return
+        g, h, costs = self._g, self._h, self._costs
+        # Parents may have improved after the goal was last relaxed, so the walked path can beat g(goal).
+        path = walk_parents(self._parent, self._start, self._goal)
+        cost = sum(costs[cell] for cell in path[1:])
+        floor = min((g[cell] + h[cell] for cell in self._pending()), default=INFINITY)
+        if cost <= floor:
+            bound = 1.0
+        else:
+            bound = min(self.epsilon, cost / floor) if floor > 0 else self.epsilon
+        self.done = bound <= 1.0
+        previous = self.solution
+        if previous is not None and cost >= previous.cost and bound >= previous.bound:
+            return
+        self.solutions.append(
+            AnytimeSolution(
+                path=path,
+                cost=cost,
+                bound=bound,
+                epsilon=self.epsilon,
+                expansions=self.expansions,
+            )
+        )
+
+    def _reopen(self) -> None:
+        """Merge INCONS into OPEN, clear CLOSED, and re-key OPEN for the lowered epsilon."""
+        pending = self._pending()
+        self._state = state = bytearray(len(self._state))
+        self._inconsistent = []
+        g, h, epsilon = self._g, self._h, self.epsilon
+        self._heap = [(g[cell] + epsilon * h[cell], next(self._tie_breaker), g[cell], cell) for cell in pending]
+        heapq.heapify(self._heap)
+        for cell in pending:
+            state[cell] = OPEN
+
+
+def ara_star_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+    epsilon: float = 3.0,
+    epsilon_step: float = 0.5,
+    deadline: float | None = None,
+    max_expansions: int | None = None,
+) -> SearchResult:
+    """Run ``ARAStarPlanner`` within the budget and return its best path; ``epsilon`` in metrics is the proven bound."""
+    planner = ARAStarPlanner(
+        graph,
+        divmod(start, graph.cols),
+        divmod(goal, graph.cols),
+        cost_map=cost_map,
+        epsilon=epsilon,
+        epsilon_step=epsilon_step,
+        trace=trace,
+    )
+    solution = planner.improve(deadline=deadline, max_expansions=max_expansions)
+    return SearchResult(
+        path=solution.path if solution is not None else [],
+        steps=planner.expansions,
+        visited=planner.expansions,
+        enqueued=planner.insertions,
+        peak_frontier=planner.peak_queue,
+        metrics={"epsilon": planner.bound, "solutions": len(planner.solutions)},
+    )
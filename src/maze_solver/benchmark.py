@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import argparse
+import inspect
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from maze_solver.algorithms import KERNEL_REGISTRY, SOLVER_REGISTRY, solve, solve_many
+from maze_solver.contraction import build_contraction_hierarchy
+from maze_solver.generation import BRAIDED_TOPOLOGY, generate_maze
+from maze_solver.graph import maze_graph
+from maze_solver.grid import default_goal, default_start
+
+BENCHMARK_MAZES: dict[str, dict[str, object]] = {
+    "braided": {"topology": BRAIDED_TOPOLOGY},
+    "open": {"topology": BRAIDED_TOPOLOGY, "wall_density": 0.0, "connectedness": 100, "branching_factor": 8},
+}
+DEFAULT_BENCHMARK_ALGORITHMS = ("A*", "Jump Point Search", "JPS+")
+WEIGHTED_BENCHMARK_ALGORITHMS = ("Dijkstra", "Dial's Algorithm")
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    maze: str
+    algorithm: str
+    seed: int
+    path_length: int
+    visited: int
+    enqueued: int
+    seconds: float
+
+
+def run_benchmark(
+    algorithms: Sequence[str] = DEFAULT_BENCHMARK_ALGORITHMS,
+    mazes: Iterable[str] = tuple(BENCHMARK_MAZES),
+    rows: int = 101,
+    cols: int = 101,
+    seeds: Iterable[int] = (1, 2, 3),
+    generation_algorithm: str = "Prim's",
+    max_cost: int | None = None,
+) -> list[BenchmarkResult]:
+    """Solve the same generated mazes with each algorithm and record expansions and wall time.
+
+    With ``max_cost`` every maze also gets a seeded random integer cost map in
+    ``[0, max_cost]`` that is passed to each solver as ``cost_map``.
+    """
+    for algorithm in algorithms:
+        if algorithm not in SOLVER_REGISTRY:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if max_cost is not None and not takes_cost_map(algorithm):
+            raise ValueError(f"{algorithm} does not take a cost map.")
+    results: list[BenchmarkResult] = []
+    for maze_name in mazes:
+        if maze_name not in BENCHMARK_MAZES:
+            raise ValueError(f"Unknown benchmark maze: {maze_name}")
+        for seed in seeds:
+            maze, _ = generate_maze(
+                rows, cols, generation_algorithm=generation_algorithm, seed=seed, **BENCHMARK_MAZES[maze_name]
+            )
+            start, goal = default_start(), default_goal(maze)
+            options = {}
+            if max_cost is not None:
+                options["cost_map"] = np.random.default_rng(seed).integers(0, max_cost + 1, size=maze.shape)
+            for algorithm in algorithms:
+                began = time.perf_counter()
+                result = solve(maze, start, goal, algorithm, **options)
+                results.append(
+                    BenchmarkResult(
+                        maze=maze_name,
+                        algorithm=algorithm,
+                        seed=seed,
+                        path_length=len(result.path),
+                        visited=result.visited,
+                        enqueued=result.enqueued,
+                        seconds=time.perf_counter() - began,
+                    )
+                )
+    return results
+
+
+def takes_cost_map(algorithm: str) -> bool:
+    kernel = KERNEL_REGISTRY.get(algorithm)
+    return kernel is not None and "cost_map" in inspect.signature(kernel).parameters
+
+
+@dataclass(frozen=True)
+class HierarchyBenchmarkResult:
+    maze: str
+    seed: int
+    nodes: int
+    shortcuts: int
+    hierarchy_bytes: int
+    preprocess_seconds: float
+    queries: int
+    query_seconds: float
+
+    @property
+    def queries_per_second(self) -> float:
+        return self.queries / self.query_seconds if self.query_seconds else 0.0
+
+
+def run_hierarchy_benchmark(
+    mazes: Iterable[str] = ("braided",),
+    rows: int = 101,
+    cols: int = 101,
+    seeds: Iterable[int] = (1,),
+    queries: int = 1000,
+    generation_algorithm: str = "Prim's",
+) -> list[HierarchyBenchmarkResult]:
+    """Build a contraction hierarchy per maze and time random start/goal distance queries against it."""
+    results: list[HierarchyBenchmarkResult] = []
+    for maze_name in mazes:
+        if maze_name not in BENCHMARK_MAZES:
+            raise ValueError(f"Unknown benchmark maze: {maze_name}")
+        for seed in seeds:
+            maze, _ = generate_maze(
+                rows, cols, generation_algorithm=generation_algorithm, seed=seed, **BENCHMARK_MAZES[maze_name]
+            )
+            graph = maze_graph(maze)
+            hierarchy = build_contraction_hierarchy(graph)
+            pairs = np.random.default_rng(seed).choice(graph.open_ids(), size=(queries, 2)).tolist()
+            began = time.perf_counter()
+            for start, goal in pairs:
+                hierarchy.distance(start, goal)
+            results.append(
+                HierarchyBenchmarkResult(
+                    maze=maze_name,
+                    seed=seed,
+                    nodes=hierarchy.junctions.node_count,
+                    shortcuts=hierarchy.shortcut_count,
+                    hierarchy_bytes=hierarchy.nbytes,
+                    preprocess_seconds=hierarchy.preprocess_seconds,
+                    queries=queries,
+                    query_seconds=time.perf_counter() - began,
+                )
+            )
+    return results
+
+
+def format_hierarchy_benchmark(results: Sequence[HierarchyBenchmarkResult]) -> str:
+    lines = [f"{'maze':<10} {'seed':>5} {'nodes':>9} {'shortcuts':>10} {'MiB':>8} {'build s':>9} {'queries/s':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.maze:<10} {result.seed:>5} {result.nodes:>9} {result.shortcuts:>10} "
+            f"{result.hierarchy_bytes / 2**20:>8.2f} {result.preprocess_seconds:>9.2f} {result.queries_per_second:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class BatchBenchmarkResult:
+    maze: str
+    algorithm: str
+    seed: int
+    queries: int
+    sources: int
+    trees: int
+    seconds: float
+
+    @property
+    def queries_per_second(self) -> float:
+        return self.queries / self.seconds if self.seconds else 0.0
+
+
+def run_batch_benchmark(
+    algorithms: Sequence[str] = ("BFS", "A*"),
+    mazes: Iterable[str] = ("braided",),
+    rows: int = 101,
+    cols: int = 101,
+    seeds: Iterable[int] = (1,),
+    queries: int = 1000,
+    sources: int = 10,
+    generation_algorithm: str = "Prim's",
+) -> list[BatchBenchmarkResult]:
+    """Time ``solve_many`` on random queries whose starts are drawn from ``sources`` cells."""
+    results: list[BatchBenchmarkResult] = []
+    for maze_name in mazes:
+        if maze_name not in BENCHMARK_MAZES:
+            raise ValueError(f"Unknown benchmark maze: {maze_name}")
+        for seed in seeds:
+            maze, _ = generate_maze(
+                rows, cols, generation_algorithm=generation_algorithm, seed=seed, **BENCHMARK_MAZES[maze_name]
+            )
+            graph = maze_graph(maze)
+            rng = np.random.default_rng(seed)
+            starts = rng.choice(rng.choice(graph.open_ids(), size=sources), size=queries)
+            goals = rng.choice(graph.open_ids(), size=queries)
+            pairs = np.stack([*np.divmod(starts, graph.cols), *np.divmod(goals, graph.cols)], axis=1).reshape(-1, 2, 2)
+            for algorithm in algorithms:
+                batch = solve_many(maze, pairs, algorithm)
+                results.append(
+                    BatchBenchmarkResult(
+                        maze=maze_name,
+                        algorithm=algorithm,
+                        seed=seed,
+                        queries=queries,
+                        sources=sources,
+                        trees=batch.trees,
+                        seconds=batch.seconds,
+                    )
+                )
+    return results
+
+
+def format_batch_benchmark(results: Sequence[BatchBenchmarkResult]) -> str:
+    lines = [f"{'maze':<10} {'algorithm':<28} {'seed':>5} {'queries':>8} {'trees':>6} {'s':>8} {'queries/s':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.maze:<10} {result.algorithm:<28} {result.seed:>5} {result.queries:>8} {result.trees:>6} "
+            f"{result.seconds:>8.2f} {result.queries_per_second:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def format_benchmark(results: Sequence[BenchmarkResult]) -> str:
+    """Average each (maze, algorithm) group; ``ratio`` compares visits to the first algorithm listed."""
+    groups: dict[tuple[str, str], list[BenchmarkResult]] = {}
+    for result in results:
+        groups.setdefault((result.maze, result.algorithm), []).append(result)
+
+    lines = [f"{'maze':<10} {'algorithm':<28} {'path':>7} {'visited':>10} {'enqueued':>10} {'ms':>9} {'ratio':>7}"]
+    baselines: dict[str, float] = {}
+    for (maze_name, algorithm), group in groups.items():
+        path = sum(result.path_length for result in group) / len(group)
+        visited = sum(result.visited for result in group) / len(group)
+        enqueued = sum(result.enqueued for result in group) / len(group)
+        milliseconds = 1000 * sum(result.seconds for result in group) / len(group)
+        baseline = baselines.setdefault(maze_name, visited)
+        ratio = visited / baseline if baseline else 0
+        lines.append(
+            f"{maze_name:<10} {algorithm:<28} {path:>7.0f} {visited:>10.0f} {enqueued:>10.0f} "
+            f"{milliseconds:>9.2f} {ratio:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare solver expansions and timings on generated mazes.")
+    parser.add_argument("--algorithms", nargs="+", default=None)
+    parser.add_argument("--mazes", nargs="+", choices=sorted(BENCHMARK_MAZES), default=list(BENCHMARK_MAZES))
+    parser.add_argument("--rows", type=int, default=101)
+    parser.add_argument("--cols", type=int, default=101)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--generator", default="Prim's")
+    parser.add_argument(
+        "--max-cost",
+        type=int,
+        default=None,
+        help="Give each maze a random integer cost map in [0, MAX_COST]; defaults the algorithms to "
+        + ", ".join(WEIGHTED_BENCHMARK_ALGORITHMS)
+        + ".",
+    )
+    parser.add_argument(
+        "--hierarchy-queries",
+        type=int,
+        default=0,
+        help="Instead of comparing solvers, time this many contraction hierarchy queries per maze.",
+    )
+    parser.add_argument(
+        "--batch-queries",
+        type=int,
+        default=0,
+        help="Instead of comparing single solves, time this many solve_many queries per maze and algorithm.",
+    )
+    parser.add_argument("--batch-sources", type=int, default=10, help="Distinct start cells among the batch queries.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.hierarchy_queries:
+        hierarchy_results = run_hierarchy_benchmark(
+            args.mazes, args.rows, args.cols, args.seeds, args.hierarchy_queries, args.generator
+        )
+        print(format_hierarchy_benchmark(hierarchy_results))
+        return
+    if args.batch_queries:
+        batch_results = run_batch_benchmark(
+            args.algorithms or ("BFS", "A*"),
+            args.mazes,
+            args.rows,
+            args.cols,
+            args.seeds,
+            args.batch_queries,
+            args.batch_sources,
+            args.generator,
+        )
+        print(format_batch_benchmark(batch_results))
+        return
+    algorithms = args.algorithms or (
+        WEIGHTED_BENCHMARK_ALGORITHMS if args.max_cost is not None else DEFAULT_BENCHMARK_ALGORITHMS
+    )
+    results = run_benchmark(algorithms, args.mazes, args.rows, args.cols, args.seeds, args.generator, args.max_cost)
+    print(format_benchmark(results))
+
+
+if __name__ == "__main__":
+    main()
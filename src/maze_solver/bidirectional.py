@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from itertools import count
+
+import numpy as np
+
+from maze_solver.graph import MazeGraph
+from maze_solver.search import ENQUEUE, NO_PARENT, VISIT, EventLog, SearchResult, entry_costs, walk_parents
+
+INFINITY = float("inf")
+FORWARD, BACKWARD = 0, 1
+
+
+def _manhattan_costs(graph: MazeGraph, target: int, scale: float) -> array:
+    row, col = np.divmod(np.arange(graph.size), graph.cols)
+    target_row, target_col = divmod(target, graph.cols)
+    return array("d", (scale * (np.abs(row - target_row) + np.abs(col - target_col))).astype(np.float64).tobytes())
+
+
+def _bidirectional_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None,
+    cost_map: np.ndarray | None,
+    meet_in_the_middle: bool,
+) -> SearchResult:
+    """Weighted search from both ends that stops once no unexpanded pair can beat the best meeting ``mu``.
+
+    Moving into a cell costs its entry cost, so the forward side pays the
+    neighbor's cost and the backward side pays the cost of the cell it expands.
+    Without ``meet_in_the_middle`` each side is Dijkstra keyed by ``g``; the
+    side with fewer open cells expands next and the search stops when
+    ``mu <= top_f + top_b``. With it, each side is keyed by MM's
+    ``max(g + h, 2g)`` using Manhattan distance to the opposite end scaled by
+    the cheapest cell; the side holding the smaller priority ``C`` expands and
+    the search stops when ``mu <= max(C, gmin_f + gmin_b + epsilon)``.
+    """
+    costs, cheapest = entry_costs(graph, cost_map)
+    if start == goal:
+        if trace is not None:
+            trace.record(VISIT, start, 1)
+        return SearchResult(
+            path=[start],
+            steps=1,
+            visited=1,
+            peak_frontier=1,
+            metrics={"forward_expansions": 1, "backward_expansions": 0},
+        )
+
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    if meet_in_the_middle:
+        heuristics = (_manhattan_costs(graph, goal, cheapest), _manhattan_costs(graph, start, cheapest))
+    else:
+        heuristics = None
+    distances = (array("d", [INFINITY]) * graph.size, array("d", [INFINITY]) * graph.size)
+    parents = (array("i", [NO_PARENT]) * graph.size, array("i", [NO_PARENT]) * graph.size)
+    closed = (bytearray(graph.size), bytearray(graph.size))
+    tie_breaker = count()
+    heaps: tuple[list[tuple[float, int, float, int]], ...] = ([], [])
+    g_heaps: tuple[list[tuple[float, int]], ...] = ([], [])
+    open_counts = [1, 1]
+    expansions = [0, 0]
+    for side, origin in ((FORWARD, start), (BACKWARD, goal)):
+        distances[side][origin] = 0.0
+        priority = heuristics[side][origin] if heuristics is not None else 0.0
+        heaps[side].append((priority, next(tie_breaker), 0.0, origin))
+        g_heaps[side].append((0.0, origin))
+    best, meeting = INFINITY, NO_PARENT
+    steps = enqueued = 0
+    peak_frontier = 2
+
+    def top(side: int) -> float:
+        heap, distance, done = heaps[side], distances[side], closed[side]
+        while heap and (done[heap[0][3]] or heap[0][2] != distance[heap[0][3]]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else INFINITY
+
+    def least_g(side: int) -> float:
+        heap, distance, done = g_heaps[side], distances[side], closed[side]
+        while heap and (done[heap[0][1]] or heap[0][0] != distance[heap[0][1]]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else INFINITY
+
+    while open_counts[FORWARD] and open_counts[BACKWARD]:
+        top_f, top_b = top(FORWARD), top(BACKWARD)
+        if meet_in_the_middle:
+            lower = min(top_f, top_b)
+            if best <= max(lower, least_g(FORWARD) + least_g(BACKWARD) + cheapest):
+                break
+            if top_f != top_b:
+                side = FORWARD if top_f < top_b else BACKWARD
+            else:
+                side = FORWARD if open_counts[FORWARD] <= open_counts[BACKWARD] else BACKWARD
+        else:
+            if best <= top_f + top_b:
+                break
+            side = FORWARD if open_counts[FORWARD] <= open_counts[BACKWARD] else BACKWARD
+
+        _, _, current_g, current = heapq.heappop(heaps[side])
+        distance, other, parent, done = distances[side], distances[1 - side], parents[side], closed[side]
+        done[current] = 1
+        open_counts[side] -= 1
+        expansions[side] += 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        backward_cost = costs[current] if side == BACKWARD else 0.0
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            candidate = current_g + (backward_cost if side == BACKWARD else costs[neighbor])
+            if candidate >= distance[neighbor]:
+                continue
+            if distance[neighbor] == INFINITY:
+                open_counts[side] += 1
+            distance[neighbor] = candidate
+            parent[neighbor] = current
+            if heuristics is not None:
+                priority = max(candidate + heuristics[side][neighbor], 2 * candidate)
+                heapq.heappush(g_heaps[side], (candidate, neighbor))
+            else:
+                priority = candidate
+            heapq.heappush(heaps[side], (priority, next(tie_breaker), candidate, neighbor))
+            enqueued += 1
+            if record is not None:
+                record(ENQUEUE, neighbor, steps)
+            if candidate + other[neighbor] < best:
+                best, meeting = candidate + other[neighbor], neighbor
+        frontier = open_counts[FORWARD] + open_counts[BACKWARD]
+        if frontier > peak_frontier:
+            peak_frontier = frontier
+
+    path: list[int] = []
+    if meeting != NO_PARENT:
+        path = walk_parents(parents[FORWARD], start, meeting)
+        path += reversed(walk_parents(parents[BACKWARD], goal, meeting)[:-1])
+    return SearchResult(
+        path=path,
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"forward_expansions": expansions[FORWARD], "backward_expansions": expansions[BACKWARD]},
+    )
+
+
+def bidirectional_dijkstra_search(
+    graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None, cost_map: np.ndarray | None = None
+) -> SearchResult:
+    return _bidirectional_search(graph, start, goal, trace, cost_map, meet_in_the_middle=False)
+
+
+def mm_search(
+    graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None, cost_map: np.ndarray | None = None
+) -> SearchResult:
+    """MM bidirectional heuristic search (Holte et al.), which never expands a node past half the optimal cost."""
+    return _bidirectional_search(graph, start, goal, trace, cost_map, meet_in_the_middle=True)
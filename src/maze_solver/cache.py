@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class FingerprintCache(Generic[T]):
+    """Thread-safe LRU of per-maze preprocessing results keyed by maze fingerprint.
+
+    ``hits`` and ``misses`` count lookups over the cache's lifetime so solvers can
+    report whether a query reused earlier preprocessing.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[object, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: object, build: Callable[[], T]) -> tuple[T, bool]:
+        """Return ``(value, hit)``, calling ``build`` outside the lock on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value, True
+            self.misses += 1
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._evict()
+        return value, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class ByteBoundedCache(FingerprintCache[T]):
+    """``FingerprintCache`` that also evicts least recently used entries while their ``nbytes`` exceed ``max_bytes``.
+
+    A value larger than the whole budget is returned to its caller but not kept.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = 1024) -> None:
+        super().__init__(max_entries)
+        self.max_bytes = max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return self._nbytes()
+
+    def _nbytes(self) -> int:
+        return sum(value.nbytes for value in self._entries.values())
+
+    def _evict(self) -> None:
+        super()._evict()
+        total = self._nbytes()
+        while total > self.max_bytes:
+            _key, value = self._entries.popitem(last=False)
+            total -= value.nbytes
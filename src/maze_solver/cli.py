@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import argparse
 
-from maze_solver import gui, tui, web_server
+from maze_solver import benchmark, gui, tui, web_server
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="maze_solver", description="Maze Solver command line entrypoint.")
-    parser.add_argument("command", nargs="?", choices=("gui", "tui", "web", "catalog"), default="gui")
+    parser.add_argument("command", nargs="?", choices=("gui", "tui", "web", "catalog", "bench"), default="gui")
     args, remainder = parser.parse_known_args(argv)
     args.args = remainder
     return args
@@ -29,6 +29,8 @@ def main(argv: list[str] | None = None) -> None:
         web_server.main(_clean_remainder(args.args))
     elif command == "catalog":
         tui.main(["--catalog", *_clean_remainder(args.args)])
+    elif command == "bench":
+        benchmark.main(_clean_remainder(args.args))
     else:
         raise SystemExit(f"Unknown command: {command}")
 
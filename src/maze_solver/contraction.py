@@ -0,0 +1,734 @@
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import time
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from maze_solver.cache import FingerprintCache
+from maze_solver.frontier import DEFAULT_FRONTIER, Frontier, make_frontier
+from maze_solver.graph import MazeGraph
+from maze_solver.search import ENQUEUE, VISIT, EventLog, SearchResult, bfs_search
+
+CONTRACTION_CACHE_SIZE = 4
+WITNESS_SETTLE_LIMIT = 30
+# Maze graphs are near-planar, so the dense top of the hierarchy grows with sqrt(nodes).
+CORE_SIZE_SCALE = 2.6
+CORE_SIZE_LIMIT = 2048
+CORE_UNREACHABLE = np.iinfo(np.int32).max // 2
+INFINITY = float("inf")
+
+
+@dataclass(frozen=True, eq=False)
+class JunctionGraph:
+    """Maze graph with every corridor (run of degree-2 cells) collapsed into one weighted edge.
+
+    Nodes are the open cells whose degree is not 2. Corridor ``k`` runs from
+    node ``corridor_ends[k, 0]`` to ``corridor_ends[k, 1]``; its interior cells
+    are ``corridor_cells[corridor_offsets[k]:corridor_offsets[k + 1]]`` in that
+    order, and each interior cell stores its corridor and 1-based offset.
+    """
+
+    rows: int
+    cols: int
+    fingerprint: str
+    nodes: np.ndarray
+    node_index: np.ndarray
+    corridor_of: np.ndarray
+    corridor_position: np.ndarray
+    corridor_ends: np.ndarray
+    corridor_lengths: np.ndarray
+    corridor_offsets: np.ndarray
+    corridor_cells: np.ndarray
+    edge_sources: np.ndarray
+    edge_targets: np.ndarray
+    edge_weights: np.ndarray
+    edge_corridors: np.ndarray
+
+    @property
+    def node_count(self) -> int:
+        return int(self.nodes.size)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.edge_sources.size)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(int(value.nbytes) for value in self.__dict__.values() if isinstance(value, np.ndarray))
+
+    @cached_property
+    def _adjacency(self) -> tuple[list[tuple[int, int, int, int, int]], ...]:
+        """Per node, ``(neighbor, weight, corridor, from_position, to_position)`` for each kept edge."""
+        adjacency: tuple[list[tuple[int, int, int, int, int]], ...] = tuple([] for _ in range(self.node_count))
+        lengths, ends = self.corridor_lengths.tolist(), self.corridor_ends.tolist()
+        for source, target, weight, corridor in zip(
+            self.edge_sources.tolist(),
+            self.edge_targets.tolist(),
+            self.edge_weights.tolist(),
+            self.edge_corridors.tolist(),
+            strict=True,
+        ):
+            length = lengths[corridor] if corridor >= 0 else 1
+            forward = corridor < 0 or ends[corridor][0] == source
+            adjacency[source].append((target, weight, corridor, *((0, length) if forward else (length, 0))))
+            adjacency[target].append((source, weight, corridor, *((length, 0) if forward else (0, length))))
+        return adjacency
+
+    def seeds(self, cell_id: int) -> list[tuple[int, int, int]]:
+        """Junction nodes reachable from ``cell_id`` without passing another node.
+
+        Returns ``(node, distance, end)`` triples where ``end`` is 0/1 for the
+        corridor end walked to, or -1 when the cell is itself a node.
+        """
+        node = int(self.node_index[cell_id])
+        if node >= 0:
+            return [(node, 0, -1)]
+        corridor = int(self.corridor_of[cell_id])
+        if corridor < 0:
+            return []
+        position = int(self.corridor_position[cell_id])
+        first, last = self.corridor_ends[corridor].tolist()
+        return [(first, position, 0), (last, int(self.corridor_lengths[corridor]) - position, 1)]
+
+    def corridor_run(self, corridor: int, start_position: int, stop_position: int) -> list[int]:
+        """Cells from ``start_position`` to ``stop_position`` (inclusive) along a corridor.
+
+        Position 0 is the corridor's first end node and ``corridor_lengths[k]`` its last.
+        """
+        first, last = self.corridor_ends[corridor].tolist()
+        interior = self.corridor_cells[self.corridor_offsets[corridor] : self.corridor_offsets[corridor + 1]]
+        cells = [int(self.nodes[first]), *interior.tolist(), int(self.nodes[last])]
+        if start_position <= stop_position:
+            return cells[start_position : stop_position + 1]
+        return cells[stop_position : start_position + 1][::-1]
+
+
+def build_junction_graph(graph: MazeGraph) -> JunctionGraph:
+    """Walk each corridor once from its end nodes and keep the shortest edge per node pair."""
+    mask, moves = graph.mask_bytes, graph.steps
+    nodes = np.flatnonzero(graph.passable & (graph.degree != 2)).astype(np.int32)
+    node_index = np.full(graph.size, -1, dtype=np.int32)
+    node_index[nodes] = np.arange(nodes.size, dtype=np.int32)
+    index = node_index.tolist()
+    corridor_of = [-1] * graph.size
+    corridor_position = [0] * graph.size
+    corridor_ends: list[tuple[int, int]] = []
+    corridor_lengths: list[int] = []
+    corridor_offsets = [0]
+    corridor_cells: list[int] = []
+    best_edge: dict[tuple[int, int], tuple[int, int]] = {}
+
+    def add_edge(a: int, b: int, weight: int, corridor: int) -> None:
+        if a == b:
+            return
+        key = (a, b) if a < b else (b, a)
+        current = best_edge.get(key)
+        if current is None or weight < current[0]:
+            best_edge[key] = (weight, corridor)
+
+    for source_cell in nodes.tolist():
+        source = index[source_cell]
+        for delta in moves[mask[source_cell]]:
+            cell = source_cell + delta
+            if index[cell] >= 0:
+                if source < index[cell]:
+                    add_edge(source, index[cell], 1, -1)
+                continue
+            if corridor_of[cell] >= 0:
+                continue
+            corridor = len(corridor_lengths)
+            previous, length = source_cell, 1
+            while index[cell] < 0:
+                corridor_of[cell] = corridor
+                corridor_position[cell] = length
+                corridor_cells.append(cell)
+                step_a, step_b = moves[mask[cell]]
+                previous, cell = cell, cell + (step_b if cell + step_a == previous else step_a)
+                length += 1
+            corridor_ends.append((source, index[cell]))
+            corridor_lengths.append(length)
+            corridor_offsets.append(len(corridor_cells))
+            add_edge(source, index[cell], length, corridor)
+
+    keys = list(best_edge)
+    values = list(best_edge.values())
+    return JunctionGraph(
+        rows=graph.rows,
+        cols=graph.cols,
+        fingerprint=graph.fingerprint,
+        nodes=nodes,
+        node_index=node_index,
+        corridor_of=np.asarray(corridor_of, dtype=np.int32),
+        corridor_position=np.asarray(corridor_position, dtype=np.int32),
+        corridor_ends=np.asarray(corridor_ends, dtype=np.int32).reshape(-1, 2),
+        corridor_lengths=np.asarray(corridor_lengths, dtype=np.int32),
+        corridor_offsets=np.asarray(corridor_offsets, dtype=np.int32),
+        corridor_cells=np.asarray(corridor_cells, dtype=np.int32),
+        edge_sources=np.asarray([key[0] for key in keys], dtype=np.int32),
+        edge_targets=np.asarray([key[1] for key in keys], dtype=np.int32),
+        edge_weights=np.asarray([value[0] for value in values], dtype=np.int32),
+        edge_corridors=np.asarray([value[1] for value in values], dtype=np.int32),
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class ContractionHierarchy:
+    """Contraction hierarchy over a ``JunctionGraph``.
+
+    Every node keeps only its edges to higher-ranked nodes in a CSR upward graph.
+    ``up_middles`` holds the contracted node a shortcut bypasses (-1 for
+    original edges), ``up_halves`` the slots of its middle-to-owner and
+    middle-to-target edges, and ``up_corridors`` the corridor an original edge
+    follows (-1 for shortcuts and directly adjacent nodes).
+
+    The highest-ranked ``core_nodes`` are not searched at query time: their
+    all-pairs distances sit in ``core_distances`` and ``core_via`` holds the
+    intermediate core node of each entry (-1 for a direct hierarchy edge).
+    """
+
+    junctions: JunctionGraph
+    rank: np.ndarray
+    up_offsets: np.ndarray
+    up_targets: np.ndarray
+    up_weights: np.ndarray
+    up_middles: np.ndarray
+    up_halves: np.ndarray
+    up_corridors: np.ndarray
+    core_nodes: np.ndarray
+    core_distances: np.ndarray
+    core_via: np.ndarray
+    shortcut_count: int
+    preprocess_seconds: float
+
+    @property
+    def fingerprint(self) -> str:
+        return self.junctions.fingerprint
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [value for value in self.__dict__.values() if isinstance(value, np.ndarray)]
+        return self.junctions.nbytes + sum(int(array.nbytes) for array in arrays)
+
+    @cached_property
+    def _upward(self) -> tuple[list[int], list[int], list[int]]:
+        return self.up_offsets.tolist(), self.up_targets.tolist(), self.up_weights.tolist()
+
+    @cached_property
+    def _core_index(self) -> list[int]:
+        index = np.full(self.junctions.node_count, -1, dtype=np.int32)
+        index[self.core_nodes] = np.arange(self.core_nodes.size, dtype=np.int32)
+        return index.tolist()
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "preprocess_seconds": round(self.preprocess_seconds, 4),
+            "hierarchy_nodes": self.junctions.node_count,
+            "hierarchy_edges": int(self.up_targets.size),
+            "shortcuts": self.shortcut_count,
+            "core_nodes": int(self.core_nodes.size),
+            "hierarchy_bytes": self.nbytes,
+        }
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the hierarchy and its junction graph to a compressed ``.npz`` file."""
+        junctions = self.junctions
+        arrays = {
+            f"junctions_{name}": value for name, value in junctions.__dict__.items() if isinstance(value, np.ndarray)
+        }
+        arrays.update({name: value for name, value in self.__dict__.items() if isinstance(value, np.ndarray)})
+        np.savez_compressed(
+            path,
+            shape=np.array([junctions.rows, junctions.cols], dtype=np.int64),
+            fingerprint=np.array(junctions.fingerprint),
+            shortcut_count=np.array(self.shortcut_count, dtype=np.int64),
+            preprocess_seconds=np.array(self.preprocess_seconds),
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], graph: MazeGraph | None = None) -> ContractionHierarchy:
+        """Read a hierarchy written by ``save``; raises ``ValueError`` if it belongs to another maze."""
+        with np.load(path) as data:
+            fingerprint = str(data["fingerprint"])
+            if graph is not None and graph.fingerprint != fingerprint:
+                raise ValueError("Contraction hierarchy file was built for a different maze.")
+            rows, cols = (int(value) for value in data["shape"])
+            junction_arrays = {
+                name.removeprefix("junctions_"): data[name] for name in data.files if name.startswith("junctions_")
+            }
+            scalars = {"shape", "fingerprint", "shortcut_count", "preprocess_seconds"}
+            arrays = {
+                name: data[name] for name in data.files if not name.startswith("junctions_") and name not in scalars
+            }
+            return cls(
+                junctions=JunctionGraph(rows=rows, cols=cols, fingerprint=fingerprint, **junction_arrays),
+                shortcut_count=int(data["shortcut_count"]),
+                preprocess_seconds=float(data["preprocess_seconds"]),
+                **arrays,
+            )
+
+    def distance(self, start: int, goal: int) -> int:
+        """Shortest-path length in steps between two cell ids, or -1 if unreachable."""
+        best, *_ = self._query(start, goal)
+        return -1 if best == INFINITY else int(best)
+
+    def route(self, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+        """Upward searches from both ends, joined below or through the core, unpacked into a cell path."""
+        best, meeting, searches, settled, enqueued, peak = self._query(start, goal, trace)
+        if best == INFINITY:
+            path: list[int] = []
+        elif start == goal:
+            path = [start]
+        elif meeting is None:
+            junctions = self.junctions
+            corridor = int(junctions.corridor_of[start])
+            path = junctions.corridor_run(
+                corridor, int(junctions.corridor_position[start]), int(junctions.corridor_position[goal])
+            )
+        else:
+            forward_node, backward_node = meeting
+            forward = self._unwind(start, forward_node, searches[0][1])[::-1]
+            backward = self._unwind(goal, backward_node, searches[1][1])
+            middle = self._core_route(forward_node, backward_node) if forward_node != backward_node else []
+            path = forward + middle[1:] + backward[1:]
+        return SearchResult(path=path, steps=settled, visited=settled, enqueued=enqueued, peak_frontier=peak)
+
+    def _query(self, start: int, goal: int, trace: EventLog | None = None):
+        junctions = self.junctions
+        best: float = INFINITY
+        meeting: tuple[int, int] | None = None
+        corridor = int(junctions.corridor_of[start])
+        if start == goal:
+            best = 0
+        elif corridor >= 0 and corridor == int(junctions.corridor_of[goal]):
+            best = abs(int(junctions.corridor_position[start]) - int(junctions.corridor_position[goal]))
+
+        counters = [0, 0, 0]
+        searches = (self._upward_search(start, trace, counters), self._upward_search(goal, trace, counters))
+        (forward, _forward_parents, forward_core), (backward, _backward_parents, backward_core) = searches
+        smaller, larger = (forward, backward) if len(forward) <= len(backward) else (backward, forward)
+        for node, distance in smaller.items():
+            other = larger.get(node)
+            if other is not None and distance + other < best:
+                best = distance + other
+                meeting = (node, node)
+        if forward_core and backward_core:
+            rows = np.fromiter(forward_core, dtype=np.intp, count=len(forward_core))
+            cols = np.fromiter(backward_core, dtype=np.intp, count=len(backward_core))
+            totals = self.core_distances[rows[:, None], cols].astype(np.int64)
+            totals += np.fromiter(forward_core.values(), dtype=np.int64, count=rows.size)[:, None]
+            totals += np.fromiter(backward_core.values(), dtype=np.int64, count=cols.size)
+            row, col = np.unravel_index(int(totals.argmin()), totals.shape)
+            if self.core_distances[rows[row], cols[col]] < CORE_UNREACHABLE and totals[row, col] < best:
+                best = int(totals[row, col])
+                core_nodes = self.core_nodes
+                meeting = (int(core_nodes[rows[row]]), int(core_nodes[cols[col]]))
+        settled, enqueued, peak = counters
+        return best, meeting, searches, settled, enqueued, peak
+
+    def _upward_search(self, cell: int, trace: EventLog | None, counters: list[int]):
+        """Dijkstra over upward edges from ``cell`` that stops at core nodes instead of expanding them.
+
+        Returns distances and parents for every reached node plus the distance
+        to each reached core node keyed by its core index.
+        """
+        offsets, targets, weights = self._upward
+        core_index = self._core_index
+        nodes = self.junctions.nodes
+        record = trace.record if trace is not None else None
+        distances: dict[int, int] = {}
+        parents: dict[int, tuple[int, int]] = {}
+        heap: list[tuple[int, int]] = []
+        for node, distance, end in self.junctions.seeds(cell):
+            if distance < distances.get(node, INFINITY):
+                distances[node] = distance
+                parents[node] = (-1, end)
+                heapq.heappush(heap, (distance, node))
+        core: dict[int, int] = {}
+        settled, enqueued, peak = counters
+        peak = max(peak, len(heap))
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            settled += 1
+            if record is not None:
+                record(VISIT, int(nodes[node]), settled)
+            if core_index[node] >= 0:
+                core[core_index[node]] = distance
+                continue
+            edges = range(offsets[node], offsets[node + 1])
+            # Stall-on-demand: a higher neighbor already reached more cheaply proves this
+            # distance is not shortest, so its upward edges cannot lead to the optimum.
+            if any(distances.get(targets[slot], INFINITY) + weights[slot] < distance for slot in edges):
+                continue
+            for slot in edges:
+                neighbor = targets[slot]
+                candidate = distance + weights[slot]
+                if candidate < distances.get(neighbor, INFINITY):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = (node, slot)
+                    heapq.heappush(heap, (candidate, neighbor))
+                    enqueued += 1
+                    if record is not None:
+                        record(ENQUEUE, int(nodes[neighbor]), settled)
+            peak = max(peak, len(heap))
+        counters[:] = settled, enqueued, peak
+        return distances, parents, core
+
+    def _unwind(self, cell: int, node: int, parents: dict[int, tuple[int, int]]) -> list[int]:
+        """Cells from ``node`` back down the upward-search tree to ``cell``."""
+        cells = [int(self.junctions.nodes[node])]
+        while True:
+            previous, slot = parents[node]
+            if previous < 0:
+                cells.extend(self._seed_run(cell, node, slot)[1:])
+                return cells
+            cells.extend(self._unpack(node, previous, slot)[1:])
+            node = previous
+
+    def _core_route(self, source: int, target: int) -> list[int]:
+        """Cells from core node ``source`` to core node ``target`` following ``core_via``."""
+        core_index, core_nodes, via = self._core_index, self.core_nodes, self.core_via
+        cells = [int(self.junctions.nodes[source])]
+        stack = [(core_index[source], core_index[target])]
+        while stack:
+            first, second = stack.pop()
+            middle = int(via[first, second])
+            if middle >= 0:
+                stack.append((middle, second))
+                stack.append((first, middle))
+                continue
+            a, b = int(core_nodes[first]), int(core_nodes[second])
+            owner, other = (a, b) if self.rank[a] < self.rank[b] else (b, a)
+            cells.extend(self._unpack(a, b, self._slot(owner, other))[1:])
+        return cells
+
+    def _seed_run(self, cell: int, node: int, end: int) -> list[int]:
+        """Cells from seed ``node`` back along its corridor to ``cell``."""
+        if end < 0:
+            return [cell]
+        junctions = self.junctions
+        corridor = int(junctions.corridor_of[cell])
+        node_position = 0 if end == 0 else int(junctions.corridor_lengths[corridor])
+        return junctions.corridor_run(corridor, node_position, int(junctions.corridor_position[cell]))
+
+    def _slot(self, owner: int, target: int) -> int:
+        offsets, targets, _weights = self._upward
+        for slot in range(offsets[owner], offsets[owner + 1]):
+            if targets[slot] == target:
+                return slot
+        raise ValueError(f"No hierarchy edge between nodes {owner} and {target}.")
+
+    def _unpack(self, source: int, target: int, slot: int) -> list[int]:
+        """Cells from node ``source`` to node ``target`` along hierarchy edge ``slot``."""
+        junctions = self.junctions
+        nodes, ends, offsets, interiors = (
+            junctions.nodes,
+            junctions.corridor_ends,
+            junctions.corridor_offsets,
+            junctions.corridor_cells,
+        )
+        targets, middles, halves, corridors = self.up_targets, self.up_middles, self.up_halves, self.up_corridors
+        cells = [int(nodes[source])]
+        stack = [(source, target, slot)]
+        while stack:
+            first, second, current = stack.pop()
+            middle = int(middles[current])
+            if middle >= 0:
+                to_owner, to_target = halves[current].tolist()
+                first_half, second_half = (to_owner, to_target) if targets[current] == second else (to_target, to_owner)
+                stack.append((middle, second, second_half))
+                stack.append((first, middle, first_half))
+                continue
+            corridor = int(corridors[current])
+            if corridor >= 0:
+                interior = interiors[offsets[corridor] : offsets[corridor + 1]].tolist()
+                cells.extend(interior if ends[corridor, 0] == first else reversed(interior))
+            cells.append(int(nodes[second]))
+        return cells
+
+
+def build_core_table(
+    rank: np.ndarray, up_offsets: np.ndarray, up_targets: np.ndarray, up_weights: np.ndarray, size: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """All-pairs distances among the ``size`` highest-ranked nodes by vectorized Floyd-Warshall.
+
+    Contraction preserves distances between the nodes that remain, so the upward
+    edges among core nodes are enough. Returns ``(core_nodes, distances, via)``.
+    """
+    node_count = rank.size
+    core_nodes = np.argsort(rank)[node_count - size :].astype(np.int32)
+    core_index = np.full(node_count, -1, dtype=np.int32)
+    core_index[core_nodes] = np.arange(size, dtype=np.int32)
+    owners = np.repeat(np.arange(node_count), np.diff(up_offsets))
+    inside = core_index[owners] >= 0
+    first, second = core_index[owners[inside]], core_index[up_targets[inside]]
+
+    distances = np.full((size, size), CORE_UNREACHABLE, dtype=np.int32)
+    distances[first, second] = up_weights[inside]
+    distances[second, first] = up_weights[inside]
+    np.fill_diagonal(distances, 0)
+    via = np.full((size, size), -1, dtype=np.int16 if size <= np.iinfo(np.int16).max else np.int32)
+    through = np.empty_like(distances)
+    better = np.empty(distances.shape, dtype=bool)
+    for middle in range(size):
+        np.add(distances[:, middle, None], distances[None, middle, :], out=through)
+        np.less(through, distances, out=better)
+        np.copyto(via, middle, where=better)
+        np.minimum(distances, through, out=distances)
+    return core_nodes, distances, via
+
+
+def build_contraction_hierarchy(graph: MazeGraph, core_size: int | None = None) -> ContractionHierarchy:
+    """Contract junction-graph nodes in edge-difference order, adding shortcuts as needed.
+
+    A node's priority is the shortcuts its contraction would add minus the edges
+    it removes, plus how many of its neighbors are already contracted to keep
+    the order spatially uniform. Priorities are refreshed lazily when popped,
+    and witness searches are capped at ``WITNESS_SETTLE_LIMIT`` settled nodes.
+    The last ``core_size`` nodes (by default ``CORE_SIZE_SCALE * sqrt(nodes)``,
+    at most ``CORE_SIZE_LIMIT``) get a distance table instead of being searched.
+    """
+    began = time.perf_counter()
+    junctions = build_junction_graph(graph)
+    node_count = junctions.node_count
+    adjacency: list[dict[int, tuple[int, int, int]]] = [{} for _ in range(node_count)]
+    for source, target, weight, corridor in zip(
+        junctions.edge_sources.tolist(),
+        junctions.edge_targets.tolist(),
+        junctions.edge_weights.tolist(),
+        junctions.edge_corridors.tolist(),
+        strict=True,
+    ):
+        edge = (weight, -1, corridor)
+        adjacency[source][target] = edge
+        adjacency[target][source] = edge
+
+    def witness_distances(source: int, excluded: int, limit: int, targets: set[int]) -> dict[int, int]:
+        distances = {source: 0}
+        heap = [(0, source)]
+        remaining = len(targets)
+        settled = 0
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            if distance > limit or settled >= WITNESS_SETTLE_LIMIT:
+                break
+            settled += 1
+            if node in targets:
+                remaining -= 1
+                if not remaining:
+                    break
+            for neighbor, (weight, _middle, _corridor) in adjacency[node].items():
+                if neighbor == excluded:
+                    continue
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, INFINITY):
+                    distances[neighbor] = candidate
+                    heapq.heappush(heap, (candidate, neighbor))
+        return distances
+
+    def shortcuts_for(node: int) -> list[tuple[int, int, int]]:
+        neighbors = [(neighbor, edge[0]) for neighbor, edge in adjacency[node].items()]
+        shortcuts = []
+        for position, (source, source_weight) in enumerate(neighbors[:-1]):
+            rest = neighbors[position + 1 :]
+            limit = source_weight + max(weight for _target, weight in rest)
+            distances = witness_distances(source, node, limit, {target for target, _weight in rest})
+            for target, target_weight in rest:
+                if distances.get(target, INFINITY) > source_weight + target_weight:
+                    shortcuts.append((source, target, source_weight + target_weight))
+        return shortcuts
+
+    deleted = [0] * node_count
+    heap = [(len(shortcuts_for(node)) - len(adjacency[node]), node) for node in range(node_count)]
+    heapq.heapify(heap)
+    rank = np.zeros(node_count, dtype=np.int32)
+    upward: list[list[tuple[int, int, int, int]]] = [[] for _ in range(node_count)]
+    shortcut_count = 0
+    order = 0
+    while heap:
+        _priority, node = heapq.heappop(heap)
+        shortcuts = shortcuts_for(node)
+        priority = len(shortcuts) - len(adjacency[node]) + deleted[node]
+        if heap and priority > heap[0][0]:
+            heapq.heappush(heap, (priority, node))
+            continue
+        rank[node] = order
+        order += 1
+        upward[node] = [(neighbor, *edge) for neighbor, edge in adjacency[node].items()]
+        for neighbor in adjacency[node]:
+            del adjacency[neighbor][node]
+            deleted[neighbor] += 1
+        adjacency[node] = {}
+        for source, target, weight in shortcuts:
+            current = adjacency[source].get(target)
+            if current is None or weight < current[0]:
+                edge = (weight, node, -1)
+                adjacency[source][target] = edge
+                adjacency[target][source] = edge
+                shortcut_count += 1
+
+    degrees = np.fromiter((len(edges) for edges in upward), dtype=np.int32, count=node_count)
+    up_offsets = np.zeros(node_count + 1, dtype=np.int32)
+    np.cumsum(degrees, out=up_offsets[1:])
+    flat = [edge for edges in upward for edge in edges]
+    columns = np.asarray(flat, dtype=np.int32).reshape(-1, 4)
+    up_targets, up_weights = np.ascontiguousarray(columns[:, 0]), np.ascontiguousarray(columns[:, 1])
+    up_middles = np.ascontiguousarray(columns[:, 2])
+    owners = np.repeat(np.arange(node_count, dtype=np.int64), degrees)
+    keys = owners * node_count + up_targets
+    order = np.argsort(keys)
+    shortcut = up_middles >= 0
+    up_halves = np.full((up_targets.size, 2), -1, dtype=np.int32)
+    for half, ends in enumerate((owners[shortcut], up_targets[shortcut])):
+        lookup = up_middles[shortcut].astype(np.int64) * node_count + ends
+        up_halves[shortcut, half] = order[np.searchsorted(keys, lookup, sorter=order)]
+    if core_size is None:
+        core_size = min(CORE_SIZE_LIMIT, int(CORE_SIZE_SCALE * math.sqrt(node_count)))
+    core_nodes, core_distances, core_via = build_core_table(
+        rank, up_offsets, up_targets, up_weights, min(core_size, node_count)
+    )
+    return ContractionHierarchy(
+        junctions=junctions,
+        rank=rank,
+        up_offsets=up_offsets,
+        up_targets=up_targets,
+        up_weights=up_weights,
+        up_middles=up_middles,
+        up_halves=up_halves,
+        up_corridors=np.ascontiguousarray(columns[:, 3]),
+        core_nodes=core_nodes,
+        core_distances=core_distances,
+        core_via=core_via,
+        shortcut_count=shortcut_count,
+        preprocess_seconds=time.perf_counter() - began,
+    )
+
+
+CONTRACTION_CACHE: FingerprintCache[ContractionHierarchy] = FingerprintCache(CONTRACTION_CACHE_SIZE)
+JUNCTION_CACHE: FingerprintCache[JunctionGraph] = FingerprintCache(CONTRACTION_CACHE_SIZE)
+
+
+def contraction_hierarchy(graph: MazeGraph) -> ContractionHierarchy:
+    """Return the cached hierarchy for ``graph``, building it on first use."""
+    hierarchy, _hit = CONTRACTION_CACHE.get(graph.fingerprint, lambda: build_contraction_hierarchy(graph))
+    return hierarchy
+
+
+def contraction_hierarchy_search(
+    graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None
+) -> SearchResult:
+    """Solver-registry query: cached hierarchy plus a bidirectional upward search.
+
+    Cells outside any junction corridor (isolated loops) fall back to BFS.
+    """
+    hierarchy, hit = CONTRACTION_CACHE.get(graph.fingerprint, lambda: build_contraction_hierarchy(graph))
+    junctions = hierarchy.junctions
+    if not junctions.seeds(start) or not junctions.seeds(goal):
+        return bfs_search(graph, start, goal, trace)
+    result = hierarchy.route(start, goal, trace)
+    result.metrics.update(hierarchy.metrics())
+    result.metrics["hierarchy_cache_hits"] = int(hit)
+    result.metrics["hierarchy_cache_misses"] = int(not hit)
+    return result
+
+
+def corridor_graph_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    frontier: str | Frontier = DEFAULT_FRONTIER,
+) -> SearchResult:
+    """Dijkstra over the cached junction graph, crossing each corridor as one weighted edge.
+
+    A ``start`` or ``goal`` inside a corridor is joined to both of that
+    corridor's end nodes, and to each other when they share one. Each label
+    remembers the corridor stretch it crossed, which is unpacked into cells
+    once the goal settles. Cells outside any corridor fall back to BFS.
+    """
+    junctions, hit = JUNCTION_CACHE.get(graph.fingerprint, lambda: build_junction_graph(graph))
+    start_seeds, goal_seeds = junctions.seeds(start), junctions.seeds(goal)
+    if start == goal or not start_seeds or not goal_seeds:
+        return bfs_search(graph, start, goal, trace)
+
+    nodes, adjacency = junctions.nodes.tolist(), junctions._adjacency
+    record = trace.record if trace is not None else None
+    goal_corridor, start_corridor = int(junctions.corridor_of[goal]), int(junctions.corridor_of[start])
+    target = int(junctions.node_index[goal])
+    exits: dict[int, list[tuple[int, int, int]]] = {}
+    if target < 0:
+        target = junctions.node_count
+        position, length = int(junctions.corridor_position[goal]), int(junctions.corridor_lengths[goal_corridor])
+        for node, distance, end in goal_seeds:
+            exits.setdefault(node, []).append((distance, length if end == 1 else 0, position))
+    cells = [*nodes, goal]
+    distances: dict[int, int] = {}
+    legs: dict[int, tuple[int, int, int, int]] = {}
+    settled: set[int] = set()
+    queue = make_frontier(frontier)
+    enqueued = steps = 0
+
+    def relax(node: int, distance: int, previous: int, corridor: int, first: int, last: int) -> None:
+        nonlocal enqueued
+        if distance >= distances.get(node, INFINITY):
+            return
+        distances[node] = distance
+        legs[node] = (previous, corridor, first, last)
+        queue.push(node, distance)
+        enqueued += 1
+        if record is not None:
+            record(ENQUEUE, cells[node], steps)
+
+    start_position = int(junctions.corridor_position[start])
+    for node, distance, end in start_seeds:
+        if end < 0:
+            relax(node, 0, -1, -1, 0, 0)
+        else:
+            relax(node, distance, -1, start_corridor, start_position, start_position + distance if end == 1 else 0)
+    if start_corridor >= 0 and start_corridor == goal_corridor:
+        goal_position = int(junctions.corridor_position[goal])
+        relax(target, abs(start_position - goal_position), -1, start_corridor, start_position, goal_position)
+
+    while queue:
+        node = queue.pop()
+        if node in settled:
+            queue.stale += 1
+            continue
+        settled.add(node)
+        steps += 1
+        if record is not None:
+            record(VISIT, cells[node], steps)
+        if node == target:
+            break
+        distance = distances[node]
+        for neighbor, weight, corridor, first, last in adjacency[node]:
+            relax(neighbor, distance + weight, node, corridor, first, last)
+        for weight, first, last in exits.get(node, ()):
+            relax(target, distance + weight, node, goal_corridor, first, last)
+
+    path: list[int] = []
+    if target in legs:
+        node = target
+        while True:
+            previous, corridor, first, last = legs[node]
+            if corridor >= 0:
+                stretch = junctions.corridor_run(corridor, first, last)
+            else:
+                stretch = [cells[node]] if previous < 0 else [cells[previous], cells[node]]
+            path[:0] = stretch if not path else stretch[:-1]
+            if previous < 0:
+                break
+            node = previous
+    metrics = {"junction_cache_hits": int(hit), "junction_cache_misses": int(not hit), **queue.stats()}
+    return SearchResult(
+        path=path, steps=steps, visited=steps, enqueued=enqueued, peak_frontier=queue.peak, metrics=metrics
+    )
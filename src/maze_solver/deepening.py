@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+
+from maze_solver.graph import MazeGraph
+from maze_solver.search import ENQUEUE, UNREACHED, VISIT, EventLog, SearchResult, manhattan_to
+
+EXHAUSTED = UNREACHED
+
+
+def _deepening_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None,
+    heuristic: Callable[[int], int],
+    transposition_size: int,
+) -> SearchResult:
+    """Cost-bounded DFS rounds over one shared path stack, raising the bound to the least f that exceeded it.
+
+    The stack keeps the cell, ordered children and next-child cursor for each
+    depth, plus an on-path bitmap for cycle checks, so memory is O(depth). With
+    ``transposition_size`` a table of at most that many cells maps each cell to
+    ``(g, f)``: the depth it was last fully searched from and the least f that
+    exceeded the bound below it (``EXHAUSTED`` when nothing did). Reaching the
+    cell again at the same or a greater depth skips the subtree whenever that
+    backed-up bound still exceeds the current one, in this round or a later one.
+    """
+    if transposition_size < 0:
+        raise ValueError("transposition_size must be non-negative.")
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    on_path = bytearray(graph.size)
+    path = array("i")
+    cursor = array("i")
+    least = array("q")
+    children: list[tuple[int, ...]] = []
+    table: dict[int, tuple[int, int]] = {}
+    steps = enqueued = peak_frontier = pruned = 0
+    bound = heuristic(start)
+    limit = graph.vertex_count
+
+    def expand(cell: int) -> None:
+        nonlocal enqueued
+        following = sorted((cell + delta for delta in moves[mask[cell]] if not on_path[cell + delta]), key=heuristic)
+        path.append(cell)
+        on_path[cell] = 1
+        cursor.append(0)
+        least.append(EXHAUSTED)
+        children.append(tuple(following))
+        enqueued += len(following)
+        if record is not None:
+            for neighbor in following:
+                record(ENQUEUE, neighbor, steps)
+
+    found = False
+    while not found and bound <= limit:
+        next_bound = EXHAUSTED
+        steps += 1
+        if record is not None:
+            record(VISIT, start, steps)
+        if start == goal:
+            found = True
+            path.append(start)
+            break
+        expand(start)
+        while path:
+            depth = len(path) - 1
+            if cursor[depth] == len(children[depth]):
+                cell = path.pop()
+                on_path[cell] = 0
+                cursor.pop()
+                children.pop()
+                backed_up = least.pop()
+                if transposition_size and (cell in table or len(table) < transposition_size):
+                    table[cell] = (depth, backed_up)
+                if not least:
+                    next_bound = backed_up
+                elif backed_up < least[-1]:
+                    least[-1] = backed_up
+                continue
+
+            cell = children[depth][cursor[depth]]
+            cursor[depth] += 1
+            g = depth + 1
+            entry = table.get(cell) if transposition_size else None
+            if entry is not None and entry[0] <= g:
+                stored = entry[1] if entry[1] == EXHAUSTED else g + entry[1] - entry[0]
+                if stored > bound:
+                    pruned += 1
+                    least[depth] = min(least[depth], stored)
+                    continue
+            f = g + heuristic(cell)
+            if f > bound:
+                least[depth] = min(least[depth], f)
+                continue
+            steps += 1
+            if record is not None:
+                record(VISIT, cell, steps)
+            if cell == goal:
+                found = True
+                path.append(cell)
+                break
+            expand(cell)
+            peak_frontier = max(peak_frontier, len(path))
+        if not found:
+            bound = next_bound
+
+    return SearchResult(
+        path=list(path) if found else [],
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"bound": bound, "transposition_entries": len(table), "transposition_prunes": pruned},
+    )
+
+
+def ida_star_search(
+    graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None, transposition_size: int = 0
+) -> SearchResult:
+    return _deepening_search(graph, start, goal, trace, manhattan_to(graph, goal), transposition_size)
+
+
+def iddfs_search(
+    graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None, transposition_size: int = 0
+) -> SearchResult:
+    """Iterative deepening DFS: the same rounds with a zero heuristic, so each bound is a depth limit."""
+    return _deepening_search(graph, start, goal, trace, lambda _cell: 0, transposition_size)
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import count
+
+FRONTIER_BACKENDS = ("heapq", "binary", "radix", "bucket", "two_level_bucket", "pairing")
+DEFAULT_FRONTIER = "heapq"
+TWO_LEVEL_BUCKET_WIDTH = 64
+
+
+def frontier_stats(pushes: int, pops: int, stale: int) -> dict[str, float]:
+    return {"frontier_pushes": pushes, "frontier_pops": pops, "frontier_stale": stale}
+
+
+class Frontier(ABC):
+    """Priority queue of cell ids for best-first solvers.
+
+    ``pop`` returns the id with the least key, ties in insertion order where
+    the backend keeps one. Pushing a queued id again lowers its key: indexed
+    backends (``binary``, ``pairing``) move the entry and ignore pushes that
+    would not lower it, while lazy backends keep the old entry, which comes
+    out again later. Solvers skip popped ids they have already expanded and
+    count them in ``stale``. ``peak`` is the most entries held at once.
+    """
+
+    name = ""
+
+    def __init__(self) -> None:
+        self.pushes = 0
+        self.pops = 0
+        self.stale = 0
+        self.peak = 0
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def push(self, item: int, priority: float) -> None: ...
+
+    @abstractmethod
+    def pop(self) -> int: ...
+
+    def stats(self) -> dict[str, float]:
+        return frontier_stats(self.pushes, self.pops, self.stale)
+
+
+def _integer_key(priority: float) -> int:
+    key = int(priority)
+    if key != priority or key < 0:
+        raise ValueError("Bucket and radix frontiers need non-negative integer priorities.")
+    return key
+
+
+class HeapqFrontier(Frontier):
+    """``heapq`` of ``(priority, sequence, id)`` tuples with lazy deletion."""
+
+    name = "heapq"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._heap: list[tuple[float, int, int]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: int, priority: float) -> None:
+        heap = self._heap
+        heapq.heappush(heap, (priority, next(self._sequence), item))
+        if len(heap) > self.peak:
+            self.peak = len(heap)
+
+    def pop(self) -> int:
+        self.pops += 1
+        return heapq.heappop(self._heap)[2]
+
+    def stats(self) -> dict[str, float]:
+        # push leaves ``pushes`` alone to stay cheap. Entries only leave the heap through pop, so the
+        # pushes so far are the pops plus what is still queued; ``pushes`` is only brought up to date
+        # here, so read the counts through ``stats()`` once the search has finished.
+        self.pushes = self.pops + len(self._heap)
+        return super().stats()
+
+
+class BinaryHeapFrontier(Frontier):
+    """Binary heap with a position index, so a decrease sifts the existing entry up instead of adding one."""
+
+    name = "binary"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._heap: list[int] = []
+        self._keys: dict[int, tuple[float, int]] = {}
+        self._position: dict[int, int] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: int, priority: float) -> None:
+        position = self._position.get(item)
+        if position is None:
+            position = len(self._heap)
+            self._heap.append(item)
+            self.peak = max(self.peak, position + 1)
+        elif priority >= self._keys[item][0]:
+            return
+        self.pushes += 1
+        self._keys[item] = (priority, next(self._sequence))
+        self._sift_up(position)
+
+    def pop(self) -> int:
+        heap, position = self._heap, self._position
+        top = heap[0]
+        last = heap.pop()
+        del position[top], self._keys[top]
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        self.pops += 1
+        return top
+
+    def _sift_up(self, index: int) -> None:
+        heap, keys, position = self._heap, self._keys, self._position
+        item = heap[index]
+        key = keys[item]
+        while index:
+            parent = (index - 1) >> 1
+            above = heap[parent]
+            if keys[above] <= key:
+                break
+            heap[index] = above
+            position[above] = index
+            index = parent
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, index: int) -> None:
+        heap, keys, position = self._heap, self._keys, self._position
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            below = heap[child]
+            if key <= keys[below]:
+                break
+            heap[index] = below
+            position[below] = index
+            index = child
+        heap[index] = item
+        position[item] = index
+
+
+class RadixHeapFrontier(Frontier):
+    """Radix heap for monotone integer keys (Ahuja, Mehlhorn, Orlin and Tarjan).
+
+    Bucket ``i`` holds keys whose highest bit differing from the last popped
+    key is ``i - 1``; a pop that finds bucket 0 empty redistributes the first
+    non-empty bucket around its least key. Keys below the last popped one
+    raise ``ValueError``.
+    """
+
+    name = "radix"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buckets: list[list[tuple[int, int]]] = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, item: int, priority: float) -> None:
+        key = _integer_key(priority)
+        if key < self._last:
+            raise ValueError("Radix frontiers need keys no smaller than the last one popped.")
+        self._buckets[(key ^ self._last).bit_length()].append((key, item))
+        self._size += 1
+        self.pushes += 1
+        self.peak = max(self.peak, self._size)
+
+    def pop(self) -> int:
+        buckets = self._buckets
+        if not buckets[0]:
+            index = next(index for index, bucket in enumerate(buckets) if bucket)
+            entries = buckets[index]
+            buckets[index] = []
+            self._last = last = min(key for key, _ in entries)
+            for key, item in entries:
+                buckets[(key ^ last).bit_length()].append((key, item))
+        self._size -= 1
+        self.pops += 1
+        return buckets[0].pop()[1]
+
+
+class BucketFrontier(Frontier):
+    """Dial-style bucket queue: one FIFO bucket per integer key and a cursor at the least non-empty one."""
+
+    name = "bucket"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buckets: dict[int, deque[int]] = {}
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, item: int, priority: float) -> None:
+        key = _integer_key(priority)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = deque()
+        bucket.append(item)
+        self._cursor = min(self._cursor, key)
+        self._size += 1
+        self.pushes += 1
+        self.peak = max(self.peak, self._size)
+
+    def pop(self) -> int:
+        buckets = self._buckets
+        bucket = buckets.get(self._cursor)
+        while not bucket:
+            buckets.pop(self._cursor, None)
+            self._cursor += 1
+            bucket = buckets.get(self._cursor)
+        self._size -= 1
+        self.pops += 1
+        return bucket.popleft()
+
+
+class TwoLevelBucketFrontier(Frontier):
+    """Two-level bucket queue: coarse buckets ``width`` keys wide, split into unit buckets when reached.
+
+    Only the coarse bucket under the cursor is spread into fine buckets, so the
+    cursor skips empty key ranges ``width`` keys at a time. A key below the
+    current coarse range moves the cursor back.
+    """
+
+    name = "two_level_bucket"
+
+    def __init__(self, width: int = TWO_LEVEL_BUCKET_WIDTH) -> None:
+        super().__init__()
+        if width < 1:
+            raise ValueError("width must be at least 1.")
+        self.width = width
+        self._coarse: dict[int, list[tuple[int, int]]] = {}
+        self._fine: list[deque[int]] = [deque() for _ in range(width)]
+        self._range = 0
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, item: int, priority: float) -> None:
+        key = _integer_key(priority)
+        coarse = key // self.width
+        if coarse < self._range:
+            self._respill(coarse)
+        if coarse == self._range:
+            offset = key - coarse * self.width
+            self._fine[offset].append(item)
+            self._cursor = min(self._cursor, offset)
+        else:
+            self._coarse.setdefault(coarse, []).append((key, item))
+        self._size += 1
+        self.pushes += 1
+        self.peak = max(self.peak, self._size)
+
+    def pop(self) -> int:
+        fine, width = self._fine, self.width
+        while True:
+            while self._cursor < width and not fine[self._cursor]:
+                self._cursor += 1
+            if self._cursor < width:
+                break
+            self._load(min(self._coarse))
+        self._size -= 1
+        self.pops += 1
+        return fine[self._cursor].popleft()
+
+    def _load(self, coarse: int) -> None:
+        self._range, self._cursor = coarse, self.width
+        base = coarse * self.width
+        for key, item in self._coarse.pop(coarse):
+            self._fine[key - base].append(item)
+            self._cursor = min(self._cursor, key - base)
+
+    def _respill(self, coarse: int) -> None:
+        """Return the fine buckets to the coarse level and make ``coarse`` the current range."""
+        base = self._range * self.width
+        spilled = [(base + offset, item) for offset, bucket in enumerate(self._fine) for item in bucket]
+        if spilled:
+            self._coarse.setdefault(self._range, []).extend(spilled)
+        for bucket in self._fine:
+            bucket.clear()
+        self._range, self._cursor = coarse, self.width
+
+
+class PairingHeapFrontier(Frontier):
+    """Pairing heap (Fredman, Sedgewick, Sleator and Tarjan) with O(1) decrease-key.
+
+    Nodes are ``[key, sequence, id, child, sibling, previous]`` lists; a
+    decrease cuts the node's subtree and melds it with the root, and a pop
+    merges the root's children in two passes.
+    """
+
+    name = "pairing"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._root: list | None = None
+        self._nodes: dict[int, list] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def push(self, item: int, priority: float) -> None:
+        node = self._nodes.get(item)
+        if node is None:
+            node = self._nodes[item] = [priority, next(self._sequence), item, None, None, None]
+            self._root = self._meld(self._root, node)
+            self.peak = max(self.peak, len(self._nodes))
+        elif priority < node[0]:
+            node[0], node[1] = priority, next(self._sequence)
+            if node is not self._root:
+                self._cut(node)
+                self._root = self._meld(self._root, node)
+        else:
+            return
+        self.pushes += 1
+
+    def pop(self) -> int:
+        root = self._root
+        del self._nodes[root[2]]
+        self._root = self._merge_pairs(root[3])
+        self.pops += 1
+        return root[2]
+
+    @staticmethod
+    def _meld(first: list | None, second: list | None) -> list | None:
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second[0] < first[0] or (second[0] == first[0] and second[1] < first[1]):
+            first, second = second, first
+        child = first[3]
+        second[4] = child
+        if child is not None:
+            child[5] = second
+        second[5] = first
+        first[3] = second
+        return first
+
+    @staticmethod
+    def _cut(node: list) -> None:
+        previous, sibling = node[5], node[4]
+        if previous[3] is node:
+            previous[3] = sibling
+        else:
+            previous[4] = sibling
+        if sibling is not None:
+            sibling[5] = previous
+        node[4] = node[5] = None
+
+    def _merge_pairs(self, first: list | None) -> list | None:
+        pairs: list[list] = []
+        while first is not None:
+            second = first[4]
+            following = second[4] if second is not None else None
+            first[4] = first[5] = None
+            if second is not None:
+                second[4] = second[5] = None
+            pairs.append(self._meld(first, second))
+            first = following
+        root = None
+        for tree in reversed(pairs):
+            root = self._meld(tree, root)
+        return root
+
+
+_BACKENDS: dict[str, type[Frontier]] = {
+    "heapq": HeapqFrontier,
+    "binary": BinaryHeapFrontier,
+    "radix": RadixHeapFrontier,
+    "bucket": BucketFrontier,
+    "two_level_bucket": TwoLevelBucketFrontier,
+    "pairing": PairingHeapFrontier,
+}
+
+
+def make_frontier(backend: str | Frontier = DEFAULT_FRONTIER) -> Frontier:
+    """A fresh frontier for the named backend; an existing ``Frontier`` is passed through."""
+    if isinstance(backend, Frontier):
+        return backend
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown frontier backend: {backend}")
+    return _BACKENDS[backend]()
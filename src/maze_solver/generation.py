@@ -8,15 +8,19 @@ import numpy as np
 
 from maze_solver.algorithms import is_solvable
 from maze_solver.grid import (
+    MAZE_DTYPE,
     PASSAGE,
     WALL,
     Cell,
+    CostMap,
+    PackedMaze,
     adjacent_cells,
     default_goal,
     default_start,
     iter_cells,
     normalize_dimensions,
     open_endpoints,
+    pack_maze,
     two_step_neighbors,
 )
 
@@ -28,6 +32,15 @@ GENERATION_TOPOLOGIES = {
     PERFECT_TOPOLOGY: "Perfect: one route between any two carved cells",
     BRAIDED_TOPOLOGY: "Braided: extra connector loops without random passage closures",
 }
+TERRAIN_TYPES = {
+    "mud": "Smoothly varying cost from 1 to max_cost, like patches of deepening mud",
+    "water": "Dry ground at cost 1 with shallows at half of max_cost and deep water at max_cost",
+    "uniform": "Independent random cost per cell from 1 to max_cost",
+}
+DEFAULT_MAX_COST = 9
+DEFAULT_NOISE_SCALE = 16
+WATER_LEVEL = 0.62
+SHALLOWS_WIDTH = 0.08
 
 
 @dataclass(frozen=True)
@@ -142,7 +155,8 @@ def generate_maze(
     branching_factor: int = 3,
     connectedness: int = 70,
     topology: str = PERFECT_TOPOLOGY,
-) -> tuple[np.ndarray, int]:
+    packed: bool = False,
+) -> tuple[np.ndarray | PackedMaze, int]:
     rows, cols = normalize_dimensions(rows, cols)
     used_seed = seed if seed is not None else random.randint(0, 999_999)
     rng = random.Random(used_seed)
@@ -160,11 +174,67 @@ def generate_maze(
         open_endpoints(maze)
         _connect_open_components(maze, rng)
         if _all_passages_reachable_from_start(maze) and is_solvable(maze, default_start(), default_goal(maze)):
-            return maze, used_seed
+            return (pack_maze(maze) if packed else maze), used_seed
 
     raise RuntimeError("Unable to generate a solvable maze with the selected parameters.")
 
 
+def generate_cost_map(
+    shape: tuple[int, int],
+    terrain: str = "mud",
+    seed: int | None = None,
+    max_cost: int = DEFAULT_MAX_COST,
+    scale: int = DEFAULT_NOISE_SCALE,
+    octaves: int = 3,
+    integer: bool = True,
+) -> CostMap:
+    """Build a terrain ``CostMap`` from seeded value noise; costs lie in ``[1, max_cost]``.
+
+    ``integer`` stores rounded uint16 costs, which bucket solvers such as Dial's
+    need; otherwise the map is float32.
+    """
+    if terrain not in TERRAIN_TYPES:
+        raise ValueError(f"Unknown terrain: {terrain}")
+    if not 1 <= max_cost <= np.iinfo(np.uint16).max:
+        raise ValueError("max_cost must be between 1 and 65535.")
+    rng = np.random.default_rng(seed)
+    if terrain == "uniform":
+        level = rng.random(shape)
+    else:
+        level = value_noise(shape, rng, scale, octaves)
+    if terrain == "water":
+        shallow = max(1.0, max_cost / 2)
+        costs = np.where(level < WATER_LEVEL, 1.0, np.where(level < WATER_LEVEL + SHALLOWS_WIDTH, shallow, max_cost))
+    else:
+        costs = 1.0 + level * (max_cost - 1)
+    if integer:
+        return CostMap(np.rint(costs).astype(np.uint16))
+    return CostMap(costs.astype(np.float32))
+
+
+def value_noise(shape: tuple[int, int], rng: np.random.Generator, scale: int, octaves: int) -> np.ndarray:
+    """Fractal value noise in ``[0, 1]``: smoothstep-interpolated random lattices, halving the spacing each octave."""
+    rows, cols = shape
+    total = np.zeros(shape)
+    amplitude = 1.0
+    for octave in range(octaves):
+        spacing = max(1.0, scale / 2**octave)
+        lattice = rng.random((int(rows / spacing) + 2, int(cols / spacing) + 2))
+        y, x = np.arange(rows) / spacing, np.arange(cols) / spacing
+        y0, x0 = y.astype(np.int64), x.astype(np.int64)
+        ty, tx = _smoothstep(y - y0)[:, None], _smoothstep(x - x0)[None, :]
+        top = lattice[np.ix_(y0, x0)] * (1 - tx) + lattice[np.ix_(y0, x0 + 1)] * tx
+        bottom = lattice[np.ix_(y0 + 1, x0)] * (1 - tx) + lattice[np.ix_(y0 + 1, x0 + 1)] * tx
+        total += amplitude * (top * (1 - ty) + bottom * ty)
+        amplitude /= 2
+    low, high = total.min(), total.max()
+    return (total - low) / (high - low) if high > low else np.zeros(shape)
+
+
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3 - 2 * t)
+
+
 def _builders() -> dict[str, MazeBuilder]:
     return {
         "Recursive Backtracker": recursive_backtracker_maze,
@@ -182,7 +252,7 @@ def _builders() -> dict[str, MazeBuilder]:
 
 
 def _blank(rows: int, cols: int) -> np.ndarray:
-    return np.ones((rows, cols), dtype=int)
+    return np.ones((rows, cols), dtype=MAZE_DTYPE)
 
 
 def recursive_backtracker_maze(rows: int, cols: int, rng: random.Random) -> np.ndarray:
@@ -428,7 +498,7 @@ def eller_maze(rows: int, cols: int, rng: random.Random) -> np.ndarray:
 
 
 def recursive_division_maze(rows: int, cols: int, rng: random.Random) -> np.ndarray:
-    maze = np.zeros((rows, cols), dtype=int)
+    maze = np.zeros((rows, cols), dtype=MAZE_DTYPE)
     maze[0, :] = WALL
     maze[-1, :] = WALL
     maze[:, 0] = WALL
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from maze_solver.cache import FingerprintCache
+from maze_solver.grid import PASSAGE, Cell, PackedMaze, as_maze_array, maze_fingerprint
+
+NORTH = 1
+SOUTH = 2
+WEST = 4
+EAST = 8
+DIRECTION_BITS = (NORTH, SOUTH, WEST, EAST)
+DIRECTION_OFFSETS: tuple[Cell, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+GRAPH_CACHE_SIZE = 8
+
+_MASK_OFFSETS: tuple[tuple[Cell, ...], ...] = tuple(
+    tuple(offset for bit, offset in zip(DIRECTION_BITS, DIRECTION_OFFSETS, strict=True) if mask & bit)
+    for mask in range(16)
+)
+
+
+@dataclass(frozen=True, eq=False)
+class MazeGraph:
+    """Flat-id adjacency index for a maze grid.
+
+    Cell ``(row, col)`` has id ``row * cols + col``. ``offsets``/``targets`` form a CSR
+    adjacency list whose per-cell neighbor order matches ``grid.adjacent_cells``:
+    north, south, west, east. ``mask`` holds the same adjacency as NESW bits.
+    """
+
+    rows: int
+    cols: int
+    passable: np.ndarray
+    mask: np.ndarray
+    degree: np.ndarray
+    offsets: np.ndarray
+    targets: np.ndarray
+    fingerprint: str
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def size(self) -> int:
+        return self.rows * self.cols
+
+    @cached_property
+    def vertex_count(self) -> int:
+        return int(np.count_nonzero(self.passable))
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.targets.size) // 2
+
+    @cached_property
+    def sources(self) -> np.ndarray:
+        """Source id of each CSR slot, so ``(sources, targets)`` lists every directed edge."""
+        return np.repeat(np.arange(self.size, dtype=np.int32), self.degree)
+
+    @cached_property
+    def mask_bytes(self) -> bytes:
+        return self.mask.tobytes()
+
+    @cached_property
+    def steps(self) -> tuple[tuple[int, ...], ...]:
+        """Flat-id deltas for each 4-bit mask, in north, south, west, east order."""
+        deltas = (-self.cols, self.cols, -1, 1)
+        return tuple(
+            tuple(delta for bit, delta in zip(DIRECTION_BITS, deltas, strict=True) if mask & bit) for mask in range(16)
+        )
+
+    def cell_id(self, cell: Cell) -> int:
+        return cell[0] * self.cols + cell[1]
+
+    def cell_of(self, cell_id: int) -> Cell:
+        return divmod(cell_id, self.cols)
+
+    def cells_of(self, cell_ids) -> list[Cell]:
+        rows, cols = np.divmod(np.asarray(cell_ids, dtype=np.int64), self.cols)
+        return list(zip(rows.tolist(), cols.tolist(), strict=True))
+
+    def is_open(self, cell: Cell) -> bool:
+        row, col = cell
+        return 0 <= row < self.rows and 0 <= col < self.cols and bool(self.passable[row * self.cols + col])
+
+    def neighbors(self, cell_id: int) -> list[int]:
+        return [cell_id + delta for delta in self.steps[self.mask_bytes[cell_id]]]
+
+    def adjacent(self, cell: Cell) -> list[Cell]:
+        row, col = cell
+        return [(row + dr, col + dc) for dr, dc in _MASK_OFFSETS[self.mask_bytes[row * self.cols + col]]]
+
+    def open_ids(self) -> np.ndarray:
+        return np.flatnonzero(self.passable)
+
+    def open_cells(self) -> list[Cell]:
+        return self.cells_of(self.open_ids())
+
+
+def build_maze_graph(maze: np.ndarray | PackedMaze, fingerprint: str | None = None) -> MazeGraph:
+    grid = as_maze_array(maze)
+    rows, cols = grid.shape
+    passable = grid == PASSAGE
+
+    north = np.zeros_like(passable)
+    south = np.zeros_like(passable)
+    west = np.zeros_like(passable)
+    east = np.zeros_like(passable)
+    north[1:, :] = passable[1:, :] & passable[:-1, :]
+    south[:-1, :] = passable[:-1, :] & passable[1:, :]
+    west[:, 1:] = passable[:, 1:] & passable[:, :-1]
+    east[:, :-1] = passable[:, :-1] & passable[:, 1:]
+    directions = [direction.ravel() for direction in (north, south, west, east)]
+
+    mask = np.zeros(rows * cols, dtype=np.uint8)
+    degree = np.zeros(rows * cols, dtype=np.uint8)
+    for bit, direction in zip(DIRECTION_BITS, directions, strict=True):
+        mask |= direction.astype(np.uint8) * np.uint8(bit)
+        degree += direction
+
+    offsets = np.zeros(rows * cols + 1, dtype=np.int32)
+    np.cumsum(degree, out=offsets[1:])
+    targets = np.empty(int(offsets[-1]), dtype=np.int32)
+    slot = offsets[:-1].copy()
+    for delta, direction in zip((-cols, cols, -1, 1), directions, strict=True):
+        ids = np.flatnonzero(direction)
+        targets[slot[ids]] = ids + delta
+        slot += direction
+
+    return MazeGraph(
+        rows=rows,
+        cols=cols,
+        passable=passable.ravel(),
+        mask=mask,
+        degree=degree,
+        offsets=offsets,
+        targets=targets,
+        fingerprint=fingerprint or maze_fingerprint(grid),
+    )
+
+
+_GRAPH_CACHE: FingerprintCache[MazeGraph] = FingerprintCache(GRAPH_CACHE_SIZE)
+
+
+def maze_graph(maze: np.ndarray | PackedMaze | MazeGraph) -> MazeGraph:
+    """Return the cached ``MazeGraph`` for a maze, building it on first use."""
+    if isinstance(maze, MazeGraph):
+        return maze
+    fingerprint = maze_fingerprint(maze)
+    graph, _hit = _GRAPH_CACHE.get(fingerprint, lambda: build_maze_graph(maze, fingerprint))
+    return graph
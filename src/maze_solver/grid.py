@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Iterable
+from dataclasses import dataclass
 
 import numpy as np
 
@@ -8,6 +10,81 @@ Cell = tuple[int, int]
 
 WALL = 1
 PASSAGE = 0
+MAZE_DTYPE = np.uint8
+COST_DTYPES = (np.dtype(np.float32), np.dtype(np.uint16))
+
+
+@dataclass(frozen=True, eq=False)
+class PackedMaze:
+    """Maze stored at one bit per cell via ``np.packbits``; set bits are walls."""
+
+    bits: np.ndarray
+    shape: tuple[int, int]
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.bits.nbytes)
+
+    def __getitem__(self, cell: Cell) -> int:
+        index = cell[0] * self.shape[1] + cell[1]
+        return (int(self.bits[index >> 3]) >> (7 - (index & 7))) & 1
+
+    def unpack(self) -> np.ndarray:
+        return np.unpackbits(self.bits, count=self.size).reshape(self.shape)
+
+
+@dataclass(frozen=True, eq=False)
+class CostMap:
+    """Per-cell entry costs stored as float32 or uint16: moving into a cell costs its value.
+
+    Solvers take it anywhere they take a ``cost_map`` array; ``np.asarray``
+    returns the stored array without copying. That array is made read-only,
+    since cost-map fingerprints and the shortest-path tree cache assume it
+    never changes; ``np.array`` returns a writable copy.
+    """
+
+    costs: np.ndarray
+
+    def __post_init__(self) -> None:
+        if self.costs.ndim != 2 or self.costs.dtype not in COST_DTYPES:
+            raise ValueError("Cost maps must be 2-D float32 or uint16 arrays.")
+        self.costs.flags.writeable = False
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy or (dtype is not None and np.dtype(dtype) != self.costs.dtype):
+            if copy is False:
+                raise ValueError(f"Converting a {self.costs.dtype} cost map to {np.dtype(dtype)} needs a copy.")
+            return np.array(self.costs, dtype=dtype, copy=True)
+        return self.costs
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.costs.shape
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.costs.nbytes)
+
+    @property
+    def integer(self) -> bool:
+        return self.costs.dtype == np.uint16
+
+
+def pack_maze(maze: np.ndarray | PackedMaze) -> PackedMaze:
+    if isinstance(maze, PackedMaze):
+        return maze
+    grid = np.asarray(maze)
+    return PackedMaze(bits=np.packbits(grid.ravel() != PASSAGE), shape=(grid.shape[0], grid.shape[1]))
+
+
+def as_maze_array(maze: np.ndarray | PackedMaze) -> np.ndarray:
+    if isinstance(maze, PackedMaze):
+        return maze.unpack()
+    return np.asarray(maze)
 
 
 def normalize_dimensions(rows: int, cols: int) -> tuple[int, int]:
@@ -33,6 +110,22 @@ def open_endpoints(maze: np.ndarray) -> None:
     maze[default_goal(maze)] = PASSAGE
 
 
+def maze_fingerprint(maze: np.ndarray | PackedMaze) -> str:
+    digest = hashlib.blake2b(pack_maze(maze).bits.tobytes(), digest_size=16)
+    digest.update(f"{maze.shape[0]}x{maze.shape[1]}".encode())
+    return digest.hexdigest()
+
+
+def cost_map_fingerprint(cost_map: np.ndarray | CostMap | None) -> str | None:
+    """Content hash of a cost map's dtype, shape and values; ``None`` stands for unit costs."""
+    if cost_map is None:
+        return None
+    costs = np.ascontiguousarray(np.asarray(cost_map))
+    digest = hashlib.blake2b(costs.tobytes(), digest_size=16)
+    digest.update(f"{costs.dtype.str}:{costs.shape}".encode())
+    return digest.hexdigest()
+
+
 def adjacent_cells(cell: Cell, maze: np.ndarray) -> list[Cell]:
     row, col = cell
     neighbors: list[Cell] = []
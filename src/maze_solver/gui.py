@@ -4,13 +4,15 @@ import time
 import tkinter as tk
 from tkinter import messagebox
 
-from maze_solver.algorithms import SOLVER_REGISTRY
+from maze_solver.algorithms import SOLVER_REGISTRY, solve
 from maze_solver.generation import generate_maze
 from maze_solver.render import Render
-from maze_solver.stats import complexity_score, format_complexity_score, maze_statistics
+from maze_solver.stats import complexity_score, format_complexity_score, format_metrics, maze_statistics
 
 logger = logging.getLogger(__name__)
 
+SOLVER_POLL_MS = 25
+
 
 class MazeSolverApp:
     def __init__(self, root):
@@ -27,6 +29,7 @@ class MazeSolverApp:
         self.stop_requested = False  # Add this flag for stopping the solver
         self.steps = 0
         self.show_completion_dialog = True
+        self.solver_metrics = {}
 
         # Bind keys to quit the application
         self.root.bind("<Escape>", self.quit_application)
@@ -163,19 +166,52 @@ class MazeSolverApp:
         # Get selected algorithm
         algorithm = self.render.update_algorithm_selection()
 
-        solver = SOLVER_REGISTRY.get(algorithm)
-        if solver is None:
+        if algorithm not in SOLVER_REGISTRY:
             messagebox.showerror("Error", f"Unknown algorithm: {algorithm}")
             self.solving = False
             self.stop_timer()
             return
-        self.solver_generator = solver(self.maze, (1, 1), (self.maze.shape[0] - 2, self.maze.shape[1] - 2))
+        self.solver_metrics = {}
         self.render.draw_maze(self.maze)
         self.update_maze_stats()
         self.render.set_status(f"Running {algorithm}...")
 
-        # Start the solving process
-        self.solver_step_id = self.root.after(0, self._process_solver_step)
+        # Solve into a columnar EventLog on a worker thread so the window stays responsive, then replay the log.
+        outcome = []
+        goal = (self.maze.shape[0] - 2, self.maze.shape[1] - 2)
+        worker = threading.Thread(
+            target=self._solve_maze_thread, args=(self.maze, goal, algorithm, outcome), daemon=True
+        )
+        worker.start()
+        self.solver_step_id = self.root.after(SOLVER_POLL_MS, self._poll_solver, algorithm, outcome)
+
+    def _solve_maze_thread(self, maze, goal, algorithm, outcome):
+        try:
+            outcome.append(solve(maze, (1, 1), goal, algorithm, record_events=True))
+        except Exception as e:
+            outcome.append(e)
+
+    def _poll_solver(self, algorithm, outcome):
+        if self.stop_requested:
+            self.solving = False
+            self.solver_step_id = None
+            self.stop_timer()
+            return
+        if not outcome:
+            self.solver_step_id = self.root.after(SOLVER_POLL_MS, self._poll_solver, algorithm, outcome)
+            return
+        result = outcome[0]
+        if isinstance(result, Exception):
+            self.solving = False
+            self.solver_step_id = None
+            self.stop_timer()
+            self.render.set_status(f"{algorithm} failed")
+            print(f"Error solving maze: {result}")
+            messagebox.showerror("Error", f"An error occurred while solving the maze:\n{result}")
+            return
+        self.solver_generator = iter(result.events)
+        self.solver_metrics = result.metrics
+        self._process_solver_step()
 
     def _process_solver_step(self):
         if self.stop_requested:
@@ -224,6 +260,8 @@ class MazeSolverApp:
             f"Generation Algorithm: {params.get('generation_algorithm', 'Unknown')}\n"
             f"Seed: {params.get('seed', 'None')}"
         )
+        if self.solver_metrics:
+            summary += f"\nSolver Metrics: {format_metrics(self.solver_metrics)}"
         if self.show_completion_dialog:
             messagebox.showinfo("Maze Solved!", summary)
 
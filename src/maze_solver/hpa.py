@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from itertools import count
+
+import numpy as np
+
+from maze_solver.cache import FingerprintCache
+from maze_solver.graph import EAST, NORTH, SOUTH, WEST, MazeGraph, maze_graph
+from maze_solver.grid import PASSAGE, Cell, PackedMaze
+from maze_solver.search import ENQUEUE, VISIT, EventLog, SearchResult
+
+CLUSTER_SIZE = 16
+# Border runs at least this long get a transition at both ends instead of one in the middle.
+WIDE_ENTRANCE = 6
+HPA_CACHE_SIZE = 4
+
+# Border kinds: EAST_BORDER joins cluster k to k + 1, SOUTH_BORDER joins k to k + cluster_cols.
+EAST_BORDER = 0
+SOUTH_BORDER = 1
+
+
+class HPAStarPlanner:
+    """Hierarchical path-finding A* (Botea, Müller and Schaeffer) over square clusters.
+
+    The maze is cut into ``cluster_size`` square clusters. Every open run along
+    a border between two clusters becomes one or two transitions (pairs of
+    entrance cells a step apart), and each cluster stores the in-cluster BFS
+    distances between all of its entrances. ``route`` links start and goal into
+    that abstract graph, runs A* over it, and optionally refines each abstract
+    edge back into cells. ``update_cells`` rebuilds only the clusters whose
+    cells or borders changed.
+    """
+
+    def __init__(self, maze: np.ndarray | PackedMaze | MazeGraph, cluster_size: int = CLUSTER_SIZE) -> None:
+        if cluster_size < 2:
+            raise ValueError("Cluster size must be at least 2.")
+        began = time.perf_counter()
+        graph = maze_graph(maze)
+        self.rows, self.cols = graph.shape
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        self._passable = graph.passable.copy()
+        self._mask_bytes = bytearray(graph.mask_bytes)
+        self._mask = np.frombuffer(self._mask_bytes, dtype=np.uint8)
+        self._scratch = np.full(graph.size, -1, dtype=np.int32)
+        self._borders: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        self._partners: dict[int, list[int]] = {}
+        self._entrances: list[list[int]] = [[] for _ in range(self.cluster_count)]
+        self._edges: dict[int, list[tuple[int, int]]] = {}
+        self._moves = graph.steps
+        self.last_rebuilt = self.cluster_count
+        self._rebuild(range(self.cluster_count))
+        self.preprocess_seconds = time.perf_counter() - began
+
+    @property
+    def cluster_count(self) -> int:
+        return self.cluster_rows * self.cluster_cols
+
+    @property
+    def node_count(self) -> int:
+        return len(self._edges)
+
+    @property
+    def edge_count(self) -> int:
+        """Undirected abstract edges: transitions plus reachable entrance pairs inside clusters."""
+        return sum(len(edges) for edges in self._edges.values()) // 2
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "preprocess_seconds": round(self.preprocess_seconds, 4),
+            "clusters": self.cluster_count,
+            "cluster_size": self.cluster_size,
+            "abstract_nodes": self.node_count,
+            "abstract_edges": self.edge_count,
+        }
+
+    def is_open(self, cell: Cell) -> bool:
+        row, col = cell
+        return 0 <= row < self.rows and 0 <= col < self.cols and bool(self._passable[row * self.cols + col])
+
+    def cluster_of(self, cell_id: int) -> int:
+        row, col = divmod(cell_id, self.cols)
+        return (row // self.cluster_size) * self.cluster_cols + col // self.cluster_size
+
+    def update_cells(self, changed: Mapping[Cell, int] | Iterable[Cell]) -> int:
+        """Apply wall changes and rebuild the clusters they touch; returns how many were rebuilt.
+
+        ``changed`` maps cells to ``WALL``/``PASSAGE``, or lists cells to toggle.
+        A changed cell on a cluster edge also rebuilds the cluster across that
+        border, because the border's entrances may have moved.
+        """
+        items = changed.items() if isinstance(changed, Mapping) else ((cell, None) for cell in changed)
+        flipped: list[int] = []
+        for cell, value in items:
+            cell_id = self._id(cell)
+            is_open = not self._passable[cell_id] if value is None else value == PASSAGE
+            if bool(self._passable[cell_id]) != is_open:
+                self._passable[cell_id] = is_open
+                flipped.append(cell_id)
+        if not flipped:
+            self.last_rebuilt = 0
+            return 0
+        cells = set(flipped)
+        for cell_id in flipped:
+            cells.update(self._grid_neighbors(cell_id))
+        touched = np.fromiter(cells, dtype=np.int64, count=len(cells))
+        self._refresh_mask(touched)
+        clusters = {self.cluster_of(cell_id) for cell_id in touched.tolist()}
+        self._rebuild(sorted(clusters))
+        self.last_rebuilt = len(clusters)
+        return len(clusters)
+
+    def route(self, start: Cell, goal: Cell, trace: EventLog | None = None, refine: bool = True) -> list[Cell]:
+        """A* over the abstract graph with start and goal linked in, returning the path as cells.
+
+        With ``refine`` the path is expanded into every cell; otherwise it lists
+        only start, the entrance cells passed through, and goal.
+        """
+        result = self.route_ids(self._id(start), self._id(goal), trace, refine)
+        return [divmod(cell_id, self.cols) for cell_id in result.path]
+
+    def route_ids(self, start: int, goal: int, trace: EventLog | None = None, refine: bool = True) -> SearchResult:
+        """``route`` on cell ids, returning the ``SearchResult`` with its counters."""
+        if not self._passable[start] or not self._passable[goal]:
+            return SearchResult(path=[], steps=0, visited=0, enqueued=0, peak_frontier=0)
+        if start == goal:
+            return SearchResult(path=[start], steps=1, visited=1, enqueued=0, peak_frontier=1)
+        abstract, steps, enqueued, peak = self._abstract_search(start, goal, trace)
+        if abstract and refine:
+            path = self._refine(abstract)
+        else:
+            path = abstract
+        return SearchResult(
+            path=path,
+            steps=steps,
+            visited=steps,
+            enqueued=enqueued,
+            peak_frontier=peak,
+            metrics={"abstract_path_nodes": len(abstract)},
+        )
+
+    def _id(self, cell: Cell) -> int:
+        row, col = cell
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Cell {cell} is outside the maze.")
+        return row * self.cols + col
+
+    def _grid_neighbors(self, cell_id: int) -> list[int]:
+        row, col = divmod(cell_id, self.cols)
+        neighbors = []
+        if row > 0:
+            neighbors.append(cell_id - self.cols)
+        if row < self.rows - 1:
+            neighbors.append(cell_id + self.cols)
+        if col > 0:
+            neighbors.append(cell_id - 1)
+        if col < self.cols - 1:
+            neighbors.append(cell_id + 1)
+        return neighbors
+
+    def _refresh_mask(self, cell_ids: np.ndarray) -> None:
+        rows, cols = np.divmod(cell_ids, self.cols)
+        passable = self._passable
+        mask = np.zeros(cell_ids.size, dtype=np.uint8)
+        for bit, inside, delta in (
+            (NORTH, rows > 0, -self.cols),
+            (SOUTH, rows < self.rows - 1, self.cols),
+            (WEST, cols > 0, -1),
+            (EAST, cols < self.cols - 1, 1),
+        ):
+            neighbor = np.where(inside, cell_ids + delta, cell_ids)
+            mask |= np.where(inside & passable[neighbor], bit, 0).astype(np.uint8)
+        mask[~passable[cell_ids]] = 0
+        self._mask[cell_ids] = mask
+
+    def _rebuild(self, clusters: Iterable[int]) -> None:
+        clusters = list(clusters)
+        self._replace_borders(self._borders_around(clusters))
+        for cluster in clusters:
+            for cell_id in self._entrances[cluster]:
+                del self._edges[cell_id]
+            self._entrances[cluster] = sorted(set(self._cluster_sides(cluster)))
+
+        widest = max((len(self._entrances[cluster]) for cluster in clusters), default=0)
+        table = np.full((len(clusters), widest), -1, dtype=np.int64)
+        for row, cluster in enumerate(clusters):
+            table[row, : len(self._entrances[cluster])] = self._entrances[cluster]
+        distances = np.full((len(clusters), widest, widest), -1, dtype=np.int32)
+        for slot in range(widest):
+            has_slot = table[:, slot] >= 0
+            distances[has_slot, slot, :] = self._cluster_distances(table[has_slot, slot], table[has_slot])
+        partners = self._partners
+        for row, cluster in enumerate(clusters):
+            entrances = self._entrances[cluster]
+            for cell_id, reach in zip(entrances, distances[row].tolist(), strict=False):
+                edges = [(other, distance) for other, distance in zip(entrances, reach, strict=False) if distance > 0]
+                edges += [(other, 1) for other in partners.get(cell_id, ())]
+                self._edges[cell_id] = edges
+
+    def _borders_around(self, clusters: list[int]) -> list[tuple[int, int]]:
+        borders = set()
+        cluster_cols = self.cluster_cols
+        for cluster in clusters:
+            row, col = divmod(cluster, cluster_cols)
+            if col + 1 < cluster_cols:
+                borders.add((EAST_BORDER, cluster))
+            if col > 0:
+                borders.add((EAST_BORDER, cluster - 1))
+            if row + 1 < self.cluster_rows:
+                borders.add((SOUTH_BORDER, cluster))
+            if row > 0:
+                borders.add((SOUTH_BORDER, cluster - cluster_cols))
+        return sorted(borders)
+
+    def _cluster_sides(self, cluster: int) -> list[int]:
+        """Entrance cells on the inner side of each of ``cluster``'s borders."""
+        borders = self._borders
+        cells = [first for first, _second in borders.get((EAST_BORDER, cluster), ())]
+        cells += [first for first, _second in borders.get((SOUTH_BORDER, cluster), ())]
+        cells += [second for _first, second in borders.get((EAST_BORDER, cluster - 1), ())]
+        cells += [second for _first, second in borders.get((SOUTH_BORDER, cluster - self.cluster_cols), ())]
+        return cells
+
+    def _replace_borders(self, borders: list[tuple[int, int]]) -> None:
+        partners = self._partners
+        for border in borders:
+            for first, second in self._borders.pop(border, ()):
+                for cell_id, other in ((first, second), (second, first)):
+                    partners[cell_id].remove(other)
+                    if not partners[cell_id]:
+                        del partners[cell_id]
+        for border, pairs in self._find_transitions(borders).items():
+            self._borders[border] = pairs
+            for first, second in pairs:
+                partners.setdefault(first, []).append(second)
+                partners.setdefault(second, []).append(first)
+
+    def _find_transitions(self, borders: list[tuple[int, int]]) -> dict[tuple[int, int], list[tuple[int, int]]]:
+        """Open runs along each border, reduced to one middle transition or two end transitions."""
+        if not borders:
+            return {}
+        size = self.cluster_size
+        kinds = np.array([kind for kind, _cluster in borders])
+        cluster_row, cluster_col = np.divmod(np.array([cluster for _kind, cluster in borders]), self.cluster_cols)
+        offsets = np.arange(size)
+        east = (kinds == EAST_BORDER)[:, None]
+        rows = np.where(east, cluster_row[:, None] * size + offsets, cluster_row[:, None] * size + size - 1)
+        cols = np.where(east, cluster_col[:, None] * size + size - 1, cluster_col[:, None] * size + offsets)
+        valid = (rows < self.rows) & (cols < self.cols)
+        first = np.where(valid, rows * self.cols + cols, 0)
+        second = first + np.where(east, 1, self.cols)
+        second[~valid] = 0
+        open_pairs = np.zeros((len(borders), size + 2), dtype=bool)
+        open_pairs[:, 1:-1] = valid & self._passable[first] & self._passable[second]
+        run_border, run_start = np.nonzero(open_pairs[:, 1:-1] & ~open_pairs[:, :-2])
+        _run_border, run_end = np.nonzero(open_pairs[:, 1:-1] & ~open_pairs[:, 2:])
+        narrow = run_end - run_start + 1 < WIDE_ENTRANCE
+        middle = run_start + (run_end - run_start) // 2
+        picked_border = np.concatenate([run_border[narrow], run_border[~narrow], run_border[~narrow]])
+        picked_offset = np.concatenate([middle[narrow], run_start[~narrow], run_end[~narrow]])
+        order = np.lexsort((picked_offset, picked_border))
+        picked_border, picked_offset = picked_border[order], picked_offset[order]
+        found: dict[tuple[int, int], list[tuple[int, int]]] = {border: [] for border in borders}
+        for index, first_id, second_id in zip(
+            picked_border.tolist(),
+            first[picked_border, picked_offset].tolist(),
+            second[picked_border, picked_offset].tolist(),
+            strict=True,
+        ):
+            found[borders[index]].append((first_id, second_id))
+        return found
+
+    def _cluster_distances(self, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """BFS from one source per cluster, confined to each source's cluster, all clusters at once.
+
+        Returns the distance to each entry of ``targets`` (one row per source,
+        -1 padding allowed) or -1 where it is not reachable inside the cluster.
+        """
+        scratch, mask = self._scratch, self._mask
+        size, cols = self.cluster_size, self.cols
+        scratch[sources] = 0
+        touched = [sources]
+        frontier = sources
+        level = 0
+        while frontier.size:
+            level += 1
+            bits = mask[frontier]
+            row_offset, col_offset = np.divmod(frontier, cols)
+            row_offset %= size
+            col_offset %= size
+            following = np.concatenate(
+                [
+                    frontier[(bits & NORTH != 0) & (row_offset != 0)] - cols,
+                    frontier[(bits & SOUTH != 0) & (row_offset != size - 1)] + cols,
+                    frontier[(bits & WEST != 0) & (col_offset != 0)] - 1,
+                    frontier[(bits & EAST != 0) & (col_offset != size - 1)] + 1,
+                ]
+            )
+            frontier = np.unique(following[scratch[following] < 0])
+            scratch[frontier] = level
+            touched.append(frontier)
+        found = np.where(targets >= 0, scratch[np.maximum(targets, 0)], -1)
+        scratch[np.concatenate(touched)] = -1
+        return found
+
+    def _links(self, cell_id: int) -> dict[int, int]:
+        """In-cluster distances from ``cell_id`` to its cluster's entrances (and itself)."""
+        entrances = self._entrances[self.cluster_of(cell_id)]
+        targets = np.array([[*entrances, cell_id]], dtype=np.int64)
+        distances = self._cluster_distances(np.array([cell_id], dtype=np.int64), targets)[0].tolist()
+        return {entrance: distance for entrance, distance in zip(entrances, distances, strict=False) if distance >= 0}
+
+    def _abstract_search(self, start: int, goal: int, trace: EventLog | None):
+        record = trace.record if trace is not None else None
+        cols = self.cols
+        goal_row, goal_col = divmod(goal, cols)
+        start_links = self._links(start)
+        goal_links = self._links(goal)
+        goal_cluster = self.cluster_of(goal)
+        direct = -1
+        if self.cluster_of(start) == goal_cluster:
+            targets = np.array([[goal]], dtype=np.int64)
+            direct = int(self._cluster_distances(np.array([start], dtype=np.int64), targets)[0, 0])
+
+        tie_breaker = count()
+        heap: list[tuple[int, int, int]] = [(0, next(tie_breaker), start)]
+        g_score = {start: 0}
+        parent = {start: -1}
+        closed: set[int] = set()
+        steps = enqueued = 0
+        peak = 1
+        while heap:
+            _, _, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            steps += 1
+            if record is not None:
+                record(VISIT, current, steps)
+            if current == goal:
+                break
+            base = g_score[current]
+            if current == start:
+                edges = list(start_links.items())
+                if direct >= 0:
+                    edges.append((goal, direct))
+            else:
+                edges = []
+            abstract_edges = self._edges.get(current)
+            if abstract_edges is not None:
+                edges += abstract_edges
+                if current in goal_links:
+                    edges.append((goal, goal_links[current]))
+            for neighbor, weight in edges:
+                candidate = base + weight
+                if neighbor == current or candidate >= g_score.get(neighbor, candidate + 1):
+                    continue
+                g_score[neighbor] = candidate
+                parent[neighbor] = current
+                row, col = divmod(neighbor, cols)
+                heapq.heappush(
+                    heap, (candidate + abs(row - goal_row) + abs(col - goal_col), next(tie_breaker), neighbor)
+                )
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+            peak = max(peak, len(heap))
+
+        if goal not in closed:
+            return [], steps, enqueued, peak
+        abstract = [goal]
+        while parent[abstract[-1]] >= 0:
+            abstract.append(parent[abstract[-1]])
+        return abstract[::-1], steps, enqueued, peak
+
+    def _refine(self, abstract: list[int]) -> list[int]:
+        path = [abstract[0]]
+        for source, target in zip(abstract, abstract[1:], strict=False):
+            if self.cluster_of(source) != self.cluster_of(target):
+                path.append(target)
+            else:
+                path.extend(self._cluster_path(source, target)[1:])
+        return path
+
+    def _cluster_path(self, source: int, target: int) -> list[int]:
+        """Shortest cell path between two cells of the same cluster that stays inside it."""
+        size, cols = self.cluster_size, self.cols
+        cluster_row, cluster_col = divmod(self.cluster_of(source), self.cluster_cols)
+        top, left = cluster_row * size, cluster_col * size
+        mask, moves = self._mask_bytes, self._moves
+        parent = {source: -1}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            for delta in moves[mask[current]]:
+                neighbor = current + delta
+                if neighbor in parent:
+                    continue
+                row, col = divmod(neighbor, cols)
+                if top <= row < top + size and left <= col < left + size:
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+        path = [target]
+        while parent[path[-1]] >= 0:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+
+HPA_CACHE: FingerprintCache[HPAStarPlanner] = FingerprintCache(HPA_CACHE_SIZE)
+
+
+def hpa_star_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cluster_size: int = CLUSTER_SIZE,
+    refine: bool = True,
+) -> SearchResult:
+    """Solver-registry query through a cached ``HPAStarPlanner``; visits are abstract-graph expansions."""
+    planner, hit = HPA_CACHE.get(
+        (graph.fingerprint, cluster_size), lambda: HPAStarPlanner(graph, cluster_size=cluster_size)
+    )
+    result = planner.route_ids(start, goal, trace, refine)
+    result.metrics.update(planner.metrics())
+    result.metrics["hpa_cache_hits"] = int(hit)
+    result.metrics["hpa_cache_misses"] = int(not hit)
+    return result
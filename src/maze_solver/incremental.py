@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+from maze_solver.graph import EAST, NORTH, SOUTH, WEST, MazeGraph, maze_graph
+from maze_solver.grid import PASSAGE, Cell, PackedMaze
+from maze_solver.search import ENQUEUE, VISIT, EventLog, SearchResult
+
+INFINITY = float("inf")
+
+
+class DStarLitePlanner:
+    """Incremental shortest-path planner (Koenig and Likhachev's D* Lite).
+
+    The planner searches backward from ``goal`` and keeps ``g``/``rhs`` estimates
+    between calls. ``update_cells`` opens or closes cells and only re-queues the
+    changed cells and their neighbors; ``replan`` then repairs just the vertices
+    made inconsistent by those changes instead of searching from scratch.
+    ``move_start`` follows a robot along the path using the ``km`` key modifier.
+    """
+
+    def __init__(
+        self,
+        maze: np.ndarray | PackedMaze | MazeGraph,
+        start: Cell,
+        goal: Cell,
+        trace: EventLog | None = None,
+    ) -> None:
+        graph = maze_graph(maze)
+        self.rows, self.cols = graph.shape
+        self._moves = graph.steps
+        self._bounds = _in_bounds_mask(self.rows, self.cols)
+        self.trace = trace
+        self.expansions = 0
+        self.last_expansions = 0
+        self.insertions = 0
+        self.peak_queue = 0
+        self._queue_size = 0
+        self._open = bytearray(graph.passable.tobytes())
+        self._g = array("d", [INFINITY]) * graph.size
+        self._rhs = array("d", [INFINITY]) * graph.size
+        self._queued = bytearray(graph.size)
+        self._key1 = array("d", [0.0]) * graph.size
+        self._key2 = array("d", [0.0]) * graph.size
+        self._heap: list[tuple[float, float, int]] = []
+        self._km = 0.0
+        self._start = self._id(start)
+        self._last = self._start
+        self._goal = self._id(goal)
+        if self._open[self._goal]:
+            self._rhs[self._goal] = 0.0
+            self._push(self._goal)
+
+    @property
+    def start(self) -> Cell:
+        return divmod(self._start, self.cols)
+
+    @property
+    def goal(self) -> Cell:
+        return divmod(self._goal, self.cols)
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue_size
+
+    def is_open(self, cell: Cell) -> bool:
+        row, col = cell
+        return 0 <= row < self.rows and 0 <= col < self.cols and bool(self._open[row * self.cols + col])
+
+    def distance(self, cell: Cell) -> float:
+        """Current cost-to-goal estimate ``g`` for ``cell``."""
+        return self._g[self._id(cell)]
+
+    def update_cells(self, changed: Mapping[Cell, int] | Iterable[Cell]) -> int:
+        """Apply wall changes and queue the affected vertices; returns how many cells changed.
+
+        ``changed`` maps cells to ``WALL``/``PASSAGE``, or lists cells to toggle.
+        """
+        items = changed.items() if isinstance(changed, Mapping) else ((cell, None) for cell in changed)
+        touched: set[int] = set()
+        flipped = 0
+        for cell, value in items:
+            cell_id = self._id(cell)
+            is_open = not self._open[cell_id] if value is None else value == PASSAGE
+            if bool(self._open[cell_id]) == is_open:
+                continue
+            self._open[cell_id] = int(is_open)
+            flipped += 1
+            touched.add(cell_id)
+            touched.update(self._grid_neighbors(cell_id))
+        for cell_id in touched:
+            self._update_vertex(cell_id)
+        return flipped
+
+    def move_start(self, cell: Cell) -> None:
+        """Move the search start (the robot) and bump ``km`` so queued keys stay valid."""
+        new_start = self._id(cell)
+        self._km += self._heuristic(self._last, new_start)
+        self._last = new_start
+        self._start = new_start
+
+    def replan(self) -> list[Cell]:
+        """Repair inconsistent vertices and return the current start-to-goal path."""
+        self.last_expansions = 0
+        self._compute_shortest_path()
+        return [divmod(cell_id, self.cols) for cell_id in self.path_ids()]
+
+    def path_ids(self) -> list[int]:
+        current = self._start
+        if not self._open[current] or self._g[current] == INFINITY:
+            return []
+        path = [current]
+        g = self._g
+        while current != self._goal:
+            best, best_cost = -1, INFINITY
+            for neighbor in self._open_neighbors(current):
+                if 1.0 + g[neighbor] < best_cost:
+                    best, best_cost = neighbor, 1.0 + g[neighbor]
+            if best < 0 or len(path) > len(g):
+                return []
+            current = best
+            path.append(current)
+        return path
+
+    def _id(self, cell: Cell) -> int:
+        row, col = cell
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Cell {cell} is outside the maze.")
+        return row * self.cols + col
+
+    def _heuristic(self, a: int, b: int) -> int:
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        return abs(a_row - b_row) + abs(a_col - b_col)
+
+    def _grid_neighbors(self, cell_id: int) -> list[int]:
+        return [cell_id + delta for delta in self._moves[self._bounds[cell_id]]]
+
+    def _open_neighbors(self, cell_id: int) -> list[int]:
+        is_open = self._open
+        if not is_open[cell_id]:
+            return []
+        return [cell_id + delta for delta in self._moves[self._bounds[cell_id]] if is_open[cell_id + delta]]
+
+    def _key(self, cell_id: int) -> tuple[float, float]:
+        best = min(self._g[cell_id], self._rhs[cell_id])
+        return best + self._heuristic(self._start, cell_id) + self._km, best
+
+    def _push(self, cell_id: int) -> None:
+        key1, key2 = self._key(cell_id)
+        self._key1[cell_id] = key1
+        self._key2[cell_id] = key2
+        if not self._queued[cell_id]:
+            self._queued[cell_id] = 1
+            self._queue_size += 1
+            self.peak_queue = max(self.peak_queue, self._queue_size)
+        self.insertions += 1
+        heapq.heappush(self._heap, (key1, key2, cell_id))
+        if self.trace is not None:
+            self.trace.record(ENQUEUE, cell_id, self.expansions)
+
+    def _dequeue(self, cell_id: int) -> None:
+        if self._queued[cell_id]:
+            self._queued[cell_id] = 0
+            self._queue_size -= 1
+
+    def _top(self) -> tuple[float, float, int] | None:
+        heap = self._heap
+        while heap:
+            key1, key2, cell_id = heap[0]
+            if self._queued[cell_id] and key1 == self._key1[cell_id] and key2 == self._key2[cell_id]:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _update_vertex(self, cell_id: int) -> None:
+        self._recompute_rhs(cell_id)
+        self._refresh(cell_id)
+
+    def _recompute_rhs(self, cell_id: int) -> None:
+        if cell_id == self._goal:
+            self._rhs[cell_id] = 0.0 if self._open[cell_id] else INFINITY
+            return
+        g = self._g
+        best = INFINITY
+        for neighbor in self._open_neighbors(cell_id):
+            if g[neighbor] + 1.0 < best:
+                best = g[neighbor] + 1.0
+        self._rhs[cell_id] = best
+
+    def _refresh(self, cell_id: int) -> None:
+        """Queue ``cell_id`` with a fresh key if inconsistent, otherwise drop it from the queue."""
+        if self._g[cell_id] != self._rhs[cell_id]:
+            self._push(cell_id)
+        else:
+            self._dequeue(cell_id)
+
+    def _compute_shortest_path(self) -> None:
+        g, rhs, goal = self._g, self._rhs, self._goal
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            start = self._start
+            if (top[0], top[1]) >= self._key(start) and rhs[start] == g[start]:
+                break
+            key1, key2, current = heapq.heappop(self._heap)
+            if (key1, key2) < self._key(current):
+                self._push(current)
+                continue
+            self._dequeue(current)
+            self.expansions += 1
+            self.last_expansions += 1
+            if self.trace is not None:
+                self.trace.record(VISIT, current, self.expansions)
+            if g[current] > rhs[current]:
+                g[current] = rhs[current]
+                through = g[current] + 1.0
+                for neighbor in self._open_neighbors(current):
+                    if neighbor != goal and through < rhs[neighbor]:
+                        rhs[neighbor] = through
+                        self._refresh(neighbor)
+            else:
+                through = g[current] + 1.0
+                g[current] = INFINITY
+                for neighbor in self._open_neighbors(current):
+                    if rhs[neighbor] == through:
+                        self._recompute_rhs(neighbor)
+                    self._refresh(neighbor)
+                self._update_vertex(current)
+
+
+def _in_bounds_mask(rows: int, cols: int) -> bytes:
+    """NESW bits for the grid neighbors of each cell that lie inside the maze."""
+    row, col = np.divmod(np.arange(rows * cols), cols)
+    mask = (row > 0) * NORTH | (row < rows - 1) * SOUTH | (col > 0) * WEST | (col < cols - 1) * EAST
+    return mask.astype(np.uint8).tobytes()
+
+
+def d_star_lite_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    """Single static query through ``DStarLitePlanner`` for the solver registry."""
+    planner = DStarLitePlanner(graph, divmod(start, graph.cols), divmod(goal, graph.cols), trace=trace)
+    planner.replan()
+    return SearchResult(
+        path=planner.path_ids(),
+        steps=planner.expansions,
+        visited=planner.expansions,
+        enqueued=planner.insertions,
+        peak_frontier=planner.peak_queue,
+    )
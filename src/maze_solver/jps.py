@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import count
+
+import numpy as np
+
+from maze_solver.cache import FingerprintCache
+from maze_solver.graph import DIRECTION_BITS, EAST, NORTH, SOUTH, WEST, MazeGraph
+from maze_solver.search import (
+    ENQUEUE,
+    NO_PARENT,
+    UNREACHED,
+    VISIT,
+    EventLog,
+    SearchResult,
+    manhattan_to,
+    walk_parents,
+)
+
+# Direction indexes follow ``DIRECTION_BITS``: north, south, west, east.
+_HORIZONTAL = (False, False, True, True)
+_SIDE_BITS = ((WEST, EAST), (WEST, EAST), (NORTH, SOUTH), (NORTH, SOUTH))
+_PRUNED_DIRECTIONS = ((0, 2, 3), (1, 2, 3), (0, 1, 2), (0, 1, 3))
+_ALL_DIRECTIONS = (0, 1, 2, 3)
+_NO_HEADING = 255
+JUMP_TABLE_CACHE_SIZE = 8
+
+
+def direction_deltas(graph: MazeGraph) -> tuple[int, int, int, int]:
+    return (-graph.cols, graph.cols, -1, 1)
+
+
+def jump(graph: MazeGraph, node: int, direction: int, goal: int) -> tuple[int, int]:
+    """Scan from ``node`` in ``direction`` and return ``(jump_point, distance)``.
+
+    Horizontal scans stop where a north or south opening appears that the
+    previous cell did not have (a forced neighbor). Vertical scans stop on
+    west/east forced neighbors and on any cell from which a horizontal scan
+    reaches a jump point. Returns ``(NO_PARENT, distance)`` on a dead end.
+    """
+    mask = graph.mask_bytes
+    bit = DIRECTION_BITS[direction]
+    delta = direction_deltas(graph)[direction]
+    first_side, second_side = _SIDE_BITS[direction]
+    horizontal = _HORIZONTAL[direction]
+    distance = 0
+    while mask[node] & bit:
+        previous = mask[node]
+        node += delta
+        distance += 1
+        if node == goal:
+            return node, distance
+        here = mask[node]
+        if (here & first_side and not previous & first_side) or (here & second_side and not previous & second_side):
+            return node, distance
+        if not horizontal and (
+            (here & WEST and jump(graph, node, 2, goal)[0] != NO_PARENT)
+            or (here & EAST and jump(graph, node, 3, goal)[0] != NO_PARENT)
+        ):
+            return node, distance
+    return NO_PARENT, distance
+
+
+def jump_point_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    """4-connected Jump Point Search.
+
+    Successors are pruned to the heading plus its two perpendicular turns and
+    each is replaced by the next jump point along that direction, so straight
+    runs of symmetric cells are scanned without entering the open list. Only
+    jump points are recorded as visits; the returned path is expanded back to
+    every cell between them.
+    """
+    record = trace.record if trace is not None else None
+    heuristic = manhattan_to(graph, goal)
+    tie_breaker = count()
+    heap: list[tuple[int, int, int]] = [(heuristic(start), next(tie_breaker), start)]
+    g_score = array("i", [UNREACHED]) * graph.size
+    g_score[start] = 0
+    parent = array("i", [NO_PARENT]) * graph.size
+    heading = bytearray([_NO_HEADING]) * graph.size
+    closed = bytearray(graph.size)
+    mask = graph.mask_bytes
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        directions = _ALL_DIRECTIONS if heading[current] == _NO_HEADING else _PRUNED_DIRECTIONS[heading[current]]
+        for direction in directions:
+            if not mask[current] & DIRECTION_BITS[direction]:
+                continue
+            successor, distance = jump(graph, current, direction, goal)
+            if successor == NO_PARENT:
+                continue
+            tentative_g = g_score[current] + distance
+            if tentative_g < g_score[successor]:
+                g_score[successor] = tentative_g
+                parent[successor] = current
+                heading[successor] = direction
+                heapq.heappush(heap, (tentative_g + heuristic(successor), next(tie_breaker), successor))
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, successor, steps)
+        if len(heap) > peak_frontier:
+            peak_frontier = len(heap)
+
+    return SearchResult(
+        path=expand_jump_path(graph, walk_parents(parent, start, goal)),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+    )
+
+
+def expand_jump_path(graph: MazeGraph, jump_points: list[int]) -> list[int]:
+    """Fill in the straight runs between consecutive jump points."""
+    if len(jump_points) < 2:
+        return jump_points
+    cols = graph.cols
+    path = [jump_points[0]]
+    for source, target in zip(jump_points, jump_points[1:], strict=False):
+        difference = target - source
+        delta = (cols if difference > 0 else -cols) if difference % cols == 0 else (1 if difference > 0 else -1)
+        path.extend(range(source + delta, target + delta, delta))
+    return path
+
+
+@dataclass(frozen=True, eq=False)
+class JumpTables:
+    """Precomputed JPS+ jump distances, one int32 row per direction in ``DIRECTION_BITS`` order.
+
+    ``distances[d, id] > 0`` is the distance from ``id`` to the next jump point
+    heading ``d``; otherwise ``-distances[d, id]`` open cells lie before a wall.
+    Jump points are goal-independent, so one table serves every query on a maze.
+    """
+
+    fingerprint: str
+    distances: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.distances.nbytes)
+
+    @cached_property
+    def lists(self) -> tuple[list[int], list[int], list[int], list[int]]:
+        north, south, west, east = (row.tolist() for row in self.distances)
+        return north, south, west, east
+
+
+def _scan_forward(stop: np.ndarray, passable: np.ndarray) -> np.ndarray:
+    """Signed jump distances toward increasing column index for each row."""
+    cols = stop.shape[1]
+    index = np.arange(cols)
+    next_stop = np.full(stop.shape, cols)
+    next_wall = np.full(stop.shape, cols)
+    next_stop[:, :-1] = np.minimum.accumulate(np.where(stop, index, cols)[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    next_wall[:, :-1] = np.minimum.accumulate(np.where(passable, cols, index)[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    distances = np.where(next_stop < next_wall, next_stop - index, index + 1 - next_wall)
+    distances[~passable] = 0
+    return distances.astype(np.int32)
+
+
+def _scan(stop: np.ndarray, passable: np.ndarray, axis: int, forward: bool) -> np.ndarray:
+    if axis == 0:
+        return _scan(stop.T, passable.T, 1, forward).T
+    if forward:
+        return _scan_forward(stop, passable)
+    return _scan_forward(stop[:, ::-1], passable[:, ::-1])[:, ::-1]
+
+
+def build_jump_tables(graph: MazeGraph) -> JumpTables:
+    """Compute all four jump-distance tables with row/column-wise NumPy scans."""
+    rows, cols = graph.shape
+    mask = graph.mask.reshape(rows, cols)
+    passable = graph.passable.reshape(rows, cols)
+    north, south, west, east = ((mask & bit) != 0 for bit in (NORTH, SOUTH, WEST, EAST))
+
+    # A horizontal step stops on a cell that gains a north or south opening the previous cell lacked.
+    east_stop = np.zeros_like(passable)
+    west_stop = np.zeros_like(passable)
+    east_stop[:, 1:] = west[:, 1:] & ((north[:, 1:] & ~north[:, :-1]) | (south[:, 1:] & ~south[:, :-1]))
+    west_stop[:, :-1] = east[:, :-1] & ((north[:, :-1] & ~north[:, 1:]) | (south[:, :-1] & ~south[:, 1:]))
+    west_distance = _scan(west_stop, passable, axis=1, forward=False)
+    east_distance = _scan(east_stop, passable, axis=1, forward=True)
+
+    # A vertical step also stops wherever a horizontal scan would reach a jump point.
+    sideways = (west_distance > 0) | (east_distance > 0)
+    south_stop = np.zeros_like(passable)
+    north_stop = np.zeros_like(passable)
+    south_stop[1:, :] = north[1:, :] & ((west[1:, :] & ~west[:-1, :]) | (east[1:, :] & ~east[:-1, :]) | sideways[1:, :])
+    north_stop[:-1, :] = south[:-1, :] & (
+        (west[:-1, :] & ~west[1:, :]) | (east[:-1, :] & ~east[1:, :]) | sideways[:-1, :]
+    )
+    north_distance = _scan(north_stop, passable, axis=0, forward=False)
+    south_distance = _scan(south_stop, passable, axis=0, forward=True)
+
+    distances = np.stack([north_distance, south_distance, west_distance, east_distance]).reshape(4, rows * cols)
+    return JumpTables(fingerprint=graph.fingerprint, distances=np.ascontiguousarray(distances, dtype=np.int32))
+
+
+JUMP_TABLE_CACHE: FingerprintCache[JumpTables] = FingerprintCache(JUMP_TABLE_CACHE_SIZE)
+
+
+def jump_tables(graph: MazeGraph) -> JumpTables:
+    """Return the cached ``JumpTables`` for ``graph``, building them on first use."""
+    tables, _hit = JUMP_TABLE_CACHE.get(graph.fingerprint, lambda: build_jump_tables(graph))
+    return tables
+
+
+def jps_plus_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    """JPS+ query over cached per-direction jump tables.
+
+    Each expansion reads its successors straight from the tables instead of
+    scanning. Because the tables ignore the goal, a ray that passes the goal's
+    row or column yields the cell where it crosses that line instead of its
+    table jump point, which keeps the search complete and optimal.
+    """
+    tables, hit = JUMP_TABLE_CACHE.get(graph.fingerprint, lambda: build_jump_tables(graph))
+    distances = tables.lists
+    deltas = direction_deltas(graph)
+    cols = graph.cols
+    goal_row, goal_col = divmod(goal, cols)
+    record = trace.record if trace is not None else None
+    heuristic = manhattan_to(graph, goal)
+    tie_breaker = count()
+    heap: list[tuple[int, int, int]] = [(heuristic(start), next(tie_breaker), start)]
+    g_score = array("i", [UNREACHED]) * graph.size
+    g_score[start] = 0
+    parent = array("i", [NO_PARENT]) * graph.size
+    heading = bytearray([_NO_HEADING]) * graph.size
+    closed = bytearray(graph.size)
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        row, col = divmod(current, cols)
+        directions = _ALL_DIRECTIONS if heading[current] == _NO_HEADING else _PRUNED_DIRECTIONS[heading[current]]
+        for direction in directions:
+            distance = distances[direction][current]
+            reach = distance if distance > 0 else -distance
+            if reach == 0:
+                continue
+            if direction == 0:
+                offset = row - goal_row
+            elif direction == 1:
+                offset = goal_row - row
+            elif row == goal_row:
+                offset = col - goal_col if direction == 2 else goal_col - col
+            else:
+                offset = 0
+            if 0 < offset <= reach:
+                distance = offset
+            elif distance <= 0:
+                continue
+            successor = current + deltas[direction] * distance
+            tentative_g = g_score[current] + distance
+            if tentative_g < g_score[successor]:
+                g_score[successor] = tentative_g
+                parent[successor] = current
+                heading[successor] = direction
+                heapq.heappush(heap, (tentative_g + heuristic(successor), next(tie_breaker), successor))
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, successor, steps)
+        if len(heap) > peak_frontier:
+            peak_frontier = len(heap)
+
+    return SearchResult(
+        path=expand_jump_path(graph, walk_parents(parent, start, goal)),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"jump_table_cache_hits": int(hit), "jump_table_cache_misses": int(not hit)},
+    )
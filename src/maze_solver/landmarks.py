@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import time
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from maze_solver.cache import FingerprintCache
+from maze_solver.graph import MazeGraph
+from maze_solver.search import EventLog, SearchResult, SearchWorkspace, a_star_search, bfs_distances
+
+LANDMARK_COUNT = 8
+LANDMARK_STRATEGIES = ("farthest", "random")
+LANDMARK_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True, eq=False)
+class LandmarkTable:
+    """Unit-cost distances from each landmark to every cell, one int32 row per landmark.
+
+    ``distances[i, id]`` is -1 where ``id`` is unreachable from ``landmarks[i]``.
+    """
+
+    fingerprint: str
+    strategy: str
+    landmarks: np.ndarray
+    distances: np.ndarray
+    preprocess_seconds: float
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.landmarks.nbytes + self.distances.nbytes)
+
+    @cached_property
+    def rows(self) -> tuple[array, ...]:
+        return tuple(array("i", row.tobytes()) for row in self.distances)
+
+    def heuristic(self, goal: int):
+        """Max triangle-inequality bound ``|d(L, goal) - d(L, v)|`` over all landmarks.
+
+        Cells in another component than a landmark read -1 from its row on both
+        sides, so that landmark contributes 0 instead of an inadmissible bound.
+        """
+        pairs = [(row[goal], row) for row in self.rows]
+        if not pairs:
+            return lambda cell_id: 0
+
+        def bound(cell_id: int) -> int:
+            return max(abs(to_goal - row[cell_id]) for to_goal, row in pairs)
+
+        return bound
+
+
+def build_landmark_table(
+    graph: MazeGraph, count: int = LANDMARK_COUNT, strategy: str = "farthest", seed: int = 0
+) -> LandmarkTable:
+    """Pick landmarks and BFS from each one.
+
+    ``farthest`` starts from the cell farthest from a random open cell and then
+    repeatedly adds the cell farthest from every landmark chosen so far, treating
+    cells no landmark reaches as infinitely far so every component gets covered.
+    ``random`` samples open cells uniformly.
+    """
+    if strategy not in LANDMARK_STRATEGIES:
+        raise ValueError(f"Unknown landmark strategy: {strategy}")
+    began = time.perf_counter()
+    open_ids = graph.open_ids()
+    count = min(count, int(open_ids.size))
+    rng = np.random.default_rng(seed)
+    rows: list[np.ndarray] = []
+    if strategy == "random":
+        landmarks = rng.choice(open_ids, size=count, replace=False).tolist()
+        rows = [bfs_distances(graph, landmark) for landmark in landmarks]
+    else:
+        landmarks = []
+        if count:
+            probe = bfs_distances(graph, int(rng.choice(open_ids)))
+            landmarks.append(int(open_ids[int(probe[open_ids].argmax())]))
+        closest = np.full(open_ids.size, np.iinfo(np.int64).max, dtype=np.int64)
+        while landmarks:
+            distances = bfs_distances(graph, landmarks[-1])
+            rows.append(distances)
+            if len(landmarks) == count:
+                break
+            reached = distances[open_ids]
+            np.minimum(closest, reached, out=closest, where=reached >= 0)
+            landmarks.append(int(open_ids[int(closest.argmax())]))
+    return LandmarkTable(
+        fingerprint=graph.fingerprint,
+        strategy=strategy,
+        landmarks=np.asarray(landmarks, dtype=np.int32),
+        distances=np.asarray(rows, dtype=np.int32).reshape(len(rows), graph.size),
+        preprocess_seconds=time.perf_counter() - began,
+    )
+
+
+LANDMARK_CACHE: FingerprintCache[LandmarkTable] = FingerprintCache(LANDMARK_CACHE_SIZE)
+
+
+def landmark_table(
+    graph: MazeGraph, count: int = LANDMARK_COUNT, strategy: str = "farthest", seed: int = 0
+) -> tuple[LandmarkTable, bool]:
+    """Return ``(table, cache_hit)`` for ``graph``, building the table on first use."""
+    return LANDMARK_CACHE.get(
+        (graph.fingerprint, count, strategy, seed), lambda: build_landmark_table(graph, count, strategy, seed)
+    )
+
+
+def alt_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    landmark_count: int = LANDMARK_COUNT,
+    strategy: str = "farthest",
+    compare_manhattan: bool = False,
+    workspace: SearchWorkspace | None = None,
+) -> SearchResult:
+    """A* guided by landmark lower bounds (ALT) instead of Manhattan distance.
+
+    With ``compare_manhattan`` the same query is also run with plain Manhattan
+    A* so the metrics report how many expansions the landmarks saved. It is off
+    by default because the second search costs more than the landmarks save.
+    """
+    table, hit = landmark_table(graph, landmark_count, strategy)
+    result = a_star_search(graph, start, goal, trace, heuristic=table.heuristic(goal), workspace=workspace)
+    result.metrics.update(
+        {
+            "landmarks": int(table.landmarks.size),
+            "landmark_table_bytes": table.nbytes,
+            "landmark_seconds": round(table.preprocess_seconds, 4),
+            "landmark_cache_hits": int(hit),
+            "landmark_cache_misses": int(not hit),
+        }
+    )
+    if compare_manhattan:
+        baseline = a_star_search(graph, start, goal, workspace=workspace).visited
+        result.metrics["manhattan_visited"] = baseline
+        result.metrics["visited_ratio"] = round(result.visited / baseline, 4) if baseline else 0.0
+    return result
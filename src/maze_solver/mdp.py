@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from maze_solver.graph import MazeGraph
+from maze_solver.search import OPEN_DIRECTIONS, VISIT, EventLog, SearchResult, cell_costs
+
+INFINITY = float("inf")
+TOLERANCE = 1e-6
+LEARNING_RATE = 0.5
+NO_ACTION = -1
+
+
+@dataclass(frozen=True, eq=False)
+class ValueField:
+    """Cost-to-go table for one goal plus the greedy policy it induces.
+
+    ``values`` is float64 with ``inf`` where the goal is unreachable. ``policy``
+    holds an index into the north, south, west, east moves (``NO_ACTION`` on the
+    goal and unreachable cells). ``reached_at`` is the iteration in which each
+    cell first got a finite value, -1 if it never did.
+    """
+
+    goal: int
+    values: np.ndarray
+    policy: np.ndarray
+    reached_at: np.ndarray
+    iterations: int
+    residuals: tuple[float, ...]
+    converged: bool
+
+    @property
+    def residual(self) -> float:
+        return self.residuals[-1] if self.residuals else 0.0
+
+    def path(self, graph: MazeGraph, start: int) -> list[int]:
+        if not np.isfinite(self.values[start]):
+            return []
+        deltas = _deltas(graph)
+        path = [start]
+        while path[-1] != self.goal and len(path) <= graph.size:
+            path.append(path[-1] + deltas[self.policy[path[-1]]])
+        return path if path[-1] == self.goal else []
+
+
+def _deltas(graph: MazeGraph) -> tuple[int, int, int, int]:
+    return (-graph.cols, graph.cols, -1, 1)
+
+
+def _positive_costs(graph: MazeGraph, cost_map: np.ndarray | None) -> np.ndarray:
+    if cost_map is None:
+        return np.ones(graph.size)
+    costs = np.frombuffer(cell_costs(graph, cost_map), dtype=np.float64)
+    if np.any(costs[graph.passable] <= 0):
+        raise ValueError("Value and policy iteration require positive cell costs.")
+    return costs
+
+
+def _action_values(graph: MazeGraph, values: np.ndarray, costs: np.ndarray) -> np.ndarray:
+    """Bellman candidates ``cost[n] + values[n]`` for each move as a (4, size) array, ``inf`` where blocked."""
+    closed = ~OPEN_DIRECTIONS[graph.mask].T
+    entering = values + costs
+    actions = np.full((4, graph.size), INFINITY)
+    for row, delta in zip(actions, _deltas(graph), strict=True):
+        if delta > 0:
+            row[:-delta] = entering[delta:]
+        else:
+            row[-delta:] = entering[:delta]
+    actions[closed] = INFINITY
+    return actions
+
+
+def _residual(old: np.ndarray, new: np.ndarray) -> float:
+    improved = new < old
+    if not improved.any():
+        return 0.0
+    if np.isinf(old[improved]).any():
+        return INFINITY
+    return float((old[improved] - new[improved]).max())
+
+
+def _greedy_policy(actions: np.ndarray, values: np.ndarray, goal: int) -> np.ndarray:
+    policy = actions.argmin(axis=0).astype(np.int8)
+    policy[~np.isfinite(values)] = NO_ACTION
+    policy[goal] = NO_ACTION
+    return policy
+
+
+def _sweep(values: np.ndarray, costs: np.ndarray, closed: np.ndarray, axis: int, reverse: bool) -> None:
+    """One Gauss-Seidel pass along ``axis``: each row (or column) reads the one just updated before it."""
+    lines = range(values.shape[axis] - 2, -1, -1) if reverse else range(1, values.shape[axis])
+    step = 1 if reverse else -1
+    for line in lines:
+        source = (slice(None), line + step) if axis else (line + step,)
+        target = (slice(None), line) if axis else (line,)
+        candidate = values[source] + costs[source]
+        candidate[closed[target]] = INFINITY
+        np.minimum(values[target], candidate, out=values[target])
+
+
+def value_iteration(
+    graph: MazeGraph,
+    goal: int,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+    gauss_seidel: bool = False,
+) -> ValueField:
+    """Bellman backups over the whole grid until no value improves by more than ``tolerance``.
+
+    The default is synchronous (Jacobi): every cell takes the min over shifted
+    copies of the previous table. ``gauss_seidel`` instead runs four directional
+    sweeps per iteration (down, up, right, left) that update rows and columns in
+    place, so values travel along a whole corridor in one iteration.
+    """
+    costs = _positive_costs(graph, cost_map)
+    limit = graph.size if max_iterations is None else max_iterations
+    values = np.full(graph.size, INFINITY)
+    values[goal] = 0.0 if graph.passable[goal] else INFINITY
+    reached_at = np.where(np.isfinite(values), 0, -1).astype(np.int32)
+    grid, grid_costs = values.reshape(graph.shape), costs.reshape(graph.shape)
+    closed = {bit: ~OPEN_DIRECTIONS[graph.mask, bit].reshape(graph.shape) for bit in range(4)}
+    residuals: list[float] = []
+    while len(residuals) < limit:
+        previous = values.copy()
+        if gauss_seidel:
+            _sweep(grid, grid_costs, closed[0], axis=0, reverse=False)
+            _sweep(grid, grid_costs, closed[1], axis=0, reverse=True)
+            _sweep(grid, grid_costs, closed[2], axis=1, reverse=False)
+            _sweep(grid, grid_costs, closed[3], axis=1, reverse=True)
+        else:
+            np.minimum(values, _action_values(graph, values, costs).min(axis=0), out=values)
+        residuals.append(_residual(previous, values))
+        reached_at[(reached_at < 0) & np.isfinite(values)] = len(residuals)
+        if residuals[-1] <= tolerance:
+            break
+    return ValueField(
+        goal=goal,
+        values=values,
+        policy=_greedy_policy(_action_values(graph, values, costs), values, goal),
+        reached_at=reached_at,
+        iterations=len(residuals),
+        residuals=tuple(residuals),
+        converged=bool(residuals) and residuals[-1] <= tolerance,
+    )
+
+
+def _evaluate_policy(graph: MazeGraph, policy: np.ndarray, costs: np.ndarray, goal: int) -> np.ndarray:
+    """Exact policy evaluation by pointer jumping: ``log2(size)`` rounds of ``acc += acc[next]; next = next[next]``."""
+    ids = np.arange(graph.size)
+    following = np.where(policy >= 0, ids + np.asarray(_deltas(graph))[policy], ids)
+    total = np.where(policy >= 0, costs[following], 0.0)
+    for _round in range(max(1, int(graph.size).bit_length())):
+        total += total[following]
+        following = following[following]
+    return np.where(following == goal, total, INFINITY)
+
+
+def policy_iteration(
+    graph: MazeGraph,
+    goal: int,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+) -> ValueField:
+    """Alternate exact policy evaluation with greedy improvement until the policy stops changing.
+
+    The initial policy takes each cell's first open move. Improvement only
+    switches a cell's action when another one is better by more than
+    ``tolerance``, which keeps ties from oscillating. Residuals are Bellman
+    residuals of each evaluated policy.
+    """
+    costs = _positive_costs(graph, cost_map)
+    limit = graph.size if max_iterations is None else max_iterations
+    policy = np.where(graph.mask > 0, OPEN_DIRECTIONS[graph.mask].argmax(axis=1), NO_ACTION).astype(np.int8)
+    policy[goal] = NO_ACTION
+    values = np.full(graph.size, INFINITY)
+    reached_at = np.full(graph.size, -1, dtype=np.int32)
+    residuals: list[float] = []
+    changed = True
+    while changed and len(residuals) < limit:
+        if graph.passable[goal]:
+            values = _evaluate_policy(graph, policy, costs, goal)
+        reached_at[(reached_at < 0) & np.isfinite(values)] = len(residuals)
+        actions = _action_values(graph, values, costs)
+        best = actions.argmin(axis=0)
+        best_values = actions[best, np.arange(graph.size)]
+        current = actions[np.maximum(policy, 0), np.arange(graph.size)]
+        switch = np.where(policy >= 0, best_values < current - tolerance, np.isfinite(best_values))
+        switch[goal] = False
+        policy[switch] = best[switch]
+        changed = bool(switch.any())
+        residuals.append(_residual(values, np.minimum(values, best_values)))
+    return ValueField(
+        goal=goal,
+        values=values,
+        policy=_greedy_policy(_action_values(graph, values, costs), values, goal),
+        reached_at=reached_at,
+        iterations=len(residuals),
+        residuals=tuple(residuals),
+        converged=not changed,
+    )
+
+
+def q_learning(
+    graph: MazeGraph,
+    goal: int,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+    learning_rate: float = LEARNING_RATE,
+) -> ValueField:
+    """Synchronous Q-learning: every state-action pair moves ``learning_rate`` of the way to its target.
+
+    Moves are deterministic, so each sweep backs up all ``(cell, move)`` pairs
+    of the (4, size) Q table at once instead of sampling episodes. A pair takes
+    its target outright the first time the target becomes finite.
+    """
+    if not 0 < learning_rate <= 1:
+        raise ValueError("learning_rate must be in (0, 1].")
+    costs = _positive_costs(graph, cost_map)
+    limit = graph.size if max_iterations is None else max_iterations
+    values = np.full(graph.size, INFINITY)
+    values[goal] = 0.0 if graph.passable[goal] else INFINITY
+    q_table = np.full((4, graph.size), INFINITY)
+    reached_at = np.where(np.isfinite(values), 0, -1).astype(np.int32)
+    residuals: list[float] = []
+    while len(residuals) < limit:
+        target = _action_values(graph, values, costs)
+        known = np.isfinite(q_table)
+        q_table[known] += learning_rate * (target[known] - q_table[known])
+        q_table[~known] = target[~known]
+        previous = values
+        values = q_table.min(axis=0)
+        values[goal] = previous[goal]
+        residuals.append(_residual(previous, values))
+        reached_at[(reached_at < 0) & np.isfinite(values)] = len(residuals)
+        if residuals[-1] <= tolerance:
+            break
+    return ValueField(
+        goal=goal,
+        values=values,
+        policy=_greedy_policy(q_table, values, goal),
+        reached_at=reached_at,
+        iterations=len(residuals),
+        residuals=tuple(residuals),
+        converged=bool(residuals) and residuals[-1] <= tolerance,
+    )
+
+
+def _field_result(graph: MazeGraph, field: ValueField, start: int, trace: EventLog | None) -> SearchResult:
+    """Report cells in the order their values became finite, one batch per iteration."""
+    reached = np.flatnonzero(field.reached_at >= 0)
+    reached = reached[np.argsort(field.reached_at[reached], kind="stable")]
+    batches = np.bincount(field.reached_at[reached]) if reached.size else np.zeros(1, dtype=np.int64)
+    if trace is not None:
+        for iteration, batch in enumerate(np.split(reached, np.cumsum(batches)[:-1])):
+            trace.record_batch(VISIT, batch, iteration)
+    return SearchResult(
+        path=field.path(graph, start),
+        steps=field.iterations,
+        visited=int(reached.size),
+        enqueued=int(reached.size),
+        peak_frontier=int(batches.max()),
+        metrics={
+            "iterations": field.iterations,
+            "residual": field.residual,
+            "converged": int(field.converged),
+        },
+    )
+
+
+def value_iteration_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+    gauss_seidel: bool = False,
+) -> SearchResult:
+    field = value_iteration(graph, goal, cost_map, tolerance, max_iterations, gauss_seidel)
+    return _field_result(graph, field, start, trace)
+
+
+def fast_sweeping_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+) -> SearchResult:
+    field = value_iteration(graph, goal, cost_map, tolerance, max_iterations, gauss_seidel=True)
+    return _field_result(graph, field, start, trace)
+
+
+def policy_iteration_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+) -> SearchResult:
+    field = policy_iteration(graph, goal, cost_map, tolerance, max_iterations)
+    return _field_result(graph, field, start, trace)
+
+
+def q_learning_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+    tolerance: float = TOLERANCE,
+    max_iterations: int | None = None,
+    learning_rate: float = LEARNING_RATE,
+) -> SearchResult:
+    field = q_learning(graph, goal, cost_map, tolerance, max_iterations, learning_rate)
+    return _field_result(graph, field, start, trace)
@@ -0,0 +1,1263 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from itertools import count
+
+import numpy as np
+
+from maze_solver.cache import ByteBoundedCache
+from maze_solver.frontier import DEFAULT_FRONTIER, Frontier, RadixHeapFrontier, frontier_stats, make_frontier
+from maze_solver.graph import DIRECTION_BITS, MazeGraph
+from maze_solver.grid import cost_map_fingerprint
+
+VISIT = 0
+ENQUEUE = 1
+PATH = 2
+DONE = 3
+ACTION_NAMES = ("visit", "enqueue", "path", "done")
+ACTION_CODES = {name: code for code, name in enumerate(ACTION_NAMES)}
+NO_PARENT = -1
+UNREACHED = 2**31 - 1
+OPEN_DIRECTIONS = (np.arange(16)[:, None] & np.array(DIRECTION_BITS)) != 0
+TREE_CACHE_BYTES = 64 * 2**20
+MAX_EPOCH = 255
+
+IdWeightFunction = Callable[[int, int], float]
+
+
+class EventLog:
+    """Columnar solver trace: int8 action codes, int32 cell ids and int32 step counts.
+
+    Events are appended to growable ``array`` buffers at 9 bytes each, so a
+    10M-event trace takes about 90 MB instead of several GB of ``SolverEvent``
+    tuples. Iterating the log yields the same ``(action, cell, steps)`` tuples the
+    solver generators produce; ``done`` events carry no cell.
+    """
+
+    def __init__(self, cols: int) -> None:
+        self.cols = cols
+        self._actions = array("b")
+        self._cells = array("i")
+        self._steps = array("i")
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __iter__(self) -> Iterator[tuple[str, tuple[int, int] | None, int]]:
+        cols = self.cols
+        for action, cell_id, steps in zip(self._actions, self._cells, self._steps, strict=True):
+            yield ACTION_NAMES[action], (divmod(cell_id, cols) if cell_id >= 0 else None), steps
+
+    @property
+    def nbytes(self) -> int:
+        return len(self) * (self._actions.itemsize + self._cells.itemsize + self._steps.itemsize)
+
+    @property
+    def actions(self) -> np.ndarray:
+        return np.array(self._actions, dtype=np.int8)
+
+    @property
+    def cell_ids(self) -> np.ndarray:
+        return np.array(self._cells, dtype=np.int32)
+
+    @property
+    def steps(self) -> np.ndarray:
+        return np.array(self._steps, dtype=np.int32)
+
+    @property
+    def last_step(self) -> int:
+        return self._steps[-1] if self._steps else 0
+
+    def record(self, action: int, cell_id: int, steps: int) -> None:
+        self._actions.append(action)
+        self._cells.append(cell_id)
+        self._steps.append(steps)
+
+    def record_path(self, path: list[int], steps: int) -> None:
+        self._actions.extend([PATH] * len(path))
+        self._cells.extend(path)
+        self._steps.extend([steps] * len(path))
+
+    def record_batch(self, action: int, cell_ids: np.ndarray, steps: int) -> None:
+        self._actions.extend(array("b", [action]) * len(cell_ids))
+        self._cells.frombytes(np.asarray(cell_ids, dtype=np.int32).tobytes())
+        self._steps.extend(array("i", [steps]) * len(cell_ids))
+
+    def append(self, event: tuple[str, tuple[int, int] | None, int]) -> None:
+        action, cell, steps = event
+        cell_id = NO_PARENT if cell is None else cell[0] * self.cols + cell[1]
+        self.record(ACTION_CODES[action], cell_id, steps)
+
+    def ids(self, action: int) -> np.ndarray:
+        """Cell ids recorded with ``action``, in event order (duplicates kept)."""
+        return self.cell_ids[self.actions == action]
+
+    def unique_ids(self, action: int) -> np.ndarray:
+        return np.unique(self.ids(action))
+
+    def cells(self, action: int) -> set[tuple[int, int]]:
+        rows, cols = np.divmod(self.unique_ids(action), self.cols)
+        return set(zip(rows.tolist(), cols.tolist(), strict=True))
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    path: list[int]
+    steps: int
+    visited: int = 0
+    enqueued: int = 0
+    peak_frontier: int = 0
+    metrics: dict[str, float] = field(default_factory=dict)
+
+
+def walk_parents(parent: array | np.ndarray, start: int, goal: int) -> list[int]:
+    if start == goal:
+        return [start]
+    if parent[goal] == NO_PARENT:
+        return []
+    path = [goal]
+    current = goal
+    while current != start:
+        current = int(parent[current])
+        path.append(current)
+    path.reverse()
+    return path
+
+
+class SearchWorkspace:
+    """Per-query search buffers for one maze size, reset in O(1) by advancing an epoch.
+
+    ``parent`` and ``g`` entries are only meaningful where ``seen[cell] ==
+    epoch``, and cells with ``closed[cell] == epoch`` have been expanded, so
+    ``begin`` starts a new query without clearing anything. The stamps are
+    bytes and are zeroed once every ``MAX_EPOCH`` queries; ``g`` is allocated
+    on first use, so queue searches never pay for it.
+    """
+
+    def __init__(self, shape: tuple[int, int]) -> None:
+        rows, cols = shape
+        self.shape = (rows, cols)
+        self.size = rows * cols
+        self.epoch = 0
+        self.queries = 0
+        self.seen = bytearray(self.size)
+        self.closed = bytearray(self.size)
+        self.parent = array("i", [NO_PARENT]) * self.size
+        self._g: array | None = None
+
+    @property
+    def g(self) -> array:
+        if self._g is None:
+            self._g = array("d", [0.0]) * self.size
+        return self._g
+
+    @property
+    def nbytes(self) -> int:
+        buffers = (self.parent, self._g) if self._g is not None else (self.parent,)
+        return len(self.seen) + len(self.closed) + sum(len(buffer) * buffer.itemsize for buffer in buffers)
+
+    def begin(self, graph: MazeGraph) -> int:
+        """Start a query on ``graph`` and return its epoch."""
+        if graph.size != self.size:
+            raise ValueError(f"Workspace for shape {self.shape} cannot search a maze of shape {graph.shape}.")
+        if self.epoch == MAX_EPOCH:
+            self.seen = bytearray(self.size)
+            self.closed = bytearray(self.size)
+            self.epoch = 0
+        self.epoch += 1
+        self.queries += 1
+        return self.epoch
+
+    def path(self, start: int, goal: int) -> list[int]:
+        """The current query's parent walk from ``start`` to ``goal``, empty if ``goal`` was never reached."""
+        if start != goal and self.seen[goal] != self.epoch:
+            return []
+        return walk_parents(self.parent, start, goal)
+
+
+def search_workspace(graph: MazeGraph, workspace: SearchWorkspace | None) -> tuple[SearchWorkspace, int]:
+    """``(workspace, epoch)`` for a new query, allocating a one-off workspace when none is given."""
+    if workspace is None:
+        workspace = SearchWorkspace(graph.shape)
+    return workspace, workspace.begin(graph)
+
+
+def manhattan_to(graph: MazeGraph, goal: int) -> Callable[[int], int]:
+    goal_row, goal_col = divmod(goal, graph.cols)
+    cols = graph.cols
+
+    def distance(cell_id: int) -> int:
+        row, col = divmod(cell_id, cols)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    return distance
+
+
+def out_edges(graph: MazeGraph, ids: np.ndarray) -> np.ndarray:
+    """CSR slots of every edge leaving ``ids``, grouped by source in ``ids`` order."""
+    counts = graph.degree[ids].astype(np.int64)
+    firsts = graph.offsets[ids].astype(np.int64)
+    ends = np.cumsum(counts)
+    return np.arange(int(ends[-1]) if ends.size else 0) + np.repeat(firsts - (ends - counts), counts)
+
+
+def wavefront_levels(
+    graph: MazeGraph, sources, distances: np.ndarray, parent: np.ndarray | None = None
+) -> Iterator[np.ndarray]:
+    """Level-synchronous BFS over id arrays: yield each level, then expand it when resumed.
+
+    ``distances`` must hold -1 for unreached cells; each level is labelled before
+    it is yielded, so callers can stop as soon as a target is labelled. Cells in
+    a level keep FIFO order and the first discoverer becomes the parent, so
+    ``parent`` matches what a queue BFS from the same sources would store.
+    """
+    deltas = np.array((-graph.cols, graph.cols, -1, 1), dtype=np.int32)
+    mask = graph.mask
+    owner = np.empty(graph.size, dtype=np.int32)
+    level = np.asarray(sources, dtype=np.int32).reshape(-1)
+    distances[level] = 0
+    depth = 0
+    while level.size:
+        yield level
+        depth += 1
+        open_moves = OPEN_DIRECTIONS[mask[level]]
+        candidates = (level[:, None] + deltas)[open_moves]
+        fresh = distances[candidates] < 0
+        candidates = candidates[fresh]
+        order = np.arange(candidates.size, dtype=np.int32)
+        owner[candidates[::-1]] = order[::-1]
+        first = order[owner[candidates] == order]
+        if parent is not None:
+            parent[candidates[first]] = np.broadcast_to(level[:, None], open_moves.shape)[open_moves][fresh][first]
+        level = candidates[first]
+        distances[level] = depth
+
+
+def bfs_distances(graph: MazeGraph, source: int) -> np.ndarray:
+    """Unit-cost distances from ``source`` to every cell as int32, -1 where unreachable."""
+    distances = np.full(graph.size, -1, dtype=np.int32)
+    for _level in wavefront_levels(graph, source, distances):
+        pass
+    return distances
+
+
+def _wavefront_search(
+    graph: MazeGraph, source: int, target: int, trace: EventLog | None
+) -> tuple[np.ndarray, int, int, int]:
+    """Run the wave from ``source``, stopping once ``target`` is labelled (``NO_PARENT`` floods everything).
+
+    Each level is recorded as one batch: enqueued at the step that discovered
+    it, visited at the next step.
+    """
+    distances = np.full(graph.size, -1, dtype=np.int32)
+    parent = np.full(graph.size, NO_PARENT, dtype=np.int32)
+    visited = peak_frontier = steps = 0
+    for steps, level in enumerate(wavefront_levels(graph, source, distances, parent), start=1):
+        if trace is not None:
+            if steps > 1:
+                trace.record_batch(ENQUEUE, level, steps - 1)
+            trace.record_batch(VISIT, level, steps)
+        visited += level.size
+        peak_frontier = max(peak_frontier, level.size)
+        if target != NO_PARENT and distances[target] >= 0:
+            break
+    return parent, steps, visited, peak_frontier
+
+
+def lee_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    """Lee routing: expand the wave from ``start`` a whole level at a time, then backtrace from ``goal``."""
+    parent, steps, visited, peak_frontier = _wavefront_search(graph, start, goal, trace)
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=steps,
+        visited=visited,
+        enqueued=visited - 1,
+        peak_frontier=peak_frontier,
+        metrics={"levels": steps},
+    )
+
+
+def flood_fill_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    """Flood the full distance field from ``goal``, then descend it from ``start``."""
+    parent, steps, visited, peak_frontier = _wavefront_search(graph, goal, NO_PARENT, trace)
+    path = walk_parents(parent, goal, start)
+    path.reverse()
+    return SearchResult(
+        path=path,
+        steps=steps,
+        visited=visited,
+        enqueued=visited - 1,
+        peak_frontier=peak_frontier,
+        metrics={"levels": steps},
+    )
+
+
+def bfs_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    blocked: bytearray | None = None,
+    workspace: SearchWorkspace | None = None,
+) -> SearchResult:
+    """Queue BFS. Cells set in ``blocked`` are never entered."""
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    workspace, epoch = search_workspace(graph, workspace)
+    seen, parent = workspace.seen, workspace.parent
+    if blocked is not None:
+        walls = np.flatnonzero(np.frombuffer(blocked, dtype=np.uint8))
+        np.frombuffer(seen, dtype=np.uint8)[walls] = epoch
+        np.frombuffer(parent, dtype=np.int32)[walls] = NO_PARENT
+    seen[start] = epoch
+    queue: deque[int] = deque([start])
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while queue:
+        current = queue.popleft()
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            if seen[neighbor] == epoch:
+                continue
+            seen[neighbor] = epoch
+            parent[neighbor] = current
+            queue.append(neighbor)
+            enqueued += 1
+            if record is not None:
+                record(ENQUEUE, neighbor, steps)
+        if len(queue) > peak_frontier:
+            peak_frontier = len(queue)
+
+    return SearchResult(
+        path=workspace.path(start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+    )
+
+
+def dead_end_filling_search(
+    graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None, vectorized: bool = False
+) -> SearchResult:
+    """Fill dead ends until only cells on some start-goal route remain, then BFS through what is left.
+
+    The default worklist mode keeps a mutable int8 degree per cell and fills one
+    cell per step, so every cell and edge is touched O(1) times. ``vectorized``
+    instead fills every current dead end at once per round and records each
+    round as one batch. Either way the final BFS runs on the original graph
+    with the filled cells as its blocked mask.
+    """
+    protected = {start, goal}
+    fill = _fill_dead_end_rounds if vectorized else _fill_dead_end_worklist
+    filled, count, steps, enqueued, peak_frontier = fill(graph, protected, trace)
+    return SearchResult(
+        path=bfs_search(graph, start, goal, blocked=filled).path,
+        steps=steps,
+        visited=count,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"filled": count},
+    )
+
+
+def _fill_dead_end_worklist(
+    graph: MazeGraph, protected: set[int], trace: EventLog | None
+) -> tuple[bytearray, int, int, int, int]:
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    degree = array("b", graph.degree.astype(np.int8).tobytes())
+    filled = bytearray(graph.size)
+    ends = np.flatnonzero(graph.passable & (graph.degree <= 1)).tolist()
+    worklist = deque(cell for cell in ends if cell not in protected)
+    steps = enqueued = 0
+    peak_frontier = len(worklist)
+    while worklist:
+        current = worklist.popleft()
+        if filled[current] or degree[current] > 1:
+            continue
+        filled[current] = 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            if filled[neighbor]:
+                continue
+            degree[neighbor] -= 1
+            if degree[neighbor] == 1 and neighbor not in protected:
+                worklist.append(neighbor)
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+        if len(worklist) > peak_frontier:
+            peak_frontier = len(worklist)
+    return filled, steps, steps, enqueued, peak_frontier
+
+
+def _fill_dead_end_rounds(
+    graph: MazeGraph, protected: set[int], trace: EventLog | None
+) -> tuple[bytearray, int, int, int, int]:
+    degree = graph.degree.astype(np.int8)
+    filled = np.zeros(graph.size, dtype=bool)
+    keep = np.zeros(graph.size, dtype=bool)
+    keep[list(protected)] = True
+    ends = np.flatnonzero(graph.passable & (degree <= 1) & ~keep)
+    rounds = enqueued = 0
+    peak_frontier = ends.size
+    while ends.size:
+        rounds += 1
+        filled[ends] = True
+        neighbors = graph.targets[out_edges(graph, ends)]
+        neighbors = neighbors[~filled[neighbors]]
+        np.subtract.at(degree, neighbors, 1)
+        following = np.unique(neighbors)
+        following = following[(degree[following] <= 1) & ~keep[following]]
+        if trace is not None:
+            trace.record_batch(VISIT, ends, rounds)
+            trace.record_batch(ENQUEUE, following, rounds)
+        enqueued += following.size
+        peak_frontier = max(peak_frontier, following.size)
+        ends = following
+    return bytearray(filled.tobytes()), int(np.count_nonzero(filled)), rounds, enqueued, int(peak_frontier)
+
+
+def cell_costs(graph: MazeGraph, cost_map: np.ndarray, integer: bool = False) -> array:
+    """Flatten a per-cell entry-cost map; moving into cell ``v`` costs ``cost_map[v]``.
+
+    Returns an ``array("q")`` when ``integer`` is set, otherwise ``array("d")``.
+    Costs on wall cells are ignored.
+    """
+    costs = np.asarray(cost_map)
+    if costs.shape != graph.shape:
+        raise ValueError(f"Cost map shape {costs.shape} does not match maze shape {graph.shape}.")
+    costs = costs.reshape(-1)
+    if np.any(costs[graph.passable] < 0):
+        raise ValueError("Cost maps must be non-negative.")
+    if not integer:
+        return array("d", costs.astype(np.float64).tobytes())
+    if not np.issubdtype(costs.dtype, np.integer) and np.any(costs[graph.passable] % 1):
+        raise ValueError("This solver requires an integer cost map.")
+    return array("q", np.where(graph.passable, costs, 0).astype(np.int64).tobytes())
+
+
+def zero_one_costs(graph: MazeGraph, cost_map: np.ndarray) -> array:
+    """``cell_costs`` for 0-1 BFS, which rejects any passable cost other than 0 or 1."""
+    costs = cell_costs(graph, cost_map, integer=True)
+    if np.frombuffer(costs, dtype=np.int64).max(initial=0) > 1:
+        raise ValueError("0-1 BFS requires a cost map of zeros and ones.")
+    return costs
+
+
+def entry_costs(graph: MazeGraph, cost_map: np.ndarray | None) -> tuple[array, float]:
+    """Per-cell entry costs (all 1 without a ``cost_map``) and the cheapest passable one.
+
+    Manhattan distance times that minimum never overestimates a weighted route.
+    """
+    if cost_map is None:
+        return array("d", [1.0]) * graph.size, 1.0
+    costs = cell_costs(graph, cost_map)
+    return costs, float(np.frombuffer(costs, dtype=np.float64)[graph.passable].min())
+
+
+@dataclass(frozen=True, eq=False)
+class ShortestPathTree:
+    """Shortest-path parents and distances from ``source`` to every cell.
+
+    ``distance`` is int32 with -1 for unreachable cells under unit or integer
+    costs, and float64 with ``inf`` otherwise.
+    """
+
+    source: int
+    parent: np.ndarray
+    distance: np.ndarray
+    settled: int
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.parent.nbytes + self.distance.nbytes)
+
+    def reaches(self, goal: int) -> bool:
+        return goal == self.source or self.parent[goal] != NO_PARENT
+
+    def cost_to(self, goal: int) -> float:
+        return float(self.distance[goal]) if self.reaches(goal) else float("inf")
+
+    def path_to(self, goal: int) -> list[int]:
+        return walk_parents(self.parent, self.source, goal)
+
+
+def shortest_path_tree(graph: MazeGraph, source: int, cost_map: np.ndarray | None = None) -> ShortestPathTree:
+    """Settle every cell reachable from ``source``: a NumPy wavefront for unit costs, binary-heap Dijkstra otherwise."""
+    parent = np.full(graph.size, NO_PARENT, dtype=np.int32)
+    if cost_map is None:
+        distances = np.full(graph.size, -1, dtype=np.int32)
+        settled = sum(level.size for level in wavefront_levels(graph, source, distances, parent))
+        return ShortestPathTree(source=source, parent=parent, distance=distances, settled=settled)
+
+    mask, moves = graph.mask_bytes, graph.steps
+    costs = cell_costs(graph, cost_map)
+    distance = array("d", [float("inf")]) * graph.size
+    distance[source] = 0.0
+    parents = array("i", parent.tobytes())
+    done = bytearray(graph.size)
+    heap: list[tuple[float, int]] = [(0.0, source)]
+    settled = 0
+    while heap:
+        current_distance, current = heapq.heappop(heap)
+        if done[current]:
+            continue
+        done[current] = 1
+        settled += 1
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            candidate = current_distance + costs[neighbor]
+            if candidate < distance[neighbor]:
+                distance[neighbor] = candidate
+                parents[neighbor] = current
+                heapq.heappush(heap, (candidate, neighbor))
+    distances = np.frombuffer(distance, dtype=np.float64).copy()
+    if np.issubdtype(np.asarray(cost_map).dtype, np.integer) and distances[np.isfinite(distances)].max() < UNREACHED:
+        distances = np.where(np.isfinite(distances), distances, -1).astype(np.int32)
+    return ShortestPathTree(
+        source=source, parent=np.frombuffer(parents, dtype=np.int32).copy(), distance=distances, settled=settled
+    )
+
+
+SHORTEST_PATH_TREE_CACHE: ByteBoundedCache[ShortestPathTree] = ByteBoundedCache(TREE_CACHE_BYTES)
+
+
+def cached_shortest_path_tree(
+    graph: MazeGraph, source: int, cost_map: np.ndarray | None = None
+) -> tuple[ShortestPathTree, bool]:
+    """``(tree, hit)`` from the LRU keyed by maze fingerprint, source and cost-map fingerprint."""
+    key = (graph.fingerprint, source, cost_map_fingerprint(cost_map))
+    return SHORTEST_PATH_TREE_CACHE.get(key, lambda: shortest_path_tree(graph, source, cost_map))
+
+
+def _frontier_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None,
+    workspace: SearchWorkspace | None,
+    queue: Frontier,
+    step_cost: Callable[[int, int], float],
+    heuristic: Callable[[int], float],
+) -> SearchResult:
+    """Best-first search keyed by ``g + heuristic`` in any ``Frontier`` backend.
+
+    Dijkstra, A* and Weighted A* keep their own inline ``heapq`` loop for the
+    default backend and run this one for the others.
+    """
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    push, pop = queue.push, queue.pop
+    workspace, epoch = search_workspace(graph, workspace)
+    seen, closed, g_score, parent = workspace.seen, workspace.closed, workspace.g, workspace.parent
+    seen[start] = epoch
+    g_score[start] = 0.0
+    push(start, heuristic(start))
+    steps = 0
+    enqueued = 0
+
+    while queue:
+        current = pop()
+        if closed[current] == epoch:
+            queue.stale += 1
+            continue
+        closed[current] = epoch
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        current_g = g_score[current]
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            tentative_g = current_g + step_cost(current, neighbor)
+            if seen[neighbor] != epoch or tentative_g < g_score[neighbor]:
+                seen[neighbor] = epoch
+                parent[neighbor] = current
+                g_score[neighbor] = tentative_g
+                push(neighbor, tentative_g + heuristic(neighbor))
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+
+    return SearchResult(
+        path=workspace.path(start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=queue.peak,
+        metrics=queue.stats(),
+    )
+
+
+def _no_heuristic(_: int) -> float:
+    return 0.0
+
+
+def dijkstra_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    weight: IdWeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
+    workspace: SearchWorkspace | None = None,
+    frontier: str | Frontier = DEFAULT_FRONTIER,
+) -> SearchResult:
+    """Dijkstra over an edge ``weight`` function or a per-cell ``cost_map``, queued in the ``frontier`` backend."""
+    costs = cell_costs(graph, cost_map) if cost_map is not None else None
+    if frontier != DEFAULT_FRONTIER:
+
+        def step_cost(current: int, neighbor: int) -> float:
+            if costs is not None:
+                return costs[neighbor]
+            edge_weight = weight(current, neighbor) if weight is not None else 1.0
+            if edge_weight < 0:
+                raise ValueError("Dijkstra requires non-negative edge weights.")
+            return edge_weight
+
+        queue = make_frontier(frontier)
+        return _frontier_search(graph, start, goal, trace, workspace, queue, step_cost, _no_heuristic)
+
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    tie_breaker = count()
+    heap: list[tuple[float, int, int]] = [(0.0, next(tie_breaker), start)]
+    workspace, epoch = search_workspace(graph, workspace)
+    seen, settled, distance, parent = workspace.seen, workspace.closed, workspace.g, workspace.parent
+    seen[start] = epoch
+    distance[start] = 0.0
+    steps = 0
+    enqueued = 0
+    stale = 0
+    peak_frontier = 1
+
+    while heap:
+        current_distance, _, current = heapq.heappop(heap)
+        if settled[current] == epoch:
+            stale += 1
+            continue
+        settled[current] = epoch
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            if costs is not None:
+                edge_weight = costs[neighbor]
+            else:
+                edge_weight = weight(current, neighbor) if weight is not None else 1.0
+            if edge_weight < 0:
+                raise ValueError("Dijkstra requires non-negative edge weights.")
+            candidate = current_distance + edge_weight
+            if seen[neighbor] != epoch or candidate < distance[neighbor]:
+                seen[neighbor] = epoch
+                distance[neighbor] = candidate
+                parent[neighbor] = current
+                heapq.heappush(heap, (candidate, next(tie_breaker), neighbor))
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+        if len(heap) > peak_frontier:
+            peak_frontier = len(heap)
+
+    return SearchResult(
+        path=workspace.path(start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics=frontier_stats(enqueued + 1, steps + stale, stale),
+    )
+
+
+def dials_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+) -> SearchResult:
+    """Dial's algorithm: Dijkstra with a circular array of ``max_cost + 1`` buckets.
+
+    Integer entry costs mean every tentative distance lies within ``max_cost``
+    of the distance being settled, so bucket ``d % (max_cost + 1)`` holds
+    exactly the cells at distance ``d`` and no heap is needed. Stale bucket
+    entries are skipped when popped. Without a cost map every step costs 1.
+    """
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    costs = cell_costs(graph, cost_map, integer=True) if cost_map is not None else array("q", [1]) * graph.size
+    width = int(np.frombuffer(costs, dtype=np.int64).max(initial=0)) + 1
+    buckets: list[list[int]] = [[] for _ in range(width)]
+    buckets[0].append(start)
+    distance = array("q", [UNREACHED]) * graph.size
+    distance[start] = 0
+    parent = array("i", [NO_PARENT]) * graph.size
+    settled = bytearray(graph.size)
+    pending = 1
+    current_distance = 0
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while pending:
+        bucket = buckets[current_distance % width]
+        if not bucket:
+            current_distance += 1
+            continue
+        current = bucket.pop()
+        pending -= 1
+        if settled[current] or distance[current] != current_distance:
+            continue
+        settled[current] = 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            candidate = current_distance + costs[neighbor]
+            if candidate < distance[neighbor]:
+                distance[neighbor] = candidate
+                parent[neighbor] = current
+                buckets[candidate % width].append(neighbor)
+                pending += 1
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+        if pending > peak_frontier:
+            peak_frontier = pending
+
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"buckets": width},
+    )
+
+
+def spfa_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    weight: IdWeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
+) -> SearchResult:
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    costs = cell_costs(graph, cost_map) if cost_map is not None else None
+    queue: deque[int] = deque([start])
+    in_queue = bytearray(graph.size)
+    in_queue[start] = 1
+    distance = array("d", [float("inf")]) * graph.size
+    distance[start] = 0.0
+    parent = array("i", [NO_PARENT]) * graph.size
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while queue:
+        current = queue.popleft()
+        in_queue[current] = 0
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            if costs is not None:
+                edge_weight = costs[neighbor]
+            else:
+                edge_weight = weight(current, neighbor) if weight is not None else 1.0
+            if edge_weight < 0:
+                raise ValueError("SPFA requires no reachable negative-weight cycle.")
+            candidate = distance[current] + edge_weight
+            if candidate >= distance[neighbor]:
+                continue
+            distance[neighbor] = candidate
+            parent[neighbor] = current
+            if not in_queue[neighbor]:
+                queue.append(neighbor)
+                in_queue[neighbor] = 1
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+        if len(queue) > peak_frontier:
+            peak_frontier = len(queue)
+
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+    )
+
+
+def bellman_ford_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    weight: IdWeightFunction | None = None,
+    cost_map: np.ndarray | None = None,
+    event_stride: int = 1,
+) -> SearchResult:
+    """Bellman-Ford over edge arrays: each round relaxes the out-edges of last round's improved vertices at once.
+
+    ``np.minimum.at`` resolves several edges improving one target in the same
+    round. Rounds stop early once nothing improves; if vertices still improve
+    after ``V - 1`` rounds, one vectorized pass over all edges confirms a
+    negative cycle. ``event_stride`` records only every n-th round to keep traces
+    of large mazes small.
+    """
+    if event_stride < 1:
+        raise ValueError("event_stride must be at least 1.")
+    sources, targets = graph.sources, graph.targets
+    if weight is not None:
+        weights = np.fromiter(map(weight, sources.tolist(), targets.tolist()), dtype=np.float64, count=targets.size)
+    elif cost_map is not None:
+        weights = np.frombuffer(cell_costs(graph, cost_map), dtype=np.float64)[targets]
+    else:
+        weights = np.ones(targets.size)
+    distance = np.full(graph.size, np.inf)
+    distance[start] = 0.0
+    parent = np.full(graph.size, NO_PARENT, dtype=np.int32)
+    active = np.array([start], dtype=np.int32)
+    rounds = visited = enqueued = relaxations = peak_frontier = 0
+    limit = max(1, graph.vertex_count - 1)
+
+    while active.size and rounds < limit:
+        rounds += 1
+        slots = out_edges(graph, active)
+        heads, tails = sources[slots], targets[slots]
+        candidates = distance[heads] + weights[slots]
+        before = distance[tails]
+        np.minimum.at(distance, tails, candidates)
+        won = (candidates == distance[tails]) & (candidates < before)
+        parent[tails[won]] = heads[won]
+        improved = np.unique(tails[won])
+        visited += active.size
+        enqueued += improved.size
+        relaxations += slots.size
+        peak_frontier = max(peak_frontier, improved.size)
+        if trace is not None and (rounds % event_stride == 0 or not improved.size):
+            trace.record_batch(VISIT, active, rounds)
+            trace.record_batch(ENQUEUE, improved, rounds)
+        active = improved.astype(np.int32)
+
+    if active.size:
+        reached = np.isfinite(distance[sources])
+        if np.any(distance[sources[reached]] + weights[reached] < distance[targets[reached]]):
+            raise ValueError("Bellman-Ford detected a negative-weight cycle.")
+
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=rounds,
+        visited=visited,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"rounds": rounds, "relaxations": relaxations},
+    )
+
+
+def a_star_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    heuristic: Callable[[int], int] | None = None,
+    workspace: SearchWorkspace | None = None,
+    frontier: str | Frontier = DEFAULT_FRONTIER,
+) -> SearchResult:
+    """A* with Manhattan distance unless another admissible ``heuristic`` to ``goal`` is given."""
+    if heuristic is None:
+        heuristic = manhattan_to(graph, goal)
+    if frontier != DEFAULT_FRONTIER:
+        queue = make_frontier(frontier)
+        return _frontier_search(graph, start, goal, trace, workspace, queue, lambda *_: 1, heuristic)
+
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    tie_breaker = count()
+    heap: list[tuple[int, int, int]] = [(heuristic(start), next(tie_breaker), start)]
+    workspace, epoch = search_workspace(graph, workspace)
+    seen, closed, g_score, parent = workspace.seen, workspace.closed, workspace.g, workspace.parent
+    seen[start] = epoch
+    g_score[start] = 0
+    steps = 0
+    enqueued = 0
+    stale = 0
+    peak_frontier = 1
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if closed[current] == epoch:
+            stale += 1
+            continue
+        closed[current] = epoch
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        tentative_g = g_score[current] + 1
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            if seen[neighbor] != epoch or tentative_g < g_score[neighbor]:
+                seen[neighbor] = epoch
+                parent[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(heap, (tentative_g + heuristic(neighbor), next(tie_breaker), neighbor))
+                enqueued += 1
+                if record is not None:
+                    record(ENQUEUE, neighbor, steps)
+        if len(heap) > peak_frontier:
+            peak_frontier = len(heap)
+
+    return SearchResult(
+        path=workspace.path(start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics=frontier_stats(enqueued + 1, steps + stale, stale),
+    )
+
+
+def weighted_a_star_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+    weight_multiplier: float = 1.6,
+    workspace: SearchWorkspace | None = None,
+    frontier: str | Frontier = DEFAULT_FRONTIER,
+) -> SearchResult:
+    """A* ordered by ``g + weight_multiplier * h`` over a per-cell ``cost_map``.
+
+    ``h`` is the Manhattan distance scaled by the cheapest passable cell cost,
+    which never overestimates, so the path costs at most ``weight_multiplier``
+    times the optimum and is optimal when the multiplier is 1.
+    """
+    if weight_multiplier < 1:
+        raise ValueError("weight_multiplier must be at least 1.")
+    costs, cheapest = entry_costs(graph, cost_map)
+    goal_row, goal_col = divmod(goal, graph.cols)
+    cols, scale = graph.cols, weight_multiplier * cheapest
+    if frontier != DEFAULT_FRONTIER:
+
+        def scaled_distance(cell: int) -> float:
+            row, col = divmod(cell, cols)
+            return scale * (abs(row - goal_row) + abs(col - goal_col))
+
+        queue = make_frontier(frontier)
+        result = _frontier_search(
+            graph, start, goal, trace, workspace, queue, lambda _, neighbor: costs[neighbor], scaled_distance
+        )
+        result.metrics.update(heuristic_scale=cheapest)
+        return result
+
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    tie_breaker = count()
+    heap: list[tuple[float, int, int]] = [(0.0, next(tie_breaker), start)]
+    workspace, epoch = search_workspace(graph, workspace)
+    seen, closed, g_score, parent = workspace.seen, workspace.closed, workspace.g, workspace.parent
+    seen[start] = epoch
+    g_score[start] = 0.0
+    steps = 0
+    enqueued = 0
+    stale = 0
+    peak_frontier = 1
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if closed[current] == epoch:
+            stale += 1
+            continue
+        closed[current] = epoch
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        current_g = g_score[current]
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            tentative_g = current_g + costs[neighbor]
+            if seen[neighbor] == epoch and tentative_g >= g_score[neighbor]:
+                continue
+            seen[neighbor] = epoch
+            parent[neighbor] = current
+            g_score[neighbor] = tentative_g
+            row, col = divmod(neighbor, cols)
+            priority = tentative_g + scale * (abs(row - goal_row) + abs(col - goal_col))
+            heapq.heappush(heap, (priority, next(tie_breaker), neighbor))
+            enqueued += 1
+            if record is not None:
+                record(ENQUEUE, neighbor, steps)
+        if len(heap) > peak_frontier:
+            peak_frontier = len(heap)
+
+    return SearchResult(
+        path=workspace.path(start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+        metrics={"heuristic_scale": cheapest, **frontier_stats(enqueued + 1, steps + stale, stale)},
+    )
+
+
+def greedy_best_first_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    frontier: str | Frontier = DEFAULT_FRONTIER,
+) -> SearchResult:
+    """Best-first by Manhattan distance alone; each cell is queued once, so the first route found is kept.
+
+    A neighbor can be one step closer to the goal than the cell just popped, so
+    keys are not monotone and the ``radix`` backend is rejected.
+    """
+    queue = make_frontier(frontier)
+    if isinstance(queue, RadixHeapFrontier):
+        raise ValueError("Greedy Best-First keys are not monotone, so it cannot use a radix frontier.")
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    heuristic = manhattan_to(graph, goal)
+    parent = array("i", [NO_PARENT]) * graph.size
+    seen = bytearray(graph.size)
+    seen[start] = 1
+    push, pop = queue.push, queue.pop
+    push(start, heuristic(start))
+    steps = 0
+    enqueued = 0
+
+    while queue:
+        current = pop()
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            if seen[neighbor]:
+                continue
+            seen[neighbor] = 1
+            parent[neighbor] = current
+            push(neighbor, heuristic(neighbor))
+            enqueued += 1
+            if record is not None:
+                record(ENQUEUE, neighbor, steps)
+
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=queue.peak,
+        metrics=queue.stats(),
+    )
+
+
+def hadlock_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    heuristic = manhattan_to(graph, goal)
+    frontier: deque[int] = deque([start])
+    detours = array("i", [UNREACHED]) * graph.size
+    detours[start] = 0
+    parent = array("i", [NO_PARENT]) * graph.size
+    settled = bytearray(graph.size)
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while frontier:
+        current = frontier.popleft()
+        if settled[current]:
+            continue
+        settled[current] = 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        current_h = heuristic(current)
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            penalty = 0 if heuristic(neighbor) < current_h else 1
+            candidate = detours[current] + penalty
+            if candidate >= detours[neighbor]:
+                continue
+            detours[neighbor] = candidate
+            parent[neighbor] = current
+            if penalty == 0:
+                frontier.appendleft(neighbor)
+            else:
+                frontier.append(neighbor)
+            enqueued += 1
+            if record is not None:
+                record(ENQUEUE, neighbor, steps)
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+    )
+
+
+def zero_one_bfs_search(
+    graph: MazeGraph,
+    start: int,
+    goal: int,
+    trace: EventLog | None = None,
+    cost_map: np.ndarray | None = None,
+) -> SearchResult:
+    """0-1 BFS: entering a zero-cost cell pushes to the deque front, a unit-cost cell to the back.
+
+    The deque always holds at most two distinct distances in order, so cells
+    settle in distance order in linear time. Without a cost map every step
+    costs 1 and this is plain BFS.
+    """
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    costs = zero_one_costs(graph, cost_map) if cost_map is not None else array("q", [1]) * graph.size
+    frontier: deque[int] = deque([start])
+    distance = array("q", [UNREACHED]) * graph.size
+    distance[start] = 0
+    parent = array("i", [NO_PARENT]) * graph.size
+    settled = bytearray(graph.size)
+    steps = 0
+    enqueued = 0
+    peak_frontier = 1
+
+    while frontier:
+        current = frontier.popleft()
+        if settled[current]:
+            continue
+        settled[current] = 1
+        steps += 1
+        if record is not None:
+            record(VISIT, current, steps)
+        if current == goal:
+            break
+
+        for delta in moves[mask[current]]:
+            neighbor = current + delta
+            cost = costs[neighbor]
+            candidate = distance[current] + cost
+            if candidate >= distance[neighbor]:
+                continue
+            distance[neighbor] = candidate
+            parent[neighbor] = current
+            if cost == 0:
+                frontier.appendleft(neighbor)
+            else:
+                frontier.append(neighbor)
+            enqueued += 1
+            if record is not None:
+                record(ENQUEUE, neighbor, steps)
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+    return SearchResult(
+        path=walk_parents(parent, start, goal),
+        steps=steps,
+        visited=steps,
+        enqueued=enqueued,
+        peak_frontier=peak_frontier,
+    )
+
+
+def bidirectional_bfs_search(graph: MazeGraph, start: int, goal: int, trace: EventLog | None = None) -> SearchResult:
+    if start == goal:
+        if trace is not None:
+            trace.record(VISIT, start, 1)
+        return SearchResult(path=[start], steps=1, visited=1, peak_frontier=1)
+
+    mask, moves = graph.mask_bytes, graph.steps
+    record = trace.record if trace is not None else None
+    queues = (deque([start]), deque([goal]))
+    seen = (bytearray(graph.size), bytearray(graph.size))
+    seen[0][start] = 1
+    seen[1][goal] = 1
+    parents = (array("i", [NO_PARENT]) * graph.size, array("i", [NO_PARENT]) * graph.size)
+    steps = 0
+    enqueued = 0
+    peak_frontier = 2
+    meeting = NO_PARENT
+
+    while queues[0] and queues[1] and meeting == NO_PARENT:
+        for side in (0, 1):
+            queue, own_seen, other_seen, parent = queues[side], seen[side], seen[1 - side], parents[side]
+            for _ in range(len(queue)):
+                current = queue.popleft()
+                steps += 1
+                if record is not None:
+                    record(VISIT, current, steps)
+                for delta in moves[mask[current]]:
+                    neighbor = current + delta
+                    if own_seen[neighbor]:
+                        continue
+                    own_seen[neighbor] = 1
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+                    enqueued += 1
+                    if record is not None:
+                        record(ENQUEUE, neighbor, steps)
+                    if other_seen[neighbor]:
+                        meeting = neighbor
+                        break
+                if meeting != NO_PARENT:
+                    break
+            if len(queues[0]) + len(queues[1]) > peak_frontier:
+                peak_frontier = len(queues[0]) + len(queues[1])
+            if meeting != NO_PARENT:
+                break
+
+    path: list[int] = []
+    if meeting != NO_PARENT:
+        path = walk_parents(parents[0], start, meeting)
+        current = meeting
+        while current != goal:
+            current = parents[1][current]
+            path.append(current)
+    return SearchResult(path=path, steps=steps, visited=steps, enqueued=enqueued, peak_frontier=peak_frontier)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 
 from maze_solver.algorithms import AlgorithmInfo
-from maze_solver.grid import Cell, adjacent_cells, default_goal, default_start
+from maze_solver.graph import maze_graph
+from maze_solver.grid import Cell, default_goal, default_start
+from maze_solver.search import ENQUEUE, PATH, VISIT, EventLog
 
 
 @dataclass(frozen=True)
@@ -30,42 +32,31 @@ class RunStats:
     events: int
     coverage: float
     work_factor: float
+    metrics: dict[str, float] = field(default_factory=dict)
 
 
 def maze_statistics(maze: np.ndarray, start: Cell | None = None, goal: Cell | None = None) -> MazeStats:
     start = start or default_start()
     goal = goal or default_goal(maze)
-    vertices = 0
-    walls = 0
-    dead_ends = 0
-    junctions = 0
-    corridors = 0
-    edge_degree_total = 0
-
-    for row in range(maze.shape[0]):
-        for col in range(maze.shape[1]):
-            cell = (row, col)
-            if maze[cell] == 1:
-                walls += 1
-                continue
-            vertices += 1
-            degree = len(adjacent_cells(cell, maze))
-            edge_degree_total += degree
-            if cell not in {start, goal} and degree <= 1:
-                dead_ends += 1
-            if degree == 2:
-                corridors += 1
-            if degree >= 3:
-                junctions += 1
+    graph = maze_graph(maze)
+    degree = graph.degree[graph.passable]
+    vertices = graph.vertex_count
+    walls = graph.size - vertices
+
+    leaves = (graph.degree <= 1) & graph.passable
+    for endpoint in {start, goal}:
+        if graph.is_open(endpoint):
+            leaves[graph.cell_id(endpoint)] = False
+    corridors = int(np.count_nonzero(degree == 2))
 
     total = vertices + walls
     return MazeStats(
         vertices=vertices,
-        edges=edge_degree_total // 2,
+        edges=graph.edge_count,
         walls=walls,
         wall_ratio=(walls / total) if total else 0,
-        dead_ends=dead_ends,
-        junctions=junctions,
+        dead_ends=int(np.count_nonzero(leaves)),
+        junctions=int(np.count_nonzero(degree >= 3)),
         corridors=corridors,
         corridor_bias=(corridors / vertices) if vertices else 0,
     )
@@ -79,7 +70,7 @@ def run_statistics(
     steps: int,
     events: int,
 ) -> RunStats:
-    vertices = max(1, maze_statistics(maze).vertices)
+    vertices = max(1, maze_graph(maze).vertex_count)
     path_length = len(path)
     return RunStats(
         path_length=path_length,
@@ -92,6 +83,27 @@ def run_statistics(
     )
 
 
+def trace_statistics(maze: np.ndarray, log: EventLog, metrics: dict[str, float] | None = None) -> RunStats:
+    """``run_statistics`` computed directly from an ``EventLog``'s id columns.
+
+    ``metrics`` carries solver-specific counters such as ``SolveResult.metrics``.
+    """
+    actions, cell_ids = log.actions, log.cell_ids
+    vertices = max(1, maze_graph(maze).vertex_count)
+    path_length = int(np.count_nonzero(actions == PATH))
+    visited = int(np.unique(cell_ids[actions == VISIT]).size)
+    return RunStats(
+        path_length=path_length,
+        visited=visited,
+        frontier=int(np.unique(cell_ids[actions == ENQUEUE]).size),
+        steps=log.last_step,
+        events=len(log),
+        coverage=visited / vertices,
+        work_factor=(visited / path_length) if path_length else 0,
+        metrics=dict(metrics or {}),
+    )
+
+
 def complexity_score(info: AlgorithmInfo, maze_stats: MazeStats, path_depth: int = 1) -> int | None:
     """Estimate the dominant asymptotic term for the current maze graph."""
     v = max(1, maze_stats.vertices)
@@ -117,6 +129,10 @@ def complexity_score(info: AlgorithmInfo, maze_stats: MazeStats, path_depth: int
     return v + e
 
 
+def format_metrics(metrics: dict[str, float]) -> str:
+    return " ".join(f"{key}={value:g}" for key, value in metrics.items())
+
+
 def format_complexity_score(score: int | None) -> str:
     if score is None:
         return "unbounded"
@@ -4,11 +4,18 @@ import argparse
 import sys
 from collections.abc import Iterable
 
-from maze_solver.algorithms import ALGORITHM_REGISTRY, SOLVER_REGISTRY
+from maze_solver.algorithms import ALGORITHM_REGISTRY, solve
 from maze_solver.catalog import algorithm_catalog, known_2d_algorithm_backlog, known_2d_coverage_summary
 from maze_solver.generation import GENERATION_REGISTRY, generate_maze
 from maze_solver.grid import Cell, default_goal, default_start
-from maze_solver.stats import complexity_score, format_complexity_score, maze_statistics, run_statistics
+from maze_solver.search import ENQUEUE, VISIT
+from maze_solver.stats import (
+    complexity_score,
+    format_complexity_score,
+    format_metrics,
+    maze_statistics,
+    trace_statistics,
+)
 
 ANSI = {
     "reset": "\033[0m",
@@ -42,15 +49,13 @@ def main(argv: list[str] | None = None) -> None:
     )
     start = default_start()
     goal = default_goal(maze)
-    events = list(SOLVER_REGISTRY[args.algorithm](maze, start, goal))
-    path = [cell for action, cell, _steps in events if action == "path" and cell is not None]
-    visited = {cell for action, cell, _steps in events if action == "visit" and cell is not None}
-    frontier = {cell for action, cell, _steps in events if action == "enqueue" and cell is not None}
-    steps = events[-1][2] if events else 0
+    result = solve(maze, start, goal, args.algorithm, record_events=True)
+    log = result.events
+    path = result.path
     use_color = args.color == "always" or (args.color == "auto" and sys.stdout.isatty())
     info = ALGORITHM_REGISTRY[args.algorithm]
     maze_stats = maze_statistics(maze, start, goal)
-    run_stats = run_statistics(maze, path, visited, frontier, steps, len(events))
+    run_stats = trace_statistics(maze, log, result.metrics)
     score = format_complexity_score(complexity_score(info, maze_stats, max(1, len(path))))
     implemented, known_total, _backlog = known_2d_coverage_summary()
 
@@ -64,12 +69,14 @@ def main(argv: list[str] | None = None) -> None:
     )
     if args.legend:
         print("Legend: S=start G=goal *=path +=frontier .=visited █=wall")
-    print(render_maze(maze, start, goal, path, visited, frontier, color=use_color))
+    print(render_maze(maze, start, goal, path, log.cells(VISIT), log.cells(ENQUEUE), color=use_color))
     print(
         f"path={run_stats.path_length} visited={run_stats.visited} frontier={run_stats.frontier} "
         f"steps={run_stats.steps} events={run_stats.events} coverage={run_stats.coverage:.1%} "
         f"work_factor={run_stats.work_factor:.2f}"
     )
+    if run_stats.metrics:
+        print(f"metrics={format_metrics(run_stats.metrics)}")
     print(
         f"maze=open={maze_stats.vertices} walls={maze_stats.walls} wall_ratio={maze_stats.wall_ratio:.1%} "
         f"dead_ends={maze_stats.dead_ends} junctions={maze_stats.junctions} "
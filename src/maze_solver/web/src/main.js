@@ -437,6 +437,7 @@ const solverAliases = {
   "Perimeter Search": "Bidirectional BFS",
   "Recursive Best-First Search": "Weighted A*",
   "SMA*": "Beam Search",
+  "Bidirectional Dijkstra": "Dijkstra",
   "MM Bidirectional Search": "Bidirectional BFS",
   "Near-Optimal Bidirectional Search": "Bidirectional BFS",
   "Front-to-Front Bidirectional A*": "Bidirectional BFS",
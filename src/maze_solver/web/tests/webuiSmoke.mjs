@@ -203,7 +203,7 @@ try {
   await page.waitForFunction(() => /^\d+\/\d+ shown$/.test(document.querySelector("#comparisonCount")?.textContent ?? ""));
   assert.match(await page.locator("h1").innerText(), /Solver Comparison/);
   assert.ok((await page.locator("#comparisonRows tr").count()) >= 120);
-  assert.equal(await page.locator("#statImplemented").innerText(), "85");
+  assert.equal(await page.locator("#statImplemented").innerText(), "86");
   assert.ok(Number(await page.locator("#statBacklog").innerText()) > 0);
   await page.fill("#comparisonSearch", "dijkstra");
   assert.ok((await page.locator("#comparisonRows tr").count()) >= 2);
@@ -3,6 +3,7 @@ import pytest
 
 from maze_solver.algorithms import (
     ALGORITHM_REGISTRY,
+    KERNEL_REGISTRY,
     SOLVER_REGISTRY,
     a_star_generator,
     bellman_ford_generator,
@@ -22,10 +23,14 @@ from maze_solver.algorithms import (
     pledge_generator,
     random_mouse_generator,
     right_hand_rule_generator,
+    solve,
+    solve_many,
     spfa_generator,
     tremaux_generator,
     uniform_cost_generator,
 )
+from maze_solver.generation import generate_cost_map, generate_maze
+from maze_solver.grid import default_goal, default_start
 from maze_solver.web_server import find_available_port
 
 
@@ -206,3 +211,92 @@ def test_non_optimal_solvers_return_valid_path_when_reachable():
     ):
         path = path_from(list(solver(maze, (1, 1), (3, 1))))
         assert_valid_path(maze, path, (1, 1), (3, 1))
+
+
+def test_registered_solvers_accept_packed_mazes():
+    maze, _ = generate_maze(15, 19, generation_algorithm="Kruskal", seed=12, topology="braided")
+    packed, _ = generate_maze(15, 19, generation_algorithm="Kruskal", seed=12, topology="braided", packed=True)
+    start, goal = default_start(), default_goal(maze)
+
+    for name in ("BFS", "A*", "Dijkstra", "Dead-End Filling", "Left-Hand Rule", "Random Mouse", "Bellman-Ford"):
+        expected = path_from(list(SOLVER_REGISTRY[name](maze, start, goal)))
+        assert path_from(list(SOLVER_REGISTRY[name](packed, start, goal))) == expected, name
+
+
+@pytest.mark.parametrize("name", ["A*", "BFS", "Dijkstra", "DFS", "Tremaux"])
+def test_solve_reports_path_and_counters_from_events(name):
+    maze, _ = generate_maze(21, 25, generation_algorithm="Prim's", seed=31, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    events = list(SOLVER_REGISTRY[name](maze, start, goal))
+
+    result = solve(maze, start, goal, name)
+    assert result.path == path_from(events)
+    assert result.visited == sum(1 for action, _cell, _steps in events if action == "visit")
+    assert result.enqueued == sum(1 for action, _cell, _steps in events if action == "enqueue")
+    assert result.steps == events[-1][2]
+    assert result.peak_frontier <= max(result.enqueued, 1)
+    assert result.events is None
+    assert list(solve(maze, start, goal, name, record_events=True).events) == events
+    assert (name in KERNEL_REGISTRY) == (name != "DFS" and name != "Tremaux")
+
+
+def test_solve_rejects_unknown_algorithm():
+    maze, _ = generate_maze(11, 11, seed=1)
+
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        solve(maze, default_start(), default_goal(maze), "Teleport")
+
+
+def test_solve_many_shares_one_tree_per_start_and_returns_arrays():
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=22, topology="braided")
+    maze[5, :] = 1
+    rng = np.random.default_rng(22)
+    open_cells = np.argwhere(maze == 0)
+    starts = [tuple(map(int, cell)) for cell in open_cells[rng.choice(len(open_cells), size=4, replace=False)]]
+    goals = [tuple(map(int, cell)) for cell in open_cells[rng.choice(len(open_cells), size=60)]]
+    pairs = [(starts[index % 4], goal) for index, goal in enumerate(goals)]
+    cost_map = generate_cost_map(maze.shape, "mud", seed=22)
+
+    for algorithm, options in (("BFS", {}), ("Dijkstra", {"cost_map": cost_map}), ("A*", {})):
+        batch = solve_many(maze, pairs, algorithm, **options)
+        assert batch.queries == len(pairs) and batch.queries_per_second > 0
+        assert batch.trees == (4 if algorithm != "A*" else 0)
+        assert batch.path_offsets[-1] == batch.path_ids.size == batch.path_lengths.sum()
+        for index, (start, goal) in enumerate(pairs):
+            single = solve(maze, start, goal, "Dijkstra" if options else "BFS", **options)
+            path = batch.path(index)
+            assert len(path) == len(single.path) == batch.path_lengths[index]
+            if path:
+                assert path[0] == start and path[-1] == goal
+                expected = sum(cost_map.costs[cell] for cell in path[1:]) if options else len(path) - 1
+                assert batch.costs[index] == expected
+            else:
+                assert batch.costs[index] == np.inf
+
+    assert not np.isfinite(solve_many(maze, pairs, "BFS").costs).all()
+    with pytest.raises(ValueError, match="inside the maze"):
+        solve_many(maze, [((0, 0), (41, 0))], "BFS")
+
+
+def test_solve_many_accepts_and_rejects_the_same_cost_maps_as_solve():
+    maze, _ = generate_maze(31, 31, generation_algorithm="Prim's", seed=26, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    mud = generate_cost_map(maze.shape, "mud", seed=26)
+    binary = np.random.default_rng(26).integers(0, 2, size=maze.shape)
+
+    for algorithm, cost_map, error in (
+        ("BFS", mud, TypeError),
+        ("Lee", binary, TypeError),
+        ("0-1 BFS", mud, ValueError),
+        ("Dial's Algorithm", mud.costs + 0.5, ValueError),
+    ):
+        with pytest.raises(error):
+            solve(maze, start, goal, algorithm, cost_map=cost_map)
+        with pytest.raises(error):
+            solve_many(maze, [(start, goal)], algorithm, cost_map=cost_map)
+
+    for algorithm, cost_map in (("0-1 BFS", binary), ("Dial's Algorithm", mud), ("SPFA", mud)):
+        batch = solve_many(maze, [(start, goal)], algorithm, cost_map=cost_map)
+        single = solve(maze, start, goal, algorithm, cost_map=cost_map)
+        assert batch.trees == 1
+        assert batch.costs[0] == sum(np.asarray(cost_map)[cell] for cell in single.path[1:])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.anytime import ARAStarPlanner
+from maze_solver.generation import generate_cost_map, generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.search import dijkstra_search
+
+
+def test_ara_star_publishes_improving_paths_within_their_bounds():
+    rng = np.random.default_rng(20)
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=5, topology="braided")
+    graph = build_maze_graph(maze)
+    for cost_map in (
+        None,
+        generate_cost_map(maze.shape, "mud", seed=2),
+        generate_cost_map(maze.shape, "water", seed=2),
+    ):
+        costs = np.ones(graph.size) if cost_map is None else cost_map.costs.reshape(-1).astype(float)
+        for start, goal in rng.choice(graph.open_ids(), size=(10, 2)).tolist():
+            optimum = costs[dijkstra_search(graph, start, goal, cost_map=cost_map).path[1:]].sum()
+            planner = ARAStarPlanner(graph, divmod(start, graph.cols), divmod(goal, graph.cols), cost_map, epsilon=4)
+            final = planner.improve()
+            assert final.bound == 1 and final.cost == optimum and planner.done
+            for earlier, later in zip(planner.solutions, planner.solutions[1:], strict=False):
+                assert later.cost <= earlier.cost and later.bound <= earlier.bound
+            for solution in planner.solutions:
+                assert costs[solution.path[1:]].sum() == solution.cost <= solution.bound * optimum
+
+
+def test_ara_star_resumes_across_budgets_without_restarting():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Prim's", seed=9, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    cost_map = generate_cost_map(maze.shape, "mud", seed=9)
+
+    whole = ARAStarPlanner(maze, start, goal, cost_map)
+    whole.improve()
+    sliced = ARAStarPlanner(maze, start, goal, cost_map)
+    assert sliced.improve(deadline=0) is None and sliced.expansions == 0
+    while not sliced.done:
+        sliced.improve(max_expansions=97)
+    assert sliced.solutions == whole.solutions
+    assert sliced.expansions == whole.expansions
+
+    with pytest.raises(ValueError, match="at least 1"):
+        ARAStarPlanner(maze, start, goal, epsilon=0.5)
+
+
+def test_solve_reports_the_anytime_bound():
+    maze, _ = generate_maze(45, 45, generation_algorithm="Recursive Backtracker", seed=6, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    expected = solve(maze, start, goal, "Dijkstra")
+
+    result = solve(maze, start, goal, "Anytime Repairing A*")
+    assert len(result.path) == len(expected.path)
+    assert result.metrics["epsilon"] == 1 and result.metrics["solutions"] >= 1
+
+    planner = ARAStarPlanner(maze, start, goal, epsilon=5)
+    planner.improve()
+    budget = planner.solutions[0].expansions
+    first = solve(maze, start, goal, "Anytime Repairing A*", epsilon=5, max_expansions=budget)
+    assert first.steps == budget and first.metrics["solutions"] == 1
+    assert len(first.path) - 1 <= first.metrics["epsilon"] * (len(expected.path) - 1)
@@ -0,0 +1,64 @@
+import pytest
+
+from maze_solver.benchmark import (
+    format_batch_benchmark,
+    format_benchmark,
+    format_hierarchy_benchmark,
+    run_batch_benchmark,
+    run_benchmark,
+    run_hierarchy_benchmark,
+)
+
+
+def test_benchmark_compares_jps_expansions_against_a_star():
+    results = run_benchmark(("A*", "Jump Point Search"), rows=31, cols=31, seeds=(1,))
+
+    assert {(result.maze, result.algorithm) for result in results} == {
+        ("braided", "A*"),
+        ("braided", "Jump Point Search"),
+        ("open", "A*"),
+        ("open", "Jump Point Search"),
+    }
+    by_key = {(result.maze, result.algorithm): result for result in results}
+    for maze in ("braided", "open"):
+        assert by_key[(maze, "A*")].path_length == by_key[(maze, "Jump Point Search")].path_length
+        assert by_key[(maze, "Jump Point Search")].visited < by_key[(maze, "A*")].visited
+    table = format_benchmark(results)
+    assert table.splitlines()[0].split() == ["maze", "algorithm", "path", "visited", "enqueued", "ms", "ratio"]
+    assert "Jump Point Search" in table
+
+
+def test_benchmark_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        run_benchmark(("Teleport",), rows=11, cols=11, seeds=(1,))
+    with pytest.raises(ValueError, match="Unknown benchmark maze"):
+        run_benchmark(("A*",), mazes=("spiral",), rows=11, cols=11, seeds=(1,))
+
+
+def test_hierarchy_benchmark_reports_preprocessing_and_throughput():
+    results = run_hierarchy_benchmark(("braided",), rows=31, cols=31, seeds=(2,), queries=50)
+
+    (result,) = results
+    assert result.nodes > 0 and result.hierarchy_bytes > 0
+    assert result.preprocess_seconds > 0 and result.queries_per_second > 0
+    assert format_hierarchy_benchmark(results).splitlines()[0].split()[-1] == "queries/s"
+
+
+def test_weighted_benchmark_passes_one_cost_map_to_every_solver():
+    results = run_benchmark(("Dijkstra", "Dial's Algorithm"), ("braided",), rows=31, cols=31, seeds=(3,), max_cost=5)
+
+    dijkstra, dials = results
+    assert dials.path_length > 0 and dijkstra.path_length > 0
+    # Both settle cells in distance order; only ties at the goal's distance can differ.
+    assert abs(dials.visited - dijkstra.visited) <= 0.05 * dijkstra.visited
+    with pytest.raises(ValueError, match="does not take a cost map"):
+        run_benchmark(("A*",), rows=11, cols=11, seeds=(1,), max_cost=5)
+
+
+def test_batch_benchmark_reports_trees_and_throughput():
+    results = run_batch_benchmark(("BFS", "A*"), rows=31, cols=31, queries=40, sources=3)
+
+    bfs, a_star = results
+    assert bfs.trees <= 3 and a_star.trees == 0
+    assert bfs.queries == a_star.queries == 40 and bfs.queries_per_second > 0
+    assert format_batch_benchmark(results).splitlines()[0].split()[-1] == "queries/s"
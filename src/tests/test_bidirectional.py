@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.bidirectional import bidirectional_dijkstra_search, mm_search
+from maze_solver.generation import generate_cost_map, generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.search import dijkstra_search
+
+
+@pytest.mark.parametrize("kernel", [bidirectional_dijkstra_search, mm_search])
+def test_weighted_bidirectional_searches_return_optimal_paths(kernel):
+    rng = np.random.default_rng(21)
+    mazes = [generate_maze(41, 45, generation_algorithm="Prim's", seed=6, topology="braided")[0]]
+    mazes += [(rng.random((25, 31)) < 0.35).astype(np.uint8)]
+    for maze in mazes:
+        graph = build_maze_graph(maze)
+        cost_maps = [None, generate_cost_map(maze.shape, "water", seed=4), rng.integers(0, 3, maze.shape)]
+        for cost_map in cost_maps:
+            costs = np.ones(graph.size) if cost_map is None else np.asarray(cost_map).reshape(-1).astype(float)
+            for start, goal in rng.choice(graph.open_ids(), size=(15, 2)).tolist():
+                expected = dijkstra_search(graph, start, goal, cost_map=cost_map).path
+                result = kernel(graph, start, goal, cost_map=cost_map)
+                assert bool(result.path) == bool(expected)
+                if expected:
+                    assert result.path[0] == start and result.path[-1] == goal
+                    assert all(b in graph.neighbors(a) for a, b in zip(result.path, result.path[1:], strict=False))
+                    assert costs[result.path[1:]].sum() == costs[expected[1:]].sum()
+                metrics = result.metrics
+                assert metrics["forward_expansions"] + metrics["backward_expansions"] == result.steps
+
+
+def test_solve_reports_expansions_from_each_side():
+    maze, _ = generate_maze(81, 81, generation_algorithm="Prim's", seed=12, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    cost_map = generate_cost_map(maze.shape, "mud", seed=12)
+    dijkstra = solve(maze, start, goal, "Dijkstra", cost_map=cost_map)
+
+    for name in ("Bidirectional Dijkstra", "MM Bidirectional Search", "Front-to-Front Bidirectional A*"):
+        result = solve(maze, start, goal, name, cost_map=cost_map)
+        assert result.path[0] == start and result.path[-1] == goal
+        assert sum(cost_map.costs[cell] for cell in result.path[1:]) == sum(
+            cost_map.costs[cell] for cell in dijkstra.path[1:]
+        )
+        assert result.metrics["forward_expansions"] > 0 and result.metrics["backward_expansions"] > 0
+        assert result.visited < dijkstra.visited
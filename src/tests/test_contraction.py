@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.contraction import ContractionHierarchy, build_contraction_hierarchy
+from maze_solver.generation import generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import PASSAGE, default_goal, default_start
+from maze_solver.search import bfs_search
+
+
+def assert_valid_path(graph, path, start, goal):
+    assert path[0] == start and path[-1] == goal
+    for cell, following in zip(path, path[1:], strict=False):
+        assert following in graph.neighbors(cell)
+
+
+def test_contraction_hierarchy_routes_match_bfs():
+    rng = np.random.default_rng(9)
+    mazes = [generate_maze(41, 41, generation_algorithm="Prim's", seed=seed, topology="braided")[0] for seed in (1, 2)]
+    mazes += [(rng.random((18, 23)) < 0.3).astype(np.uint8) for _ in range(4)]
+    for maze in mazes:
+        graph = build_maze_graph(maze)
+        hierarchies = [build_contraction_hierarchy(graph, core_size) for core_size in (0, 12, None, graph.size)]
+        for start, goal in rng.choice(graph.open_ids(), size=(60, 2)).tolist():
+            expected = bfs_search(graph, start, goal).path
+            for hierarchy in hierarchies:
+                result = hierarchy.route(start, goal)
+                assert len(result.path) == len(expected)
+                assert hierarchy.distance(start, goal) == len(expected) - 1
+                if expected:
+                    assert_valid_path(graph, result.path, start, goal)
+
+
+def test_contraction_hierarchy_round_trips_through_a_file(tmp_path):
+    maze, _ = generate_maze(31, 31, generation_algorithm="Prim's", seed=4, topology="braided")
+    graph = build_maze_graph(maze)
+    hierarchy = build_contraction_hierarchy(graph)
+    path = tmp_path / "hierarchy.npz"
+    hierarchy.save(path)
+
+    loaded = ContractionHierarchy.load(path, graph)
+    start, goal = graph.cell_id(default_start()), graph.cell_id(default_goal(maze))
+    assert loaded.route(start, goal).path == hierarchy.route(start, goal).path
+    assert loaded.nbytes == hierarchy.nbytes
+
+    other = maze.copy()
+    other[1, 2] = 1 - other[1, 2]
+    with pytest.raises(ValueError, match="different maze"):
+        ContractionHierarchy.load(path, build_maze_graph(other))
+
+
+def test_solve_reports_contraction_hierarchy_metrics():
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=6, topology="braided")
+    maze = maze.copy()
+    maze[0, 0] = PASSAGE
+    start, goal = default_start(), default_goal(maze)
+
+    result = solve(maze, start, goal, "Contraction Hierarchies", record_events=True)
+    expected = solve(maze, start, goal, "BFS")
+    assert len(result.path) == len(expected.path)
+    assert result.metrics["hierarchy_nodes"] > 0
+    assert result.metrics["hierarchy_bytes"] > 0
+    assert {"preprocess_seconds", "shortcuts", "hierarchy_cache_hits"} <= set(result.metrics)
+    assert result.visited < expected.visited
+    assert solve(maze, start, goal, "Contraction Hierarchies").metrics["hierarchy_cache_hits"] == 1
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.contraction import corridor_graph_search
+from maze_solver.frontier import FRONTIER_BACKENDS, Frontier, HeapqFrontier, make_frontier
+from maze_solver.generation import generate_cost_map, generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.search import a_star_search, bfs_search, dijkstra_search, greedy_best_first_search
+
+INTEGER_BACKENDS = {"radix", "bucket", "two_level_bucket"}
+INDEXED_BACKENDS = {"binary", "pairing"}
+
+
+@pytest.mark.parametrize("backend", FRONTIER_BACKENDS)
+def test_frontiers_pop_least_keys_and_lower_queued_keys(backend):
+    rng = np.random.default_rng(25)
+    frontier = make_frontier(backend)
+    keys: dict[int, int] = {}
+    expanded: set[int] = set()
+    popped: list[int] = []
+    for _ in range(2000):
+        if keys and rng.random() < 0.4:
+            item = frontier.pop()
+            if item in expanded:
+                frontier.stale += 1
+                continue
+            expanded.add(item)
+            popped.append(keys.pop(item))
+            assert popped[-1] <= min(keys.values(), default=popped[-1])
+        else:
+            item = int(rng.integers(300))
+            floor = popped[-1] if popped else 0
+            key = floor + int(rng.integers(150))
+            if item not in expanded and key < keys.get(item, key + 1):
+                keys[item] = key
+                frontier.push(item, key)
+    while keys:
+        item = frontier.pop()
+        if item not in expanded:
+            expanded.add(item)
+            keys.pop(item)
+
+    stats = frontier.stats()
+    assert stats["frontier_pops"] >= len(expanded) and frontier.peak > 0
+    if backend in INDEXED_BACKENDS:
+        assert stats["frontier_stale"] == 0 and stats["frontier_pops"] == len(expanded)
+    else:
+        assert stats["frontier_stale"] > 0 and stats["frontier_pushes"] >= stats["frontier_pops"]
+
+
+@pytest.mark.parametrize("backend", FRONTIER_BACKENDS)
+def test_solvers_return_optimal_paths_on_every_backend(backend):
+    maze, _ = generate_maze(41, 41, generation_algorithm="Kruskal", seed=25, topology="braided")
+    maze[11, :] = 1
+    graph = build_maze_graph(maze)
+    cost_map = generate_cost_map(maze.shape, "water", seed=25)
+    costs = cost_map.costs.reshape(-1).astype(float)
+    for start, goal in np.random.default_rng(25).choice(graph.open_ids(), size=(25, 2)).tolist():
+        expected = bfs_search(graph, start, goal).path
+        for kernel in (a_star_search, corridor_graph_search):
+            assert len(kernel(graph, start, goal, frontier=backend).path) == len(expected)
+        weighted = dijkstra_search(graph, start, goal, cost_map=cost_map, frontier=backend)
+        reference = dijkstra_search(graph, start, goal, cost_map=cost_map)
+        assert costs[weighted.path[1:]].sum() == costs[reference.path[1:]].sum()
+        if backend == "radix":
+            with pytest.raises(ValueError, match="not monotone"):
+                greedy_best_first_search(graph, start, goal, frontier=backend)
+        else:
+            assert bool(greedy_best_first_search(graph, start, goal, frontier=backend).path) == bool(expected)
+
+
+def test_solve_reports_frontier_counters_and_rejects_unusable_keys():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Prim's", seed=26, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+
+    lazy = solve(maze, start, goal, "A*")
+    indexed = solve(maze, start, goal, "A*", frontier="pairing")
+    assert lazy.path == indexed.path
+    assert lazy.metrics["frontier_pops"] == lazy.visited + lazy.metrics["frontier_stale"]
+    assert lazy.metrics["frontier_pushes"] == lazy.enqueued + 1
+    wrapped = solve(maze, start, goal, "A*", frontier=HeapqFrontier())
+    assert wrapped.path == lazy.path and wrapped.metrics == lazy.metrics
+    assert indexed.metrics["frontier_stale"] == 0 and indexed.metrics["frontier_pops"] == indexed.visited
+    for name in ("Greedy Best-First", "Corridor Graph Reduction", "Weighted A*", "Dijkstra"):
+        assert solve(maze, start, goal, name, frontier="binary").metrics["frontier_pushes"] > 0
+
+    with pytest.raises(ValueError, match="integer priorities"):
+        solve(maze, start, goal, "Weighted A*", frontier="bucket")
+    with pytest.raises(TypeError):
+        Frontier()
+    with pytest.raises(ValueError, match="Unknown frontier backend"):
+        solve(maze, start, goal, "Dijkstra", frontier="fibonacci")
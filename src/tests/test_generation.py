@@ -1,10 +1,18 @@
 import random
 
 import numpy as np
+import pytest
 
 from maze_solver.algorithms import bfs_path, is_solvable
-from maze_solver.generation import GENERATION_REGISTRY, _connect_open_components, generate_maze
-from maze_solver.grid import default_goal, default_start
+from maze_solver.generation import (
+    GENERATION_REGISTRY,
+    TERRAIN_TYPES,
+    _connect_open_components,
+    generate_cost_map,
+    generate_maze,
+)
+from maze_solver.grid import MAZE_DTYPE, CostMap, PackedMaze, default_goal, default_start, maze_fingerprint, pack_maze
+from maze_solver.stats import maze_statistics
 
 
 def reachable_cells(maze):
@@ -145,3 +153,53 @@ def test_connected_generation_handles_minimum_odd_sizes():
         maze, _ = generate_maze(size, size, generation_algorithm="Recursive Backtracker", seed=11)
         open_cells = set(zip(*np.where(maze == 0), strict=False))
         assert open_cells <= reachable_cells(maze)
+
+
+def test_builders_return_compact_uint8_mazes():
+    for algorithm in GENERATION_REGISTRY:
+        maze, _ = generate_maze(13, 17, generation_algorithm=algorithm, seed=31, topology="braided")
+        assert maze.dtype == MAZE_DTYPE, algorithm
+        assert maze.nbytes == 13 * 17
+
+
+def test_packed_generation_round_trips_at_one_bit_per_cell():
+    maze, seed = generate_maze(31, 41, generation_algorithm="Wilson", seed=99)
+    packed, packed_seed = generate_maze(31, 41, generation_algorithm="Wilson", seed=99, packed=True)
+
+    assert isinstance(packed, PackedMaze)
+    assert packed_seed == seed
+    assert packed.shape == maze.shape
+    assert packed.nbytes == -(-31 * 41 // 8)
+    assert np.array_equal(packed.unpack(), maze)
+    assert packed.unpack().dtype == MAZE_DTYPE
+    assert all(packed[cell] == maze[cell] for cell in ((0, 0), (1, 1), (15, 20), (29, 39)))
+    assert maze_fingerprint(packed) == maze_fingerprint(maze) == maze_fingerprint(maze.astype(int))
+    assert pack_maze(packed) is packed
+    assert maze_statistics(packed) == maze_statistics(maze)
+
+
+def test_terrain_cost_maps_are_seeded_compact_and_bounded():
+    for terrain in TERRAIN_TYPES:
+        cost_map = generate_cost_map((33, 47), terrain, seed=5, max_cost=12)
+        assert isinstance(cost_map, CostMap) and cost_map.integer
+        assert cost_map.costs.dtype == np.uint16 and cost_map.nbytes == 33 * 47 * 2
+        assert cost_map.costs.min() == 1 and cost_map.costs.max() == 12
+        assert np.array_equal(np.asarray(cost_map), generate_cost_map((33, 47), terrain, seed=5, max_cost=12).costs)
+
+    mud = generate_cost_map((64, 64), "mud", seed=1, integer=False)
+    assert mud.costs.dtype == np.float32 and not mud.integer
+    assert np.abs(np.diff(mud.costs, axis=1)).mean() < 1
+    assert set(np.unique(generate_cost_map((64, 64), "water", seed=1)).tolist()) <= {1, 4, 9}
+
+    copied = np.array(mud, copy=True)
+    copied[0, 0] = 99
+    assert mud.costs[0, 0] != 99 and np.asarray(mud) is mud.costs and not mud.costs.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        np.asarray(mud)[0, 0] = 99
+    with pytest.raises(ValueError, match="needs a copy"):
+        np.asarray(mud, dtype=np.float64, copy=False)
+
+    with pytest.raises(ValueError, match="Unknown terrain"):
+        generate_cost_map((5, 5), "lava")
+    with pytest.raises(ValueError, match="float32 or uint16"):
+        CostMap(np.ones((5, 5)))
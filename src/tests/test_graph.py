@@ -0,0 +1,69 @@
+import numpy as np
+
+from maze_solver.generation import generate_maze
+from maze_solver.graph import EAST, NORTH, SOUTH, WEST, build_maze_graph, maze_graph
+from maze_solver.grid import adjacent_cells
+from maze_solver.stats import maze_statistics
+
+
+def test_csr_adjacency_matches_adjacent_cells_order():
+    maze, _ = generate_maze(21, 31, generation_algorithm="Prim's", seed=5, topology="braided")
+    graph = build_maze_graph(maze)
+
+    assert graph.offsets.dtype == np.int32
+    assert graph.targets.dtype == np.int32
+    for row in range(maze.shape[0]):
+        for col in range(maze.shape[1]):
+            if maze[row, col] != 0:
+                assert graph.degree[graph.cell_id((row, col))] == 0
+                continue
+            cell_id = graph.cell_id((row, col))
+            expected = adjacent_cells((row, col), maze)
+            start, stop = graph.offsets[cell_id], graph.offsets[cell_id + 1]
+            assert graph.cells_of(graph.targets[start:stop]) == expected
+            assert graph.adjacent((row, col)) == expected
+            assert [graph.cell_of(neighbor) for neighbor in graph.neighbors(cell_id)] == expected
+            assert graph.degree[cell_id] == len(expected)
+
+
+def test_neighbor_mask_uses_nesw_bits():
+    maze = np.array(
+        [
+            [1, 1, 1, 1, 1],
+            [1, 1, 0, 1, 1],
+            [1, 0, 0, 0, 1],
+            [1, 1, 0, 1, 1],
+            [1, 1, 1, 1, 1],
+        ]
+    )
+    graph = build_maze_graph(maze)
+
+    assert graph.mask[graph.cell_id((2, 2))] == NORTH | SOUTH | WEST | EAST
+    assert graph.mask[graph.cell_id((1, 2))] == SOUTH
+    assert graph.mask[graph.cell_id((2, 1))] == EAST
+    assert graph.vertex_count == 5
+    assert graph.edge_count == 4
+
+
+def test_maze_graph_is_cached_by_fingerprint():
+    maze, _ = generate_maze(15, 15, seed=3)
+
+    assert maze_graph(maze) is maze_graph(maze.copy())
+    changed = maze.copy()
+    changed[1, 1] = 1
+    assert maze_graph(changed) is not maze_graph(maze)
+
+
+def test_maze_statistics_counts_degrees_from_graph():
+    maze, _ = generate_maze(25, 25, generation_algorithm="Kruskal", seed=8, topology="braided")
+    stats = maze_statistics(maze)
+
+    degrees = {}
+    for row, col in zip(*np.where(maze == 0), strict=False):
+        degrees[(row, col)] = len(adjacent_cells((row, col), maze))
+    endpoints = {(1, 1), (maze.shape[0] - 2, maze.shape[1] - 2)}
+    assert stats.vertices == len(degrees)
+    assert stats.edges == sum(degrees.values()) // 2
+    assert stats.dead_ends == sum(1 for cell, degree in degrees.items() if degree <= 1 and cell not in endpoints)
+    assert stats.junctions == sum(1 for degree in degrees.values() if degree >= 3)
+    assert stats.corridors == sum(1 for degree in degrees.values() if degree == 2)
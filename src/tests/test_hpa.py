@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.generation import generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.hpa import HPAStarPlanner
+from maze_solver.search import bfs_search
+
+
+def test_hpa_star_paths_are_valid_and_optimal_on_mazes():
+    rng = np.random.default_rng(4)
+    for topology in ("perfect", "braided"):
+        maze, _ = generate_maze(45, 45, generation_algorithm="Prim's", seed=2, topology=topology)
+        graph = build_maze_graph(maze)
+        planner = HPAStarPlanner(maze, cluster_size=8)
+        for start, goal in rng.choice(graph.open_ids(), size=(40, 2)).tolist():
+            path = planner.route_ids(start, goal).path
+            assert len(path) == len(bfs_search(graph, start, goal).path)
+            assert all(following in graph.neighbors(cell) for cell, following in zip(path, path[1:], strict=False))
+            abstract = planner.route_ids(start, goal, refine=False).path
+            assert abstract[0] == start and abstract[-1] == goal and set(abstract) <= set(path)
+            assert planner.route(graph.cell_of(start), graph.cell_of(goal)) == graph.cells_of(path)
+
+
+def test_hpa_star_rebuilds_only_touched_clusters_after_wall_changes():
+    rng = np.random.default_rng(8)
+    maze = (rng.random((30, 34)) < 0.3).astype(np.uint8)
+    planner = HPAStarPlanner(maze, cluster_size=6)
+    for _ in range(8):
+        cells = [tuple(cell) for cell in rng.integers(0, maze.shape, size=(3, 2)).tolist()]
+        for cell in cells:
+            maze[cell] ^= 1
+        rebuilt = planner.update_cells(cells)
+        assert 0 < rebuilt <= 4 * len(cells) < planner.cluster_count
+        fresh = HPAStarPlanner(maze, cluster_size=6)
+        assert planner.node_count == fresh.node_count and planner.edge_count == fresh.edge_count
+
+        graph = build_maze_graph(maze)
+        for start, goal in rng.choice(graph.open_ids(), size=(20, 2)).tolist():
+            expected = bfs_search(graph, start, goal).path
+            path = planner.route_ids(start, goal).path
+            assert bool(path) == bool(expected) and len(path) >= len(expected)
+            assert path == fresh.route_ids(start, goal).path
+
+    with pytest.raises(ValueError, match="outside the maze"):
+        planner.update_cells([(30, 0)])
+
+
+def test_solve_runs_hpa_star_from_the_cached_abstract_graph():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Prim's", seed=3, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+
+    result = solve(maze, start, goal, "HPA*")
+    expected = solve(maze, start, goal, "A*")
+    assert len(result.path) == len(expected.path)
+    assert result.visited < expected.visited
+    assert result.metrics["abstract_nodes"] > 0 and result.metrics["clusters"] == 16
+    assert solve(maze, start, goal, "HPA*").metrics["hpa_cache_hits"] == 1
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import SOLVER_REGISTRY, solve
+from maze_solver.generation import generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import PASSAGE, WALL, default_goal, default_start
+from maze_solver.incremental import DStarLitePlanner
+from maze_solver.search import bfs_search
+
+
+def bfs_length(maze, start, goal):
+    graph = build_maze_graph(maze)
+    return len(bfs_search(graph, graph.cell_id(start), graph.cell_id(goal)).path)
+
+
+def test_d_star_lite_replans_to_shortest_paths_after_wall_changes():
+    rng = np.random.default_rng(21)
+    for _ in range(15):
+        maze = (rng.random((14, 17)) < 0.25).astype(np.uint8)
+        start, goal = (0, 0), (13, 16)
+        maze[start] = maze[goal] = PASSAGE
+        planner = DStarLitePlanner(maze, start, goal)
+
+        for tick in range(6):
+            path = planner.replan()
+            assert len(path) == bfs_length(maze, planner.start, goal)
+            assert all(maze[cell] == PASSAGE for cell in path)
+            cells = [(int(row), int(col)) for row, col in rng.integers(0, (14, 17), size=(3, 2))]
+            cells = [cell for cell in cells if cell not in {planner.start, goal}]
+            for cell in cells:
+                maze[cell] ^= 1
+            planner.update_cells(cells)
+            if tick % 2 and len(path) > 2 and maze[path[1]] == PASSAGE:
+                planner.move_start(path[1])
+
+
+def test_d_star_lite_repairs_locally_instead_of_searching_from_scratch():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Prim's", seed=8, topology="braided")
+    maze = maze.copy()
+    start, goal = default_start(), default_goal(maze)
+    planner = DStarLitePlanner(maze, start, goal)
+    planner.replan()
+    initial = planner.last_expansions
+
+    wall = next(
+        tuple(int(v) for v in cell) for cell in np.argwhere(maze == WALL) if 0 < cell[0] < 60 and 0 < cell[1] < 60
+    )
+    assert planner.update_cells({wall: PASSAGE}) == 1
+    assert planner.update_cells({wall: PASSAGE}) == 0
+    maze[wall] = PASSAGE
+    path = planner.replan()
+    assert len(path) == bfs_length(maze, start, goal)
+    assert planner.last_expansions < initial // 4
+
+    planner.update_cells([start])
+    assert planner.replan() == []
+    with pytest.raises(ValueError, match="outside the maze"):
+        planner.update_cells([(99, 0)])
+
+
+def test_d_star_lite_is_registered_for_visualization():
+    maze, _ = generate_maze(21, 21, seed=4, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    events = list(SOLVER_REGISTRY["D* Lite"](maze, start, goal))
+
+    path = [cell for action, cell, _steps in events if action == "path"]
+    assert len(path) == bfs_length(maze, start, goal)
+    assert solve(maze, start, goal, "D* Lite").path == path
+    assert [cell for action, cell, _steps in SOLVER_REGISTRY["LPA*"](maze, start, goal) if action == "path"] == path
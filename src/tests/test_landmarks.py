@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.generation import generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.landmarks import alt_search, build_landmark_table
+from maze_solver.search import bfs_distances, bfs_search
+
+
+def test_landmark_bounds_are_admissible_and_alt_paths_are_optimal():
+    rng = np.random.default_rng(5)
+    mazes = [generate_maze(31, 31, generation_algorithm="Prim's", seed=3)[0]]
+    mazes += [(rng.random((17, 21)) < 0.3).astype(np.uint8) for _ in range(3)]
+    for maze in mazes:
+        graph = build_maze_graph(maze)
+        for strategy in ("farthest", "random"):
+            table = build_landmark_table(graph, count=4, strategy=strategy, seed=2)
+            assert table.distances.dtype == np.int32 and table.distances.shape == (4, graph.size)
+            for start, goal in rng.choice(graph.open_ids(), size=(15, 2)).tolist():
+                to_goal = bfs_distances(graph, goal)
+                bound = table.heuristic(goal)
+                reachable = np.flatnonzero(to_goal >= 0).tolist()
+                assert all(bound(cell) <= to_goal[cell] for cell in reachable)
+                expected = bfs_search(graph, start, goal).path
+                assert len(alt_search(graph, start, goal, landmark_count=4, strategy=strategy).path) == len(expected)
+
+
+def test_farthest_landmarks_cover_every_component():
+    maze = np.zeros((5, 9), dtype=np.uint8)
+    maze[:, 4] = 1
+    table = build_landmark_table(build_maze_graph(maze), count=2)
+
+    assert sorted(int(landmark) % 9 < 4 for landmark in table.landmarks) == [False, True]
+    with pytest.raises(ValueError, match="Unknown landmark strategy"):
+        build_landmark_table(build_maze_graph(maze), strategy="central")
+
+
+def test_solve_reports_alt_expansions_against_manhattan_a_star():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Recursive Backtracker", seed=11)
+    start, goal = default_start(), default_goal(maze)
+
+    assert "manhattan_visited" not in solve(maze, start, goal, "ALT / A* Landmarks").metrics
+    result = solve(maze, start, goal, "ALT / A* Landmarks", compare_manhattan=True)
+    assert len(result.path) == len(solve(maze, start, goal, "BFS").path)
+    assert result.metrics["manhattan_visited"] == solve(maze, start, goal, "A*").visited
+    assert result.visited < result.metrics["manhattan_visited"]
+    assert result.metrics["visited_ratio"] < 1
+    assert result.metrics["landmarks"] == 8
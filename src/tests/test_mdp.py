@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import solve
+from maze_solver.generation import generate_maze
+from maze_solver.graph import build_maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.mdp import policy_iteration, q_learning, value_iteration
+from maze_solver.search import dijkstra_search
+
+
+def path_cost(costs, path):
+    return sum(float(costs.flat[cell]) for cell in path[1:])
+
+
+def test_value_fields_match_dijkstra_costs():
+    rng = np.random.default_rng(15)
+    mazes = [generate_maze(31, 31, generation_algorithm="Prim's", seed=2, topology="braided")[0]]
+    mazes += [(rng.random((19, 23)) < 0.3).astype(np.uint8)]
+    for maze in mazes:
+        graph = build_maze_graph(maze)
+        for costs in (np.ones(maze.shape), rng.integers(1, 10, maze.shape), rng.random(maze.shape) + 0.1):
+            goal = int(rng.choice(graph.open_ids()))
+            fields = [
+                value_iteration(graph, goal, costs),
+                value_iteration(graph, goal, costs, gauss_seidel=True),
+                policy_iteration(graph, goal, costs),
+                q_learning(graph, goal, costs),
+            ]
+            for start in rng.choice(graph.open_ids(), size=15).tolist():
+                expected = dijkstra_search(graph, start, goal, cost_map=costs).path
+                for field in fields:
+                    assert field.converged
+                    path = field.path(graph, start)
+                    assert bool(path) == bool(expected)
+                    if expected:
+                        assert path_cost(costs, path) == pytest.approx(path_cost(costs, expected), abs=1e-4)
+                        assert field.values[start] == pytest.approx(path_cost(costs, expected), abs=1e-4)
+
+
+def test_gauss_seidel_sweeps_converge_in_fewer_iterations():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Prim's", seed=7, topology="braided")
+    graph = build_maze_graph(maze)
+    goal = graph.cell_id(default_goal(maze))
+
+    jacobi = value_iteration(graph, goal)
+    sweeps = value_iteration(graph, goal, gauss_seidel=True)
+    assert sweeps.iterations < jacobi.iterations
+    assert np.array_equal(sweeps.values, jacobi.values)
+    assert len(jacobi.residuals) == jacobi.iterations and jacobi.residual <= 1e-6
+
+    capped = value_iteration(graph, goal, max_iterations=5)
+    assert capped.iterations == 5 and not capped.converged
+    assert capped.reached_at.max() == 5
+
+
+def test_solve_reports_iterations_and_residuals_for_dynamic_programming_solvers():
+    maze, _ = generate_maze(25, 25, generation_algorithm="Recursive Backtracker", seed=4)
+    start, goal = default_start(), default_goal(maze)
+    expected = solve(maze, start, goal, "BFS")
+
+    for name in ("Value Iteration", "Fast Sweeping Method", "Policy Iteration", "Q-Learning Grid Solver"):
+        result = solve(maze, start, goal, name, record_events=True)
+        assert len(result.path) == len(expected.path)
+        assert result.metrics["converged"] == 1 and result.metrics["residual"] == 0
+        assert result.metrics["iterations"] == result.steps > 0
+        assert result.visited == len(result.events.unique_ids(0))
+
+    with pytest.raises(ValueError, match="positive cell costs"):
+        solve(maze, start, goal, "Value Iteration", cost_map=np.zeros(maze.shape))
@@ -0,0 +1,401 @@
+import numpy as np
+import pytest
+
+from maze_solver.algorithms import SOLVER_REGISTRY, solve
+from maze_solver.bidirectional import bidirectional_dijkstra_search, mm_search
+from maze_solver.cache import ByteBoundedCache
+from maze_solver.contraction import corridor_graph_search
+from maze_solver.deepening import ida_star_search, iddfs_search
+from maze_solver.generation import generate_cost_map, generate_maze
+from maze_solver.graph import DIRECTION_BITS, build_maze_graph, maze_graph
+from maze_solver.grid import default_goal, default_start
+from maze_solver.jps import JUMP_TABLE_CACHE, build_jump_tables, jps_plus_search, jump, jump_point_search
+from maze_solver.search import (
+    ENQUEUE,
+    MAX_EPOCH,
+    PATH,
+    SHORTEST_PATH_TREE_CACHE,
+    VISIT,
+    EventLog,
+    SearchWorkspace,
+    a_star_search,
+    bellman_ford_search,
+    bfs_search,
+    bidirectional_bfs_search,
+    cached_shortest_path_tree,
+    dead_end_filling_search,
+    dials_search,
+    dijkstra_search,
+    flood_fill_search,
+    greedy_best_first_search,
+    hadlock_search,
+    lee_search,
+    shortest_path_tree,
+    spfa_search,
+    wavefront_levels,
+    weighted_a_star_search,
+    zero_one_bfs_search,
+)
+
+KERNELS = {
+    "BFS": bfs_search,
+    "Lee": lee_search,
+    "Flood Fill": flood_fill_search,
+    "A*": a_star_search,
+    "Dijkstra": dijkstra_search,
+    "SPFA": spfa_search,
+    "Bellman-Ford": bellman_ford_search,
+    "Dead-End Filling": dead_end_filling_search,
+    "Hadlock": hadlock_search,
+    "Bidirectional BFS": bidirectional_bfs_search,
+    "Jump Point Search": jump_point_search,
+    "JPS+": jps_plus_search,
+    "Dial's Algorithm": dials_search,
+    "0-1 BFS": zero_one_bfs_search,
+    "Weighted A*": weighted_a_star_search,
+    "Bidirectional Dijkstra": bidirectional_dijkstra_search,
+    "MM Bidirectional Search": mm_search,
+    "Greedy Best-First": greedy_best_first_search,
+    "Corridor Graph Reduction": corridor_graph_search,
+}
+
+
+@pytest.mark.parametrize("name", sorted(KERNELS))
+def test_id_kernels_match_tuple_generators(name):
+    maze, _ = generate_maze(21, 27, generation_algorithm="Prim's", seed=44, topology="braided")
+    graph = maze_graph(maze)
+    start, goal = default_start(), default_goal(maze)
+
+    trace = EventLog(graph.cols)
+    result = KERNELS[name](graph, graph.cell_id(start), graph.cell_id(goal), trace=trace)
+    events = list(SOLVER_REGISTRY[name](maze, start, goal))
+
+    assert [cell for action, cell, _steps in events if action == "path"] == graph.cells_of(result.path)
+    assert list(trace) == [event for event in events if event[0] in {"visit", "enqueue"}]
+    assert events[-1] == ("done", None, result.steps)
+
+
+def test_id_kernels_run_without_trace_and_handle_unreachable_goals():
+    maze, _ = generate_maze(15, 15, seed=6)
+    maze[13, 12] = maze[12, 13] = 1
+    graph = maze_graph(maze)
+    start, goal = graph.cell_id(default_start()), graph.cell_id(default_goal(maze))
+
+    for kernel in KERNELS.values():
+        result = kernel(graph, start, goal)
+        assert result.path == []
+        assert result.steps > 0
+        assert kernel(graph, start, start).path == [start]
+
+
+def test_event_log_stores_columns_and_replays_tuples():
+    maze, _ = generate_maze(25, 25, generation_algorithm="Kruskal", seed=9, topology="braided")
+    graph = maze_graph(maze)
+    start, goal = default_start(), default_goal(maze)
+    events = list(SOLVER_REGISTRY["Dijkstra"](maze, start, goal))
+
+    log = EventLog(graph.cols)
+    for event in events:
+        log.append(event)
+
+    assert list(log) == events
+    assert log.actions.dtype == np.int8
+    assert log.cell_ids.dtype == np.int32
+    assert log.steps.dtype == np.int32
+    assert log.nbytes == 9 * len(events)
+    assert log.last_step == events[-1][2]
+    assert log.cells(VISIT) == {cell for action, cell, _steps in events if action == "visit"}
+    assert log.cells(ENQUEUE) == {cell for action, cell, _steps in events if action == "enqueue"}
+    assert graph.cells_of(log.ids(PATH)) == [cell for action, cell, _steps in events if action == "path"]
+
+
+def test_jump_point_searches_are_optimal_with_fewer_expansions():
+    rng = np.random.default_rng(4)
+    grids = [generate_maze(41, 41, generation_algorithm="Prim's", seed=seed, topology="braided")[0] for seed in (1, 2)]
+    grids += [(rng.random((24, 30)) < 0.25).astype(np.uint8) for _ in range(20)]
+
+    for grid in grids:
+        graph = build_maze_graph(grid)
+        open_ids = graph.open_ids()
+        for start, goal in rng.choice(open_ids, size=(6, 2)).tolist():
+            expected = bfs_search(graph, start, goal)
+            for kernel in (jump_point_search, jps_plus_search):
+                result = kernel(graph, start, goal)
+                assert len(result.path) == len(expected.path)
+                assert all(b in graph.neighbors(a) for a, b in zip(result.path, result.path[1:], strict=False))
+
+    maze = grids[0]
+    graph = maze_graph(maze)
+    start, goal = graph.cell_id(default_start()), graph.cell_id(default_goal(maze))
+    assert jump_point_search(graph, start, goal).visited < a_star_search(graph, start, goal).visited
+
+
+def test_jump_tables_match_scalar_jumps_and_are_cached():
+    rng = np.random.default_rng(11)
+    graph = build_maze_graph((rng.random((18, 23)) < 0.3).astype(np.uint8))
+    tables = build_jump_tables(graph)
+
+    assert tables.distances.dtype == np.int32
+    assert tables.distances.shape == (4, graph.size)
+    for cell_id in graph.open_ids().tolist():
+        for direction, bit in enumerate(DIRECTION_BITS):
+            if not graph.mask_bytes[cell_id] & bit:
+                assert tables.distances[direction, cell_id] == 0
+                continue
+            jump_point, distance = jump(graph, cell_id, direction, goal=-1)
+            expected = distance if jump_point >= 0 else -distance
+            assert tables.distances[direction, cell_id] == expected
+
+    maze, _ = generate_maze(21, 21, seed=13, topology="braided")
+    graph = maze_graph(maze)
+    start, goal = graph.cell_id(default_start()), graph.cell_id(default_goal(maze))
+    JUMP_TABLE_CACHE.clear()
+    first = jps_plus_search(graph, start, goal)
+    second = jps_plus_search(graph, start, goal)
+    assert first.metrics == {"jump_table_cache_hits": 0, "jump_table_cache_misses": 1}
+    assert second.metrics == {"jump_table_cache_hits": 1, "jump_table_cache_misses": 0}
+    assert (JUMP_TABLE_CACHE.hits, JUMP_TABLE_CACHE.misses) == (1, 1)
+    assert second.path == first.path
+
+
+def path_cost(costs, path):
+    return sum(int(costs.flat[cell]) for cell in path[1:])
+
+
+def test_dials_buckets_match_heap_dijkstra_on_integer_cost_maps():
+    rng = np.random.default_rng(12)
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=9, topology="braided")
+    graph = maze_graph(maze)
+    for max_cost in (1, 3, 9):
+        costs = rng.integers(0, max_cost + 1, size=maze.shape)
+        for start, goal in rng.choice(graph.open_ids(), size=(20, 2)).tolist():
+            expected = dijkstra_search(graph, start, goal, cost_map=costs)
+            result = dials_search(graph, start, goal, cost_map=costs)
+            assert path_cost(costs, result.path) == path_cost(costs, expected.path)
+            assert result.metrics["buckets"] == costs.max() + 1
+
+    with pytest.raises(ValueError, match="integer cost map"):
+        dials_search(graph, 0, 1, cost_map=np.full(maze.shape, 1.5))
+    with pytest.raises(ValueError, match="does not match maze shape"):
+        dials_search(graph, 0, 1, cost_map=np.ones((3, 3), dtype=int))
+
+
+def test_zero_one_bfs_matches_dijkstra_on_binary_cost_maps():
+    rng = np.random.default_rng(13)
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=5, topology="braided")
+    graph = maze_graph(maze)
+    for density in (0.1, 0.5, 0.9):
+        costs = (rng.random(maze.shape) > density).astype(np.uint8)
+        for start, goal in rng.choice(graph.open_ids(), size=(20, 2)).tolist():
+            expected = dijkstra_search(graph, start, goal, cost_map=costs)
+            result = zero_one_bfs_search(graph, start, goal, cost_map=costs)
+            assert path_cost(costs, result.path) == path_cost(costs, expected.path)
+
+    with pytest.raises(ValueError, match="zeros and ones"):
+        zero_one_bfs_search(graph, 0, 1, cost_map=np.full(maze.shape, 2))
+
+
+def test_wavefront_levels_reproduce_queue_bfs_order_and_parents():
+    rng = np.random.default_rng(14)
+    mazes = [generate_maze(41, 41, generation_algorithm="Prim's", seed=8, topology="braided")[0]]
+    mazes += [(rng.random((23, 29)) < 0.25).astype(np.uint8) for _ in range(3)]
+    for maze in mazes:
+        graph = maze_graph(maze)
+        for start, goal in rng.choice(graph.open_ids(), size=(10, 2)).tolist():
+            trace = EventLog(graph.cols)
+            expected = bfs_search(graph, start, goal, trace=trace)
+            queue_order = trace.ids(VISIT).tolist()
+            distances = np.full(graph.size, -1, dtype=np.int32)
+            levels = np.concatenate(list(wavefront_levels(graph, start, distances))).tolist()
+            assert levels[: len(queue_order)] == queue_order
+            assert distances[goal] == len(expected.path) - 1
+
+            trace = EventLog(graph.cols)
+            result = lee_search(graph, start, goal, trace=trace)
+            assert result.path == expected.path
+            visits = trace.steps[trace.actions == VISIT]
+            assert visits.tolist() == sorted(visits.tolist()) and visits[-1] == result.metrics["levels"]
+            path = flood_fill_search(graph, start, goal).path
+            assert len(path) == len(expected.path) and (not path or (path[0], path[-1]) == (start, goal))
+
+
+def test_bellman_ford_edge_arrays_match_dijkstra_and_allow_negative_edges():
+    rng = np.random.default_rng(16)
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=10, topology="braided")
+    graph = maze_graph(maze)
+    costs = rng.integers(1, 8, size=maze.shape)
+    potential = rng.integers(0, 5, size=graph.size)
+    for start, goal in rng.choice(graph.open_ids(), size=(15, 2)).tolist():
+        expected = dijkstra_search(graph, start, goal, cost_map=costs)
+        result = bellman_ford_search(graph, start, goal, cost_map=costs)
+        assert path_cost(costs, result.path) == path_cost(costs, expected.path)
+        assert 0 < result.metrics["rounds"] <= graph.vertex_count
+
+        reduced = bellman_ford_search(graph, start, goal, weight=lambda u, v: 1 + potential[v] - potential[u])
+        assert len(reduced.path) == len(bfs_search(graph, start, goal).path)
+
+    full, sampled = EventLog(graph.cols), EventLog(graph.cols)
+    rounds = bellman_ford_search(graph, start, goal, trace=full).steps
+    bellman_ford_search(graph, start, goal, trace=sampled, event_stride=10)
+    assert len(np.unique(sampled.steps)) == rounds // 10 + (rounds % 10 > 0)
+    assert len(sampled) < len(full)
+
+    with pytest.raises(ValueError, match="negative-weight cycle"):
+        bellman_ford_search(graph, start, goal, weight=lambda u, v: -1.0)
+
+
+def test_dead_end_filling_modes_fill_the_same_cells_and_route_through_the_rest():
+    rng = np.random.default_rng(17)
+    for topology in ("perfect", "braided"):
+        maze, _ = generate_maze(41, 45, generation_algorithm="Prim's", seed=12, topology=topology)
+        graph = maze_graph(maze)
+        for start, goal in rng.choice(graph.open_ids(), size=(8, 2)).tolist():
+            worklist, rounds = EventLog(graph.cols), EventLog(graph.cols)
+            result = dead_end_filling_search(graph, start, goal, trace=worklist)
+            batched = dead_end_filling_search(graph, start, goal, trace=rounds, vectorized=True)
+            filled = worklist.unique_ids(VISIT)
+            assert np.array_equal(filled, rounds.unique_ids(VISIT))
+            assert result.metrics["filled"] == batched.metrics["filled"] == filled.size
+            assert batched.steps < result.steps
+
+            reduced = maze.copy()
+            reduced.flat[filled] = 1
+            expected = bfs_search(maze_graph(reduced), start, goal).path
+            assert result.path == batched.path == expected
+            if topology == "perfect":
+                assert filled.size + len(expected) == graph.vertex_count
+
+
+def test_iterative_deepening_is_optimal_with_and_without_a_transposition_table():
+    rng = np.random.default_rng(18)
+    mazes = [generate_maze(15, 15, generation_algorithm="Prim's", seed=seed, topology="braided")[0] for seed in (1, 2)]
+    mazes += [(rng.random((9, 11)) < 0.2).astype(np.uint8) for _ in range(3)]
+    for maze in mazes:
+        graph = maze_graph(maze)
+        for start, goal in rng.choice(graph.open_ids(), size=(8, 2)).tolist():
+            expected = len(bfs_search(graph, start, goal).path)
+            for kernel in (ida_star_search, iddfs_search):
+                plain = kernel(graph, start, goal)
+                cached = kernel(graph, start, goal, transposition_size=64)
+                assert len(plain.path) == len(cached.path) == expected
+                assert cached.visited <= plain.visited and cached.metrics["transposition_entries"] <= 64
+                assert plain.metrics["transposition_entries"] == 0
+
+
+def test_ida_star_keeps_a_single_path_stack_on_deep_perfect_mazes():
+    maze, _ = generate_maze(41, 41, generation_algorithm="Recursive Backtracker", seed=5)
+    graph = maze_graph(maze)
+    start, goal = graph.cell_id(default_start()), graph.cell_id(default_goal(maze))
+
+    result = ida_star_search(graph, start, goal)
+    assert len(result.path) == len(bfs_search(graph, start, goal).path)
+    assert result.peak_frontier == len(result.path) - 1
+    cached = ida_star_search(graph, start, goal, transposition_size=graph.size)
+    assert cached.path == result.path and cached.metrics["transposition_prunes"] > 0
+    assert cached.visited < result.visited
+    with pytest.raises(ValueError, match="transposition_size"):
+        ida_star_search(graph, start, goal, transposition_size=-1)
+
+
+def test_weighted_a_star_reads_cost_maps_and_stays_within_its_bound():
+    maze, _ = generate_maze(61, 61, generation_algorithm="Prim's", seed=19, topology="braided")
+    graph = maze_graph(maze)
+    rng = np.random.default_rng(19)
+    for terrain in ("mud", "water"):
+        cost_map = generate_cost_map(maze.shape, terrain, seed=3)
+        costs = cost_map.costs.reshape(-1).astype(float)
+        for start, goal in rng.choice(graph.open_ids(), size=(10, 2)).tolist():
+            optimum = dijkstra_search(graph, start, goal, cost_map=cost_map).path
+            cost = costs[optimum[1:]].sum()
+            assert costs[spfa_search(graph, start, goal, cost_map=cost_map).path[1:]].sum() == cost
+            exact = weighted_a_star_search(graph, start, goal, cost_map=cost_map, weight_multiplier=1)
+            assert (
+                costs[exact.path[1:]].sum() == cost and exact.metrics["heuristic_scale"] == costs[graph.passable].min()
+            )
+            bounded = weighted_a_star_search(graph, start, goal, cost_map=cost_map, weight_multiplier=2)
+            assert cost <= costs[bounded.path[1:]].sum() <= 2 * cost
+
+    with pytest.raises(ValueError, match="at least 1"):
+        weighted_a_star_search(graph, 0, 1, weight_multiplier=0.5)
+
+
+def test_shortest_path_trees_are_cached_per_source_and_cost_map():
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=23, topology="braided")
+    graph = maze_graph(maze)
+    start, goal = default_start(), default_goal(maze)
+    cost_map = generate_cost_map(maze.shape, "water", seed=23)
+    SHORTEST_PATH_TREE_CACHE.clear()
+
+    for options in ({}, {"cost_map": cost_map}):
+        tree = shortest_path_tree(graph, graph.cell_id(start), **options)
+        assert tree.parent.dtype == tree.distance.dtype == np.int32 and tree.nbytes == 8 * graph.size
+        costs = cost_map.costs.reshape(-1).astype(float) if options else np.ones(graph.size)
+        for goal_id in graph.open_ids().tolist():
+            expected = dijkstra_search(graph, tree.source, goal_id, **options).path
+            assert tree.cost_to(goal_id) == costs[expected[1:]].sum() == costs[tree.path_to(goal_id)[1:]].sum()
+        first = solve(maze, start, goal, "Dijkstra", reuse_trees=True, **options)
+        again = solve(maze, start, goal, "BFS" if not options else "UCS", reuse_trees=True, **options)
+        assert first.metrics["tree_cache_misses"] == again.metrics["tree_cache_hits"] == 1
+        assert again.visited == 0 and again.path == first.path
+        assert len(first.path) == len(solve(maze, start, goal, "Dijkstra", **options).path)
+    assert len(SHORTEST_PATH_TREE_CACHE) == 2
+    assert cached_shortest_path_tree(graph, graph.cell_id(start), cost_map.costs.copy())[1]
+
+    small = ByteBoundedCache(max_bytes=3 * tree.nbytes)
+    for source in graph.open_ids()[:5].tolist():
+        small.get(source, lambda source=source: shortest_path_tree(graph, source))
+    assert len(small) == 3 and small.nbytes == 3 * tree.nbytes
+    assert small.get(int(graph.open_ids()[4]), lambda: None)[1]
+    assert not small.get(int(graph.open_ids()[0]), lambda: shortest_path_tree(graph, 0))[1]
+
+
+def test_reuse_trees_accepts_and_rejects_the_same_inputs_as_a_direct_solve():
+    maze, _ = generate_maze(31, 31, generation_algorithm="Prim's", seed=25, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+    mud = generate_cost_map(maze.shape, "mud", seed=25)
+    binary = np.random.default_rng(25).integers(0, 2, size=maze.shape)
+
+    for algorithm, cost_map, error in (("BFS", mud, TypeError), ("0-1 BFS", mud, ValueError)):
+        with pytest.raises(error):
+            solve(maze, start, goal, algorithm, cost_map=cost_map)
+        with pytest.raises(error):
+            solve(maze, start, goal, algorithm, cost_map=cost_map, reuse_trees=True)
+
+    for algorithm, costs in (("BFS", None), ("0-1 BFS", binary)):
+        options = {} if costs is None else {"cost_map": costs}
+        cached = solve(maze, start, goal, algorithm, reuse_trees=True, **options)
+        direct = solve(maze, start, goal, algorithm, **options)
+        assert "tree_cache_hits" in cached.metrics and cached.path[0] == start and cached.path[-1] == goal
+        weights = np.ones(maze.shape) if costs is None else costs
+        assert sum(weights[cell] for cell in cached.path[1:]) == sum(weights[cell] for cell in direct.path[1:])
+
+
+def test_a_reused_workspace_answers_every_query_like_fresh_buffers():
+    maze, _ = generate_maze(41, 41, generation_algorithm="Prim's", seed=24, topology="braided")
+    maze[9, :] = 1
+    graph = build_maze_graph(maze)
+    cost_map = generate_cost_map(maze.shape, "mud", seed=24)
+    pairs = np.random.default_rng(24).choice(graph.open_ids(), size=(40, 2)).tolist()
+    workspace = SearchWorkspace(graph.shape)
+    workspace.epoch = MAX_EPOCH - 30
+
+    for kernel, options in (
+        (bfs_search, {}),
+        (a_star_search, {}),
+        (dijkstra_search, {"cost_map": cost_map}),
+        (weighted_a_star_search, {"cost_map": cost_map}),
+    ):
+        for start, goal in pairs:
+            fresh = kernel(graph, start, goal, **options)
+            reused = kernel(graph, start, goal, workspace=workspace, **options)
+            assert reused.path == fresh.path and reused.visited == fresh.visited
+    assert workspace.queries == 4 * len(pairs) and workspace.epoch < MAX_EPOCH - 30
+    assert workspace.nbytes == 14 * graph.size
+
+    blocked = bytearray(graph.size)
+    blocked[graph.cell_id((1, 2))] = 1
+    start, goal = graph.cell_id((1, 1)), graph.cell_id((1, 2))
+    assert bfs_search(graph, start, goal, blocked=blocked, workspace=workspace).path == []
+    assert bfs_search(graph, start, goal, workspace=workspace).path == [start, goal]
+    with pytest.raises(ValueError, match="cannot search"):
+        bfs_search(build_maze_graph(maze[:-2]), 0, 1, workspace=workspace)
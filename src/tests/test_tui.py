@@ -4,6 +4,10 @@ import sys
 import numpy as np
 
 from maze_solver import tui
+from maze_solver.algorithms import SOLVER_REGISTRY, solve
+from maze_solver.generation import generate_maze
+from maze_solver.grid import default_goal, default_start
+from maze_solver.stats import run_statistics, trace_statistics
 from maze_solver.tui import render_maze
 
 
@@ -29,6 +33,19 @@ def test_render_maze_supports_plain_and_color_output():
     assert "S*G" in plain
 
 
+def test_trace_statistics_match_tuple_run_statistics():
+    maze, _ = generate_maze(21, 21, generation_algorithm="Prim's", seed=17, topology="braided")
+    start, goal = default_start(), default_goal(maze)
+
+    for name in ("A*", "DFS"):
+        events = list(SOLVER_REGISTRY[name](maze, start, goal))
+        path = [cell for action, cell, _steps in events if action == "path"]
+        visited = {cell for action, cell, _steps in events if action == "visit"}
+        frontier = {cell for action, cell, _steps in events if action == "enqueue"}
+        expected = run_statistics(maze, path, visited, frontier, events[-1][2], len(events))
+        assert trace_statistics(maze, solve(maze, start, goal, name, record_events=True).events) == expected
+
+
 def test_tui_main_prints_metadata_legend_and_stats(capsys):
     tui.main(
         [
@@ -57,6 +74,14 @@ def test_tui_main_prints_metadata_legend_and_stats(capsys):
     assert "\033[" not in output
 
 
+def test_tui_main_prints_solver_metrics(capsys):
+    tui.main(["--rows", "11", "--cols", "21", "--seed", "5", "--algorithm", "JPS+", "--color", "never"])
+
+    output = capsys.readouterr().out
+    assert "metrics=jump_table_cache_hits=" in output
+    assert "jump_table_cache_misses=" in output
+
+
 def test_tui_catalog_filters_and_flags(capsys):
     tui.main(["--catalog", "--catalog-search", "dijkstra", "--catalog-weighted", "yes", "--catalog-sort", "name"])
 